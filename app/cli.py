@@ -1,12 +1,15 @@
 """Flask CLI commands for the gazetteer/geolocation groundwork -- see
-docs/entity-geolocation.md. Registered onto the app in create_app().
+docs/entity-geolocation.md -- for on-demand calendar source maintenance,
+and for rebuilding derived tables. Registered onto the app in create_app().
 """
+import datetime
 import os
 
 import click
 
-from .models import Entity, GazetteerPlace, User, db
+from .models import Entity, GazetteerPlace, User, VisibleEvent, db
 from .services import geocoding_service
+from .services.calendar_aggregator import LocalHijriCalendar
 from .utils.logging_setup import get_logger
 
 logger = get_logger('cli')
@@ -125,6 +128,39 @@ def geocode_backfill_command():
     click.echo(f'Geocoded {geocoded} rows ({unmatched} location strings did not match the gazetteer).')
 
 
+@click.command('hijri-refresh-overrides')
+@click.option('--year', 'years', type=int, multiple=True,
+              help='Gregorian year to refresh (repeatable). Defaults to this year and next.')
+def hijri_refresh_overrides_command(years):
+    """Refresh the Hijri moon-sighting override table from api.aladhan.com --
+    the only network access the local Hijri engine ever makes."""
+    if not years:
+        this_year = datetime.date.today().year
+        years = (this_year, this_year + 1)
+    try:
+        changes = LocalHijriCalendar().refresh_overrides(years)
+    except Exception as e:
+        logger.error(f'Error refreshing Hijri overrides for {list(years)}: {e}')
+        click.echo(f'Could not refresh Hijri overrides: {e}')
+        return
+    for hijri_year, month, old, new in changes:
+        click.echo(f'{hijri_year}-{month:02d}: {old or "tabular"} -> {new or "tabular"}')
+    click.echo(f'Updated {len(changes)} Hijri month overrides for {", ".join(map(str, years))}.')
+
+
+@click.command('visible-events-rebuild')
+def visible_events_rebuild_command():
+    """Regenerate the VisibleEvent projection from EventCache and entity
+    sharing -- only needed if rows were written around the model layer.
+    Committing it moves every rebuilt viewer's calendar generation, so a
+    running server drops its cached responses on the next request."""
+    VisibleEvent.note_changed(db.session, VisibleEvent.rebuild(db.session.connection()))
+    db.session.commit()
+    click.echo(f'Rebuilt {VisibleEvent.query.count()} visible event rows.')
+
+
 def register_cli(app):
     app.cli.add_command(gazetteer_load_command)
     app.cli.add_command(geocode_backfill_command)
+    app.cli.add_command(hijri_refresh_overrides_command)
+    app.cli.add_command(visible_events_rebuild_command)
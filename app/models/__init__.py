@@ -3,15 +3,20 @@ from .gazetteer_place import GazetteerPlace
 from .user import User
 from .schedule import ScheduleRecord
 from .activity import Activity
+from .entity_share import EntityShare
 from .entity import Entity
 from .entity_comment import EntityComment
 from .event_cache import EventCache
+from .visible_event import VisibleEvent
 from .user_calendar_descriptor import UserCalendarDescriptor
 from .default_event_descriptor import DefaultEventDescriptor
+from .calendar_materialization import CalendarMaterialization
+from .source_refresh import SourceRefresh
+from .calendar_generation import CalendarGeneration
 from .suggestion_queue_item import SuggestionQueueItem
 from .mustermeister_task_cache import MustermeisterTaskCache
 from .briefkorb_message_cache import BriefKorbMessageCache
 
-__all__ = ['db', 'GazetteerPlace', 'User', 'ScheduleRecord', 'Activity', 'Entity', 'EntityComment',
-           'EventCache', 'UserCalendarDescriptor', 'DefaultEventDescriptor', 'SuggestionQueueItem',
-           'MustermeisterTaskCache', 'BriefKorbMessageCache']
\ No newline at end of file
+__all__ = ['db', 'GazetteerPlace', 'User', 'ScheduleRecord', 'Activity', 'Entity', 'EntityShare', 'EntityComment',
+           'EventCache', 'VisibleEvent', 'UserCalendarDescriptor', 'DefaultEventDescriptor', 'CalendarMaterialization',
+           'SourceRefresh', 'CalendarGeneration', 'SuggestionQueueItem', 'MustermeisterTaskCache', 'BriefKorbMessageCache']
\ No newline at end of file
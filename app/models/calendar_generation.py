@@ -0,0 +1,14 @@
+from .mixins import db
+
+
+class CalendarGeneration(db.Model):
+    """The current generation of one viewer's calendar -- a fresh token on
+    every committed change to their VisibleEvent rows (see
+    calendar_generations). Viewer 0 is the global rows.
+
+    Kept in the database rather than in memory so a write committed by any
+    process -- the web server, a worker, `flask visible-events rebuild` --
+    invalidates the calendar caches of every other one.
+    """
+    viewer_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    generation = db.Column(db.String(32), nullable=False)
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from datetime import datetime
+from .mixins import db
+
+# Part of every fingerprint. Bump it when the way entries expand into
+# EventCache rows changes, so the next update_event_cache run regenerates
+# everything once instead of trusting fingerprints taken under the old rules.
+FINGERPRINT_VERSION = 1
+
+
+class CalendarMaterialization(db.Model):
+    """What a per-user or per-entity calendar source's EventCache rows were
+    last generated from: a fingerprint of its input (a descriptor's YAML, an
+    entity's calendar_entries, a user's subscribed Default Events) and the
+    years generated. update_event_cache regenerates a source only when
+    either has moved on since; otherwise its rows are already what a
+    regeneration would write.
+
+    One row per (source, owner_id) -- `source` is the EventCache source the
+    rows carry, `owner_id` the user or entity they belong to. Written only
+    after a successful regeneration, so a failed one is retried next run.
+    """
+    source = db.Column(db.String(100), primary_key=True)
+    owner_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    first_year = db.Column(db.Integer, nullable=False)
+    last_year = db.Column(db.Integer, nullable=False)
+    materialized_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @staticmethod
+    def fingerprint_of(*parts):
+        """SHA-256 hex digest of JSON-serializable `parts`."""
+        payload = json.dumps([FINGERPRINT_VERSION, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def is_current(cls, source, owner_id, fingerprint, years):
+        """Whether `owner_id`'s `source` rows were generated from
+        `fingerprint` for exactly `years`."""
+        row = db.session.get(cls, (source, owner_id))
+        return (row is not None and row.fingerprint == fingerprint
+                and (row.first_year, row.last_year) == (min(years), max(years)))
+
+    @classmethod
+    def record(cls, source, owner_id, fingerprint, years):
+        """Note a successful regeneration. The caller commits."""
+        db.session.merge(cls(source=source, owner_id=owner_id, fingerprint=fingerprint,
+                             first_year=min(years), last_year=max(years)))
+
+    @classmethod
+    def forget(cls, source, owner_id):
+        """Drop the record once `owner_id`'s rows are gone, so nothing
+        vouches for rows that no longer exist. The caller commits."""
+        cls.query.filter_by(source=source, owner_id=owner_id).delete()
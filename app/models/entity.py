@@ -1,5 +1,7 @@
 from .mixins import db, JSONFieldMixin
+from .entity_share import EntityShare
 from datetime import datetime
+from sqlalchemy.orm import validates
 
 class Entity(db.Model, JSONFieldMixin):
     id = db.Column(db.Integer, primary_key=True)
@@ -27,12 +29,30 @@ class Entity(db.Model, JSONFieldMixin):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id', name='fk_entity_user'), nullable=False)
     is_public = db.Column(db.Boolean, default=True)  # Whether the entity is shared with other users
     shared_with = db.Column(db.JSON)  # List of user IDs this entity is shared with
+    # Indexed mirror of shared_with (see EntityShare), rebuilt whenever
+    # shared_with is assigned -- including via the constructor/import.
+    shares = db.relationship('EntityShare', cascade='all, delete-orphan', lazy='select')
     calendar_entries = db.Column(db.JSON)  # List of dated entries (closures, special hours, events) -- see entity_calendar_service.py
 
     __table_args__ = (
         db.UniqueConstraint('name', 'category', 'location', 'user_id', name='uq_entity_name_category_location_user'),
+        db.Index('ix_entity_user_id', 'user_id'),
     )
 
+    @validates('shared_with')
+    def _sync_shares(self, key, user_ids):
+        wanted = list(dict.fromkeys(user_ids or []))
+        kept = {share.user_id: share for share in self.shares if share.user_id in wanted}
+        self.shares = [kept.get(user_id) or EntityShare(user_id=user_id) for user_id in wanted]
+        return user_ids
+
+    @staticmethod
+    def shared_with_user(user_id):
+        """Filter condition: the entity is shared with `user_id`. Looks the
+        user up in entity_share's (user_id, entity_id) index rather than
+        scanning every entity's shared_with JSON."""
+        return Entity.id.in_(db.select(EntityShare.entity_id).where(EntityShare.user_id == user_id))
+
     def get_property(self, key, default=None):
         """Safely get a property value"""
         return self.get_json_value('properties', key, default)
@@ -105,17 +125,17 @@ class Entity(db.Model, JSONFieldMixin):
 
     def share_with(self, user_id):
         """Share this entity with another user"""
-        if not self.shared_with:
-            self.shared_with = []
-        if user_id not in self.shared_with:
-            self.shared_with.append(user_id)
+        if user_id not in (self.shared_with or []):
+            # Reassigned rather than appended to in place, so the change is
+            # both persisted and mirrored into entity_share.
+            self.shared_with = (self.shared_with or []) + [user_id]
             return True
         return False
 
     def unshare_with(self, user_id):
         """Remove sharing with a user"""
         if self.shared_with and user_id in self.shared_with:
-            self.shared_with.remove(user_id)
+            self.shared_with = [shared_id for shared_id in self.shared_with if shared_id != user_id]
             return True
         return False
 
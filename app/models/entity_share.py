@@ -0,0 +1,13 @@
+from .mixins import db
+
+class EntityShare(db.Model):
+    """One row per (entity, user) the entity is shared with -- the indexed
+    mirror of Entity.shared_with that visibility queries join against (see
+    Entity.shared_with_user), since a JSON list can't be indexed. Kept in
+    step with shared_with by Entity itself; never written directly."""
+    entity_id = db.Column(db.Integer, db.ForeignKey('entity.id', name='fk_entity_share_entity'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', name='fk_entity_share_user'), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_entity_share_user_entity', 'user_id', 'entity_id'),
+    )
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import datetime
 from .mixins import db
 
@@ -19,17 +21,52 @@ class EventCache(db.Model):
     # entity_calendar_service.py). Deliberately independent of user_id above --
     # visibility for these rows is governed by the entity's own sharing rules
     # (Entity.can_view-style), not by "which user does this row belong to."
-    
+    details = db.deferred(db.Column(db.JSON))
+    # Structured metadata from the source (see calendar_aggregator's
+    # _event_details), as a list of dicts. Deferred: listings never show
+    # it, so it's only read when a caller asks for it (fields=details).
+    content_hash = db.Column(db.String(64))
+    # Hash of the row's content columns (compute_content_hash), compared by
+    # event_cache_sync.sync_event_cache to leave unchanged rows untouched on
+    # refresh. NULL on rows written before it existed -- those just count
+    # as changed once.
+
+    __table_args__ = (
+        # get_calendar_events: global rows (user_id/entity_id both NULL) and
+        # a user's own rows by date range; also update_event_cache's
+        # per-year sync of the global rows.
+        db.Index('ix_event_cache_user_entity_date', 'user_id', 'entity_id', 'date'),
+        # get_calendar_events' visible-entity rows by date range, and the
+        # per-entity calendar sync.
+        db.Index('ix_event_cache_entity_date', 'entity_id', 'date'),
+        # Per-source work: the computed-calendar backfill's DISTINCT year
+        # and per-year sync, the custom/Default Event per-year syncs.
+        db.Index('ix_event_cache_source_year', 'source', 'year'),
+    )
+
+    # Columns that make up a row's content, as opposed to its scope
+    # (year/user_id/entity_id), which the refresh already filters on.
+    CONTENT_COLUMNS = ('title', 'date', 'description', 'location', 'source', 'details')
+
+    @staticmethod
+    def compute_content_hash(row):
+        """Content hash for an EventCache column mapping."""
+        values = [row.get(column) for column in EventCache.CONTENT_COLUMNS]
+        payload = json.dumps(values, default=lambda value: value.isoformat(), ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     @staticmethod
     def from_event_dict(event_dict):
         """Create an EventCache instance from an event dictionary"""
+        date = datetime.strptime(event_dict['start_time'], '%Y-%m-%d %H:%M')
         return EventCache(
             title=event_dict['title'],
-            date=datetime.strptime(event_dict['start_time'], '%Y-%m-%d %H:%M'),
+            date=date,
             description=event_dict.get('description'),
             location=event_dict.get('location'),
             source=event_dict['sources'][0] if event_dict.get('sources') else None,
-            year=datetime.strptime(event_dict['start_time'], '%Y-%m-%d %H:%M').year
+            year=date.year,
+            details=event_dict.get('details')
         )
     
     def to_dict(self):
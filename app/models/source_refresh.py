@@ -0,0 +1,18 @@
+from .mixins import db
+
+
+class SourceRefresh(db.Model):
+    """The last refresh of one live calendar source's global EventCache
+    rows for one year: a fingerprint of what the fetch returned, when it
+    ran, and how long update_event_cache waits before fetching that source
+    and year again (see refresh_cadence).
+
+    One row per (source, year) -- `source` is the EventCache source the rows
+    carry. Written only after the rows were synced, so a failed fetch is
+    retried on the next run.
+    """
+    source = db.Column(db.String(100), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    interval_hours = db.Column(db.Float, nullable=False)
+    refreshed_at = db.Column(db.DateTime, nullable=False)
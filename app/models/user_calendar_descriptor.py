@@ -11,5 +11,10 @@ class UserCalendarDescriptor(db.Model):
                          nullable=False, unique=True)
     raw_yaml = db.Column(db.Text, nullable=False)
     last_parse_error = db.Column(db.Text)  # set on the most recent failed parse, else NULL
+    # parse_descriptor's result for raw_yaml, kept so the background refresh
+    # doesn't parse it again; only trusted while parsed_hash matches
+    # (see custom_calendar_service.descriptor_entries).
+    parsed_entries = db.Column(db.JSON)
+    parsed_hash = db.Column(db.String(64))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
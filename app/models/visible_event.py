@@ -0,0 +1,160 @@
+from sqlalchemy import delete, event, insert, inspect, literal, select, union
+from sqlalchemy.orm import object_session
+
+from .mixins import db
+from .entity import Entity
+from .entity_share import EntityShare
+from .event_cache import EventCache
+
+# viewer_id for global rows (public holidays etc.), which every user sees.
+# Stored once under this id rather than once per user; no user row has id 0.
+GLOBAL_VIEWER_ID = 0
+
+# Session.info key collecting the viewer ids whose rows a session changed,
+# for whatever needs to know once it commits (see calendar_generations).
+CHANGED_VIEWERS_KEY = 'visible_event_changed_viewers'
+
+
+class VisibleEvent(db.Model):
+    """Read model of EventCache: one row per (viewer, event) the viewer may
+    see, carrying the columns the calendar API returns, so that
+    get_calendar_events is a range scan on (viewer_id, date) instead of
+    re-deriving visibility (global rows, the user's own rows, rows of
+    entities they own or that are shared with them) from three tables on
+    every request.
+
+    Derived data only, kept in step by the EventCache/EntityShare mapper
+    events below for ORM writes, and explicitly by the bulk writers
+    (sync_event_cache, the delete_event_cache_for_* helpers). Never written
+    directly; `flask visible-events-rebuild` regenerates it from scratch.
+
+    The maintenance methods return the set of viewer ids whose rows they
+    changed; writers pass that on to note_changed."""
+    viewer_id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, primary_key=True)
+    # event_id is EventCache.id, and viewer_id a User.id or GLOBAL_VIEWER_ID
+    # -- neither a foreign key, same as SuggestionQueueItem.source_id, since
+    # rows are dropped alongside the EventCache row rather than before it.
+    entity_id = db.Column(db.Integer)  # copied from EventCache, to drop rows when an entity's sharing changes
+    date = db.Column(db.DateTime, nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    location = db.Column(db.String(200))
+    source = db.Column(db.String(100))
+
+    __table_args__ = (
+        # get_calendar_events' range scan, in the (date, event_id) order its
+        # keyset pagination walks.
+        db.Index('ix_visible_event_viewer_date', 'viewer_id', 'date', 'event_id'),
+        db.Index('ix_visible_event_event_id', 'event_id'),
+        db.Index('ix_visible_event_entity_id', 'entity_id'),
+    )
+
+    def to_dict(self):
+        """Same shape as EventCache.to_dict, with the EventCache id."""
+        return {
+            'id': self.event_id,
+            'title': self.title,
+            'start_time': self.date.strftime('%Y-%m-%d %H:%M'),
+            'description': self.description,
+            'location': self.location,
+            'sources': [self.source] if self.source else []
+        }
+
+    @staticmethod
+    def _criteria(event_ids):
+        # `event_ids` is a list of EventCache ids or a select of them; None
+        # for every row.
+        return [] if event_ids is None else [EventCache.__table__.c.id.in_(event_ids)]
+
+    @staticmethod
+    def _viewer_pairs(event_ids):
+        """(viewer_id, event_id) for every viewer of the given EventCache
+        rows."""
+        events = EventCache.__table__
+        criteria = VisibleEvent._criteria(event_ids)
+        return union(
+            select(literal(GLOBAL_VIEWER_ID).label('viewer_id'), events.c.id.label('event_id'))
+            .where(events.c.user_id.is_(None), events.c.entity_id.is_(None), *criteria),
+            select(events.c.user_id, events.c.id)
+            .where(events.c.user_id.isnot(None), *criteria),
+            select(Entity.__table__.c.user_id, events.c.id)
+            .join(Entity.__table__, Entity.__table__.c.id == events.c.entity_id)
+            .where(Entity.__table__.c.user_id.isnot(None), *criteria),
+            select(EntityShare.__table__.c.user_id, events.c.id)
+            .join(EntityShare.__table__, EntityShare.__table__.c.entity_id == events.c.entity_id)
+            .where(*criteria),
+        ).subquery()
+
+    @staticmethod
+    def project(connection, event_ids=None):
+        """Add the rows for the given EventCache rows (None for all), which
+        must not be projected yet."""
+        events = EventCache.__table__
+        pairs = VisibleEvent._viewer_pairs(event_ids)
+        rows = select(
+            pairs.c.viewer_id, events.c.id, events.c.entity_id, events.c.date,
+            events.c.title, events.c.description, events.c.location, events.c.source,
+        ).join(events, events.c.id == pairs.c.event_id).where(*VisibleEvent._criteria(event_ids))
+        return set(connection.execute(insert(VisibleEvent).from_select(
+            ['viewer_id', 'event_id', 'entity_id', 'date', 'title', 'description', 'location', 'source'], rows
+        ).returning(VisibleEvent.viewer_id)).scalars())
+
+    @staticmethod
+    def unproject(connection, event_ids):
+        return VisibleEvent.delete_where(connection, VisibleEvent.event_id.in_(event_ids))
+
+    @staticmethod
+    def delete_where(connection, *criteria):
+        return set(connection.execute(
+            delete(VisibleEvent).where(*criteria).returning(VisibleEvent.viewer_id)
+        ).scalars())
+
+    @staticmethod
+    def reproject(connection, event_ids):
+        """Re-derive the rows of EventCache rows whose content changed."""
+        return VisibleEvent.unproject(connection, event_ids) | VisibleEvent.project(connection, event_ids)
+
+    @staticmethod
+    def reproject_entity(connection, entity_id):
+        """Re-derive the rows of an entity's events, after its owner or
+        sharing changed."""
+        return (VisibleEvent.delete_where(connection, VisibleEvent.entity_id == entity_id)
+                | VisibleEvent.project(connection, select(EventCache.id).where(EventCache.entity_id == entity_id)))
+
+    @staticmethod
+    def rebuild(connection):
+        return VisibleEvent.delete_where(connection) | VisibleEvent.project(connection)
+
+    @staticmethod
+    def note_changed(session, viewer_ids):
+        session.info.setdefault(CHANGED_VIEWERS_KEY, set()).update(viewer_ids)
+
+
+@event.listens_for(EventCache, 'after_insert')
+def _project_inserted_event(mapper, connection, target):
+    VisibleEvent.note_changed(object_session(target), VisibleEvent.project(connection, [target.id]))
+
+
+@event.listens_for(EventCache, 'after_update')
+def _reproject_updated_event(mapper, connection, target):
+    VisibleEvent.note_changed(object_session(target), VisibleEvent.reproject(connection, [target.id]))
+
+
+@event.listens_for(EventCache, 'after_delete')
+def _unproject_deleted_event(mapper, connection, target):
+    VisibleEvent.note_changed(object_session(target), VisibleEvent.unproject(connection, [target.id]))
+
+
+@event.listens_for(EntityShare, 'after_insert')
+@event.listens_for(EntityShare, 'after_delete')
+def _reproject_shared_entity(mapper, connection, target):
+    VisibleEvent.note_changed(object_session(target), VisibleEvent.reproject_entity(connection, target.entity_id))
+
+
+@event.listens_for(Entity, 'after_update')
+def _reproject_reowned_entity(mapper, connection, target):
+    # Sharing changes arrive through EntityShare above; a new owner only
+    # through the entity's own user_id.
+    if inspect(target).attrs.user_id.history.has_changes():
+        VisibleEvent.note_changed(object_session(target), VisibleEvent.reproject_entity(connection, target.id))
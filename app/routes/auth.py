@@ -88,7 +88,7 @@ def profile():
     owned_places = Entity.query.filter_by(user_id=current_user.id).count()
     shared_places = Entity.query.filter(
         Entity.user_id != current_user.id,
-        Entity.shared_with.contains([current_user.id])
+        Entity.shared_with_user(current_user.id)
     ).count()
     public_places = Entity.query.filter(
         Entity.user_id != current_user.id,
@@ -634,7 +634,7 @@ def list_places():
         db.or_(
             Entity.user_id == current_user.id,
             Entity.is_public == True,
-            Entity.shared_with.contains([current_user.id])
+            Entity.shared_with_user(current_user.id)
         )
     ).order_by(
         Entity.visited.asc(),  # First sort by visited (True first)
@@ -826,7 +826,7 @@ def get_open_entities(current_time, current_day, current_hour, debug=False):
         db.or_(
             Entity.user_id == current_user.id,
             Entity.is_public == True,
-            Entity.shared_with.contains([current_user.id])
+            Entity.shared_with_user(current_user.id)
         )
     ).all()
 
@@ -1,7 +1,9 @@
-from flask import Blueprint, render_template, jsonify, redirect, url_for, request
+from flask import Blueprint, current_app, render_template, jsonify, redirect, url_for, request, stream_with_context
 from flask_login import current_user, login_required
-from ..services.integration_service import integration_service
+from ..services import calendar_response_cache
+from ..services.integration_service import SELECTABLE_EVENT_FIELDS, integration_service
 from ..models import Activity, ScheduleRecord, Entity
+from ..utils.translations import _
 from datetime import datetime, timedelta
 
 main_bp = Blueprint('main', __name__)
@@ -28,10 +30,47 @@ def get_stats():
         'places_count': Entity.query.filter_by(user_id=current_user.id).count()
     })
 
+def _event_cursor(event):
+    """Keyset cursor for resuming after `event`: its start_time and id, so a
+    client can also build one from the last event it received."""
+    return f"{event['start_time']},{event['id']}"
+
+
+def _parse_event_cursor(cursor):
+    start_time, _sep, event_id = cursor.rpartition(',')
+    return datetime.strptime(start_time, '%Y-%m-%d %H:%M'), int(event_id)
+
+
 @main_bp.route('/api/calendar/events')
 @login_required
 def get_calendar_events():
-    """Get calendar events for a specified date range"""
+    """Get calendar events for a specified date range.
+
+    Returns a JSON array in (date, id) order. With `limit`, returns at most
+    that many, plus an X-Next-Cursor header while more remain; pass it back
+    as `cursor` for the next page. With `format=ndjson`, streams one event
+    per line as they are read instead of building the array first. With
+    `fields` (comma-separated), each event has only those keys -- e.g.
+    `fields=id,title,start_time,sources` for a grid, or `details` added for
+    the source's structured metadata, which is left out by default.
+    """
+    try:
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        after = _parse_event_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({'error': _('Invalid cursor.')}), 400
+    if limit is not None and limit < 1:
+        return jsonify({'error': _('Limit must be a positive number.')}), 400
+    fields = request.args.get('fields')
+    if fields:
+        fields = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+        if not fields or not set(fields) <= set(SELECTABLE_EVENT_FIELDS):
+            return jsonify({'error': _('Unknown event field.')}), 400
+    else:
+        fields = None
+    stream = request.args.get('format') == 'ndjson'
+
     try:
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
@@ -40,9 +79,65 @@ def get_calendar_events():
             start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
         if end_date:
             end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-            
-        events = integration_service.get_calendar_events(start_date, end_date)
-        return jsonify(events)
+
+        date_range = calendar_response_cache.normalize_range(start_date, end_date)
+        user = current_user._get_current_object()
+
+        if stream and limit is None and after is None:
+            # The year tab's stream. A repeat is answered from memory like
+            # the JSON tabs below; a first read is streamed as usual and
+            # cached once it has been sent in full.
+            body = calendar_response_cache.get(user.id, date_range, fields, fmt='ndjson')
+            if body is not None:
+                return current_app.response_class(body, mimetype='application/x-ndjson')
+            built_at = calendar_response_cache.generations(user.id)
+            events = integration_service.iter_calendar_events(*date_range, user=user, fields=fields)
+
+            def cached_lines():
+                lines = []
+                for event in events:
+                    line = current_app.json.dumps(event) + '\n'
+                    lines.append(line)
+                    yield line
+                calendar_response_cache.put(user.id, date_range, built_at, ''.join(lines), fields, fmt='ndjson')
+
+            return current_app.response_class(stream_with_context(cached_lines()), mimetype='application/x-ndjson')
+
+        if stream:
+            events = integration_service.iter_calendar_events(*date_range, user=user, after=after, limit=limit,
+                                                              fields=fields)
+            lines = (current_app.json.dumps(event) + '\n' for event in events)
+            return current_app.response_class(stream_with_context(lines), mimetype='application/x-ndjson')
+
+        if limit is not None or after is not None:
+            # One extra event tells whether there is a next page. The
+            # cursor is built from start_time and id, so those are read
+            # even when `fields` leaves them out, and dropped afterwards.
+            read_fields = fields and tuple(dict.fromkeys(fields + ('start_time', 'id')))
+            events = list(integration_service.iter_calendar_events(
+                *date_range, user=user, after=after, limit=None if limit is None else limit + 1, fields=read_fields
+            ))
+            has_more = limit is not None and len(events) > limit
+            events = events[:limit]
+            next_cursor = _event_cursor(events[-1]) if has_more else None
+            if read_fields != fields:
+                events = [{field: event[field] for field in fields} for event in events]
+            response = jsonify(events)
+            if next_cursor:
+                response.headers['X-Next-Cursor'] = next_cursor
+            return response
+
+        # Tab switches repeat the same ranges; answer those from memory
+        # until one of this user's calendar generations moves.
+        body = calendar_response_cache.get(user.id, date_range, fields)
+        if body is None:
+            built_at = calendar_response_cache.generations(user.id)
+            # iter_calendar_events rather than get_calendar_events, which
+            # answers [] on error: a failed read must not be cached.
+            events = list(integration_service.iter_calendar_events(*date_range, user=user, fields=fields))
+            body = current_app.json.dumps(events)
+            calendar_response_cache.put(user.id, date_range, built_at, body, fields)
+        return current_app.response_class(body, mimetype='application/json')
     except Exception as e:
         return jsonify([])
 
@@ -53,6 +148,7 @@ def health_check():
     from sqlalchemy import text
     from ..services.ollama_service import ollama_service
     from ..models import db
+    from ..utils import http_client
     from ..utils.config import config
 
     try:
@@ -72,5 +168,7 @@ def health_check():
         'status': 'healthy',
         'ollama_status': ollama_status,
         'database': db_status,
-        'model': config.OLLAMA_MODEL
+        'model': config.OLLAMA_MODEL,
+        'calendar_response_cache': calendar_response_cache.stats(),
+        'upstreams': http_client.breaker_states(),
     }) 
\ No newline at end of file
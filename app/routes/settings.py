@@ -2,10 +2,10 @@ from datetime import datetime
 
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
-from ..models import Activity, ScheduleRecord, Entity, UserCalendarDescriptor, DefaultEventDescriptor, db
+from ..models import Activity, ScheduleRecord, Entity, EntityShare, UserCalendarDescriptor, DefaultEventDescriptor, VisibleEvent, db
 from ..services import geocoding_service
 from ..services.custom_calendar_service import (
-    parse_descriptor, regenerate_event_cache_for_user, delete_event_cache_for_user,
+    parse_descriptor, store_parsed_entries, regenerate_event_cache_for_user, delete_event_cache_for_user,
     DescriptorValidationError,
 )
 from ..services.default_event_service import regenerate_event_cache_for_user_default_events
@@ -197,6 +197,7 @@ def update_calendar_descriptor():
     else:
         descriptor = UserCalendarDescriptor(user_id=current_user.id, raw_yaml=raw_yaml)
         db.session.add(descriptor)
+    store_parsed_entries(descriptor, entries)
     db.session.commit()
 
     current_year = datetime.utcnow().year
@@ -293,6 +294,21 @@ def delete_account():
         # Delete all user's data
         Activity.query.filter_by(user_id=current_user.id).delete()
         ScheduleRecord.query.filter_by(user_id=current_user.id).delete()
+        # Bulk deletes skip Entity.shares' cascade, so clear the share rows
+        # for the user's own places, and the ones shared with them, first.
+        EntityShare.query.filter(db.or_(
+            EntityShare.user_id == current_user.id,
+            EntityShare.entity_id.in_(db.select(Entity.id).where(Entity.user_id == current_user.id)),
+        )).delete(synchronize_session=False)
+        # Same for the calendar read model: the user's own view, and other
+        # users' views of the user's places.
+        VisibleEvent.note_changed(db.session, VisibleEvent.delete_where(
+            db.session.connection(),
+            db.or_(
+                VisibleEvent.viewer_id == current_user.id,
+                VisibleEvent.entity_id.in_(db.select(Entity.id).where(Entity.user_id == current_user.id)),
+            ),
+        ))
         Entity.query.filter_by(user_id=current_user.id).delete()
         
         # Delete the user
@@ -16,12 +16,17 @@ from dateutil import parser as date_parser
 
 import requests
 
+from ..utils import http_client
 from ..utils.config import config
 from ..utils.logging_setup import get_logger
 
 logger = get_logger('briefkorb_client')
 
 REQUEST_TIMEOUT_SECONDS = 60  # live provider fetch on BriefKorb's end, not a local query
+# Each call makes BriefKorb fetch from the mail providers, so one at a time
+# and well above what the poll interval needs. Over budget, the refresh
+# fails like an outage and the cached messages stay as they are.
+RATE_LIMIT = http_client.RateLimit(max_requests=10, window_seconds=3600, max_concurrency=1)
 
 
 class BriefKorbClientError(Exception):
@@ -52,8 +57,8 @@ def fetch_unread_messages():
     params = {'unread_only': 'true', 'high_impact_only': 'false'}
 
     try:
-        response = requests.get(
-            url, headers=_auth_headers(), params=params, timeout=REQUEST_TIMEOUT_SECONDS
+        response = http_client.get(
+            url, headers=_auth_headers(), params=params, timeout=REQUEST_TIMEOUT_SECONDS, rate_limit=RATE_LIMIT
         )
     except requests.exceptions.RequestException as e:
         raise BriefKorbClientError(f'Request to BriefKorb failed: {e}') from e
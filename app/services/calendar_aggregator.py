@@ -1,7 +1,12 @@
+import contextvars
 import datetime
-import requests
-import time
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+from ..utils import astronomy, hebrew_calendar, hijri_calendar, http_client, liturgical_calendar
+from ..utils.config import config
 from ..utils.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -9,6 +14,25 @@ logger = get_logger(__name__)
 REQUEST_TIMEOUT_SECONDS = 10
 
 
+def fetch_all(calls, max_workers=1):
+    """Run each zero-argument callable in `calls`, returning their results in
+    the same order as `calls`.
+
+    Serial when max_workers <= 1 -- the default, so a source client used on
+    its own behaves exactly as it always has -- otherwise on a bounded
+    thread pool, so the whole batch takes roughly as long as its slowest
+    call instead of the sum of all of them. The first exception raised by
+    any call is re-raised here, same as the serial loop this replaces.
+    Each call runs in a copy of the caller's context, so e.g. the job's
+    http_client.request_scope() covers it on the pool thread too.
+    """
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
 class EventGroup:
     def __init__(self, date=datetime.datetime.now(), events=[]):
         self.date = date
@@ -24,43 +48,70 @@ class EventGroup:
         return hash(self.date)
 
 class Event:
+    # A full multi-year backfill builds tens of thousands of these, so no
+    # per-instance __dict__.
+    __slots__ = ("name", "date", "sources", "fixed", "countries", "other_names", "notes",
+                 "_country_set", "_note_keys", "_other_name_set")
+
     def __init__(self, name="", date=datetime.datetime.now(), source=None,
                  fixed=False, country=None, other_name=None, notes=None):
         self.name = str(name) if name else ""
         self.date = date
-        self.sources = []
         self.fixed = fixed
-        self.countries = []
-        self.other_names = []
-        self.notes = []
-        if source is not None:
-            if not source in self.sources:
-                self.sources.append(source)
-        if country is not None:
-            if isinstance(country, list):
-                self.countries.extend([str(c) for c in country])
-            else:
-                self.countries.append(str(country))
-        if notes is not None:
-            if isinstance(notes, list):
-                self.notes.extend([str(n) if not isinstance(n, dict) else n for n in notes])
-            else:
-                self.notes.append(str(notes) if not isinstance(notes, dict) else notes)
-        if other_name is not None:
-            if not other_name in self.other_names:
-                self.other_names.append(str(other_name))
+        # Lists are built at their final size rather than appended to, so
+        # each is allocated exactly once.
+        self.sources = [source] if source is not None else []
+        if country is None:
+            self.countries = []
+        elif isinstance(country, list):
+            self.countries = [str(c) for c in country]
+        else:
+            self.countries = [str(country)]
+        if notes is None:
+            self.notes = []
+        elif isinstance(notes, list):
+            self.notes = [str(n) if not isinstance(n, dict) else n for n in notes]
+        else:
+            self.notes = [str(notes) if not isinstance(notes, dict) else notes]
+        self.other_names = [str(other_name)] if other_name is not None else []
+        # Membership sets shadowing the three lists merge() extends, so
+        # merging the same holiday from 50+ countries doesn't rescan them.
+        # Built on the first merge -- most events are never merged into.
+        self._country_set = None
+        self._note_keys = None
+        self._other_name_set = None
+
+    @staticmethod
+    def _note_key(note):
+        # Notes are strings or JSON-shaped dicts, and dicts aren't hashable.
+        if isinstance(note, dict):
+            return ("dict", json.dumps(note, sort_keys=True, default=str))
+        return ("str", note)
+
+    def merge_key(self):
+        """What merge_events matches events on: the name, compared ignoring
+        case and runs of whitespace, plus the exact date."""
+        return (" ".join(self.name.split()).casefold(), self.date)
 
     def merge(self, other):
+        if self._country_set is None:
+            self._country_set = set(self.countries)
+            self._note_keys = {Event._note_key(note) for note in self.notes}
+            self._other_name_set = set(self.other_names)
         if self.fixed is None and other.fixed is not None:
             self.fixed = other.fixed
         for country in other.countries:
-            if not country in self.countries:
+            if country not in self._country_set:
+                self._country_set.add(country)
                 self.countries.append(country)
         for note in other.notes:
-            if not note in self.notes:
+            note_key = Event._note_key(note)
+            if note_key not in self._note_keys:
+                self._note_keys.add(note_key)
                 self.notes.append(note)
         for other_name in other.other_names:
-            if not other_name in self.other_names:
+            if other_name not in self._other_name_set:
+                self._other_name_set.add(other_name)
                 self.other_names.append(other_name)
 
     def __str__(self):
@@ -267,28 +318,78 @@ class Event:
         return new_event
 
     @staticmethod
-    def merge_events(events=[], events_to_merge=[]):
+    def index_events(events):
+        """{merge_key(): event} for `events`, keeping the first event for
+        any key that occurs more than once."""
+        index = {}
+        for event in events:
+            index.setdefault(event.merge_key(), event)
+        return index
+
+    @staticmethod
+    def merge_events(events=[], events_to_merge=[], index=None):
+        """Merge `events_to_merge` into `events` in place: an event whose
+        merge_key() is already present is folded into that event, anything
+        else is appended. `index` is the merge_key() lookup for `events` --
+        pass the returned dict back in when merging several batches into the
+        same list so it isn't rebuilt each time; it's built from `events`
+        when omitted. Returns the index."""
+        if index is None:
+            index = Event.index_events(events)
         for event_to_merge in events_to_merge:
-            has_merged_event = False
-            for event in events:
-                if event_to_merge.name == event.name and event_to_merge.date == event.date:
-                    event.merge(event_to_merge)
-                    has_merged_event = True
-                    break
-            if not has_merged_event:
+            key = event_to_merge.merge_key()
+            event = index.get(key)
+            if event is None:
+                index[key] = event_to_merge
                 events.append(event_to_merge)
+            else:
+                event.merge(event_to_merge)
+        return index
+
+
+def _event_description(event):
+    """The event's first plain-text note. Structured notes (dicts) go to
+    _event_details instead of being stringified into the description."""
+    return next((str(note) for note in event.notes if not isinstance(note, dict)), None)
+
+
+def _event_details(event):
+    """The event's structured notes -- Inadiutorium's season and
+    celebrations, the Hijri date, Nager's public flag and so on -- as a
+    list of dicts, or None."""
+    return [note for note in event.notes if isinstance(note, dict)] or None
 
 
 def format_event(event):
-    """Convert an Event into the plain-dict shape used for API responses and
-    EventCache rows -- shared by IntegrationService.fetch_live_calendar_events
-    and the computed-calendar backfill job so this shape is defined once."""
+    """Convert an Event into the plain-dict shape used for API responses --
+    IntegrationService.fetch_live_calendar_events's return value. Writers
+    of EventCache use event_cache_row instead, which skips the string
+    round trip."""
     return {
         'title': str(event.name) if event.name else 'Untitled Event',
         'start_time': event.date.strftime('%Y-%m-%d %H:%M') if event.date else None,
-        'description': str(event.notes[0]) if event.notes else None,
+        'description': _event_description(event),
         'location': str(event.countries[0]) if event.countries else None,
-        'sources': list(map(str, event.sources)) if event.sources else []
+        'sources': list(map(str, event.sources)) if event.sources else [],
+        'details': _event_details(event),
+    }
+
+
+def event_cache_row(event):
+    """Map an Event straight to EventCache column values, typed (datetime
+    date, int year) -- what format_event followed by
+    EventCache.from_event_dict produces, without formatting the date to a
+    string and parsing it back twice. Like that round trip, the date is
+    truncated to the minute and made naive."""
+    date = event.date.replace(second=0, microsecond=0, tzinfo=None)
+    return {
+        'title': event.name or 'Untitled Event',
+        'date': date,
+        'description': _event_description(event),
+        'location': str(event.countries[0]) if event.countries else None,
+        'source': str(event.sources[0]) if event.sources else None,
+        'year': date.year,
+        'details': _event_details(event),
     }
 
 
@@ -304,7 +405,7 @@ class HolidayAPI:
     def get_events_for_country(self, country="US", year=-1):
         events = []
         try:
-            events_json = requests.get(self.__build_url(country, year), timeout=REQUEST_TIMEOUT_SECONDS).json()
+            events_json = http_client.get(self.__build_url(country, year), timeout=REQUEST_TIMEOUT_SECONDS).json()
             for event in events_json:
                 events.append(Event.from_holiday_api(event))
         except Exception as e:
@@ -314,17 +415,24 @@ class HolidayAPI:
 
     def get_events(self, country_codes=["US"], year=-1):
         events = []
+        index = {}
         for country in country_codes:
-            Event.merge_events(events, self.get_events_for_country(country, year))
+            Event.merge_events(events, self.get_events_for_country(country, year), index)
         return events
 
 
 
 class NagerPublicHolidaysAPI:
     BASE_URL = "https://date.nager.at/api/v3/publicholidays/"
+    SOURCE = "Nager Public Holidays API"
+    # Cap on in-flight requests against date.nager.at, shared across every
+    # caller of this instance (e.g. both years of a CalendarAggregator
+    # refresh fetching at once), not just within one get_events call.
+    MAX_CONCURRENT_REQUESTS = 5
 
     def __init__(self, api_key=None):
         self.api_key = api_key
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
     
     def __build_url(self, country_code="US", year=-1):
         return self.BASE_URL + str(year) + "/" + country_code
@@ -332,7 +440,8 @@ class NagerPublicHolidaysAPI:
     def get_events_for_country(self, country_code="US", year=-1):
         events = []
         try:
-            events_json = requests.get(self.__build_url(country_code, year), timeout=REQUEST_TIMEOUT_SECONDS).json()
+            with self._request_slots:
+                events_json = http_client.get(self.__build_url(country_code, year), timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json()
             for event in events_json:
                 events.append(Event.from_nager_public_holidays_api(event))
         except Exception as e:
@@ -340,10 +449,15 @@ class NagerPublicHolidaysAPI:
             raise e
         return events
 
-    def get_events(self, country_codes=["US"], year=-1):
+    def get_events(self, country_codes=["US"], year=-1, max_workers=1):
+        per_country_events = fetch_all(
+            [partial(self.get_events_for_country, country, year) for country in country_codes],
+            min(max_workers, self.MAX_CONCURRENT_REQUESTS),
+        )
         events = []
-        for country in country_codes:
-            Event.merge_events(events, self.get_events_for_country(country, year))
+        index = {}
+        for country_events in per_country_events:
+            Event.merge_events(events, country_events, index)
         return events
 
 
@@ -369,10 +483,9 @@ class InadiutoriumAPI:
     def get_events_for_month(self, year=-1, month=-1):
         events = []
         try:
-            events_json = requests.get(self.__build_url(year, month), timeout=REQUEST_TIMEOUT_SECONDS).json()
+            events_json = http_client.get(self.__build_url(year, month), timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json()
             for event in events_json:
                 events.append(Event.from_inadiutorium_api(event))
-            time.sleep(0.5)
         except Exception as e:
             logger.error("Error getting events from Inadiutorium API: " + str(e))
             raise e
@@ -386,22 +499,85 @@ class InadiutoriumAPI:
 
 
 
+class LocalLiturgicalCalendar(InadiutoriumAPI):
+    """Drop-in replacement for InadiutoriumAPI that generates the General
+    Roman Calendar in-process (see app/utils/liturgical_calendar.py)
+    instead of crawling calapi.inadiutorium.cz month by month. Each day
+    comes out in Inadiutorium's own shape and goes through
+    Event.from_inadiutorium_api, so events -- season/season_week/
+    celebrations notes and source="Inadiutorium API" included -- are
+    identical in form, and a whole year costs milliseconds instead of
+    twelve ~20s requests.
+
+    The remote API is kept only as an optional cross-check (see
+    LITURGICAL_CALENDAR_CROSS_CHECK).
+    """
+
+    def __init__(self, cross_check=False):
+        super().__init__()
+        self.cross_check_enabled = cross_check
+
+    def compute_events(self, year=-1):
+        return [Event.from_inadiutorium_api(day) for day in liturgical_calendar.days_for_year(year)]
+
+    def get_events_for_month(self, year=-1, month=-1):
+        return [event for event in self.compute_events(year) if event.date.month == month]
+
+    def get_events(self, year=-1):
+        events = self.compute_events(year)
+        if self.cross_check_enabled:
+            try:
+                self.cross_check(year, events)
+            except Exception as e:
+                logger.warning(f"Inadiutorium cross-check for {year} failed: {e}")
+        return events
+
+    def get_remote_events(self, year=-1):
+        return super().get_events(year)
+
+    def cross_check(self, year, local_events=None):
+        """Compare local results for `year` against the Inadiutorium API.
+        Returns (date, local_name, remote_name) for each day whose
+        celebration differs."""
+        if local_events is None:
+            local_events = self.compute_events(year)
+        local_names = {event.date.date(): event.name for event in local_events}
+        mismatches = []
+        for remote_event in self.get_remote_events(year):
+            day = remote_event.date.date()
+            if local_names.get(day) != remote_event.name:
+                mismatches.append((day, local_names.get(day), remote_event.name))
+        for day, local_name, remote_name in mismatches:
+            logger.warning(f"Liturgical calendar mismatch on {day:%Y-%m-%d}: computed {local_name!r}, "
+                           f"Inadiutorium says {remote_name!r}")
+        return mismatches
+
+
 class HijriCalendarAPI:
     # Maybe pip install hijri-converter
     BASE_URL = "http://api.aladhan.com/v1/"
     G_TO_H_CALENDAR = "gToHCalendar/"
+    SOURCE = "Hijri API"
+    # Same role as NagerPublicHolidaysAPI.MAX_CONCURRENT_REQUESTS -- twelve
+    # monthly calls per year, so without a cap a two-year refresh would
+    # open 24 connections against api.aladhan.com at once.
+    MAX_CONCURRENT_REQUESTS = 4
 
     def __init__(self) -> None:
-        pass
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
 
     def __build_url(self, month=-1, year=-1):
         return self.BASE_URL + self.G_TO_H_CALENDAR + str(month) + '/' + str(year)
 
+    def get_days_for_month(self, month=-1, year=-1):
+        """Raw Aladhan day entries (hijri/gregorian) for one Gregorian month."""
+        with self._request_slots:
+            return http_client.get(self.__build_url(month, year), timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json()["data"]
+
     def get_events_for_month(self, month=-1, year=-1):
         events = []
         try:
-            dates_json  = requests.get(self.__build_url(month, year), timeout=REQUEST_TIMEOUT_SECONDS).json()["data"]
-            for date in dates_json:
+            for date in self.get_days_for_month(month, year):
                 if len(date["hijri"]["holidays"]) > 0:
                     events.append(Event.from_hijri_api(date))
         except Exception as e:
@@ -409,13 +585,90 @@ class HijriCalendarAPI:
             raise e
         return events
 
-    def get_events(self, year=-1):
+    def get_events(self, year=-1, max_workers=1):
+        per_month_events = fetch_all(
+            [partial(self.get_events_for_month, month + 1, year) for month in range(0, 12)],
+            min(max_workers, self.MAX_CONCURRENT_REQUESTS),
+        )
         events = []
-        for month in range(0, 12):
-            events.extend(self.get_events_for_month(month + 1, year))
+        for month_events in per_month_events:
+            events.extend(month_events)
         return events
 
 
+class LocalHijriCalendar(HijriCalendarAPI):
+    """Drop-in replacement for HijriCalendarAPI that computes the Islamic
+    holidays for a whole year in one pass (see app/utils/hijri_calendar.py)
+    instead of converting all twelve Gregorian months over HTTP. Events come
+    out identical in shape, including source="Hijri API".
+
+    The tabular calendar can be a day off from an actual moon sighting, so
+    the sighting-override table on disk is applied on top. That table is
+    the only thing that ever needs the network: refresh_overrides() pulls
+    the remote month-by-month conversion for the requested years and
+    records the month starts that differ from the tabular ones. It runs
+    only when explicitly asked to (`flask hijri-refresh-overrides`), never
+    as part of get_events().
+    """
+
+    def compute_events(self, year=-1):
+        return [Event.from_hijri_api(item) for item in hijri_calendar.holidays_for_gregorian_year(year)]
+
+    def get_events(self, year=-1, max_workers=1):
+        return self.compute_events(year)
+
+    def get_events_for_month(self, month=-1, year=-1):
+        return [event for event in self.compute_events(year) if event.date.month == month]
+
+    def get_remote_events(self, year=-1, max_workers=1):
+        return super().get_events(year, max_workers=max_workers)
+
+    @staticmethod
+    def _parse_gregorian_date(value):
+        # Aladhan documents DD-MM-YYYY; Event.from_hijri_api reads ISO.
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return datetime.datetime.strptime(value, "%d-%m-%Y").date()
+
+    def refresh_overrides(self, years, max_workers=1):
+        """Fetch the remote conversion for every month of `years` and bring
+        the override table in line with it: month starts that differ from
+        the tabular calendar are recorded, ones that now agree are dropped.
+        Returns the list of (hijri_year, month, old_start, new_start) that
+        changed, as dates (None where there was no override)."""
+        calls = [partial(self.get_days_for_month, month, year) for year in years for month in range(1, 13)]
+        remote_starts = {}
+        for days in fetch_all(calls, min(max_workers, self.MAX_CONCURRENT_REQUESTS)):
+            for day in days:
+                if int(day["hijri"]["day"]) != 1:
+                    continue
+                key = (int(day["hijri"]["year"]), int(day["hijri"]["month"]["number"]))
+                remote_starts[key] = self._parse_gregorian_date(day["gregorian"]["date"])
+
+        overrides = hijri_calendar.load_overrides()
+        changes = []
+        for (hijri_year, month), start in sorted(remote_starts.items()):
+            old = overrides.get((hijri_year, month))
+            new = start.toordinal()
+            if new == hijri_calendar.tabular_to_fixed(hijri_year, month, 1):
+                new = None
+            if old == new:
+                continue
+            if new is None:
+                del overrides[(hijri_year, month)]
+            else:
+                overrides[(hijri_year, month)] = new
+            changes.append((hijri_year, month,
+                            old and datetime.date.fromordinal(old),
+                            new and datetime.date.fromordinal(new)))
+        if changes:
+            hijri_calendar.save_overrides(overrides)
+        for hijri_year, month, old, new in changes:
+            logger.info(f"Hijri override {hijri_calendar.override_key(hijri_year, month)}: {old} -> {new}")
+        return changes
+
+
 class HebcalAPI:
     """Jewish/Hebrew calendar holidays via the free Hebcal REST API.
 
@@ -439,7 +692,7 @@ class HebcalAPI:
     def get_events(self, year=-1):
         events = []
         try:
-            items = requests.get(self.__build_url(year), timeout=REQUEST_TIMEOUT_SECONDS).json().get("items", [])
+            items = http_client.get(self.__build_url(year), timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json().get("items", [])
             for item in items:
                 events.append(Event.from_hebcal_api(item))
         except Exception as e:
@@ -448,6 +701,58 @@ class HebcalAPI:
         return events
 
 
+class LocalHebcalCalendar(HebcalAPI):
+    """Drop-in replacement for HebcalAPI that computes the same holidays
+    in-process (see app/utils/hebrew_calendar.py) instead of calling
+    hebcal.com -- the Hebrew calendar is pure arithmetic, so there's nothing
+    the remote API knows that this doesn't. Events come out identical in
+    shape, including source="Hebcal", so cached rows and the
+    backfill_computed_calendar_events bookkeeping don't change.
+
+    The remote API is kept only as an optional cross-check (see
+    HEBREW_CALENDAR_CROSS_CHECK): cross_check() fetches the same year from
+    Hebcal and reports every title whose date disagrees.
+    """
+
+    def __init__(self, cross_check=False):
+        super().__init__()
+        self.cross_check_enabled = cross_check
+
+    def compute_events(self, year=-1):
+        return [Event.from_hebcal_api(item) for item in hebrew_calendar.holidays_for_gregorian_year(year)]
+
+    def get_events(self, year=-1):
+        events = self.compute_events(year)
+        if self.cross_check_enabled:
+            try:
+                self.cross_check(year, events)
+            except Exception as e:
+                logger.warning(f"Hebcal cross-check for {year} failed: {e}")
+        return events
+
+    def get_remote_events(self, year=-1):
+        return super().get_events(year)
+
+    def cross_check(self, year, local_events=None):
+        """Compare local results for `year` against the Hebcal API. Returns
+        a list of (title, local_date, remote_date) for each title both sides
+        produced on different dates; titles only one side produced (e.g.
+        Hebcal holidays outside the major/minor/modern set computed here)
+        are ignored."""
+        if local_events is None:
+            local_events = self.compute_events(year)
+        local_dates = {event.name: event.date for event in local_events}
+        mismatches = []
+        for remote_event in self.get_remote_events(year):
+            local_date = local_dates.get(remote_event.name)
+            if local_date is not None and local_date.date() != remote_event.date.date():
+                mismatches.append((remote_event.name, local_date, remote_event.date))
+        for title, local_date, remote_date in mismatches:
+            logger.warning(f"Hebrew calendar mismatch for {title}: computed {local_date:%Y-%m-%d}, "
+                           f"Hebcal says {remote_date:%Y-%m-%d}")
+        return mismatches
+
+
 class USNOAstronomicalEventsAPI:
     """Equinoxes/solstices/perihelion/aphelion, solar eclipses, and moon
     phases via the free, keyless US Naval Observatory Astronomical
@@ -472,8 +777,8 @@ class USNOAstronomicalEventsAPI:
     def _get_seasons(self, year):
         events = []
         try:
-            data = requests.get(f"{self.BASE_URL}/seasons", params={"year": year},
-                                 timeout=REQUEST_TIMEOUT_SECONDS).json().get("data", [])
+            data = http_client.get(f"{self.BASE_URL}/seasons", params={"year": year},
+                                    timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json().get("data", [])
             for item in data:
                 events.append(Event.from_usno_season_api(item))
         except Exception as e:
@@ -484,8 +789,8 @@ class USNOAstronomicalEventsAPI:
     def _get_solar_eclipses(self, year):
         events = []
         try:
-            eclipses = requests.get(f"{self.BASE_URL}/eclipses/solar/year", params={"year": year},
-                                     timeout=REQUEST_TIMEOUT_SECONDS).json().get("eclipses_in_year", [])
+            eclipses = http_client.get(f"{self.BASE_URL}/eclipses/solar/year", params={"year": year},
+                                        timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json().get("eclipses_in_year", [])
             for item in eclipses:
                 events.append(Event.from_usno_eclipse_api(item))
         except Exception as e:
@@ -496,8 +801,8 @@ class USNOAstronomicalEventsAPI:
     def _get_moon_phases(self, year):
         events = []
         try:
-            phases = requests.get(f"{self.BASE_URL}/moon/phases/year", params={"year": year},
-                                   timeout=REQUEST_TIMEOUT_SECONDS).json().get("phasedata", [])
+            phases = http_client.get(f"{self.BASE_URL}/moon/phases/year", params={"year": year},
+                                      timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json().get("phasedata", [])
             for item in phases:
                 events.append(Event.from_usno_moon_phase_api(item))
         except Exception as e:
@@ -506,6 +811,62 @@ class USNOAstronomicalEventsAPI:
         return events
 
 
+class LocalAstronomicalEvents(USNOAstronomicalEventsAPI):
+    """Drop-in replacement for USNOAstronomicalEventsAPI that computes
+    seasons, solar eclipses and moon phases in-process (see
+    app/utils/astronomy.py) instead of making three calls to USNO per year.
+    Items come out in USNO's own shapes and go through the same
+    Event.from_usno_* constructors, so events are identical in form,
+    including source="USNO".
+
+    USNO itself is kept only for optional validation -- see
+    ASTRONOMY_CROSS_CHECK and cross_check().
+    """
+
+    def __init__(self, cross_check=False):
+        super().__init__()
+        self.cross_check_enabled = cross_check
+
+    def compute_events(self, year=-1):
+        return self.get_events_for_years([year])[year]
+
+    def get_events_for_years(self, years):
+        """Every year in `years` in one batch -- {year: [Event, ...]}."""
+        events_by_year = {}
+        for year, items in astronomy.events_for_years(years).items():
+            events = [Event.from_usno_season_api(item) for item in items['seasons']]
+            events.extend(Event.from_usno_eclipse_api(item) for item in items['eclipses'])
+            events.extend(Event.from_usno_moon_phase_api(item) for item in items['moon_phases'])
+            events_by_year[year] = events
+        return events_by_year
+
+    def get_events(self, year=-1):
+        events = self.compute_events(year)
+        if self.cross_check_enabled:
+            try:
+                self.cross_check(year, events)
+            except Exception as e:
+                logger.warning(f"USNO cross-check for {year} failed: {e}")
+        return events
+
+    def get_remote_events(self, year=-1):
+        return super().get_events(year)
+
+    def cross_check(self, year, local_events=None):
+        """Compare local results for `year` against USNO. Returns a sorted
+        list of (name, date) pairs only one side produced -- e.g. a moon
+        phase that landed on the other side of midnight UT."""
+        if local_events is None:
+            local_events = self.compute_events(year)
+        local = {(event.name, event.date.date()) for event in local_events}
+        remote = {(event.name, event.date.date()) for event in self.get_remote_events(year)}
+        mismatches = sorted(local ^ remote)
+        for name, day in mismatches:
+            side = 'computed only' if (name, day) in local else 'USNO only'
+            logger.warning(f"Astronomical event mismatch: {name} on {day:%Y-%m-%d} ({side})")
+        return mismatches
+
+
 class LaunchLibraryAPI:
     """Rocket launches via the free Launch Library 2 API (thespacedevs.com).
     No account or API key required for this usage.
@@ -524,6 +885,7 @@ class LaunchLibraryAPI:
     dates aren't meaningfully known much further out than that anyway.
     """
     BASE_URL = "https://ll.thespacedevs.com/2.2.0/launch/upcoming/"
+    SOURCE = "Launch Library"
     WINDOW_DAYS = 120
     PAGE_LIMIT = 100
 
@@ -542,8 +904,8 @@ class LaunchLibraryAPI:
         # other source.
         events = []
         try:
-            results = requests.get(self.BASE_URL, params={"limit": self.PAGE_LIMIT},
-                                    timeout=REQUEST_TIMEOUT_SECONDS).json().get("results", [])
+            results = http_client.get(self.BASE_URL, params={"limit": self.PAGE_LIMIT},
+                                       timeout=REQUEST_TIMEOUT_SECONDS, cache=True).json().get("results", [])
             for item in results:
                 events.append(Event.from_launch_library_api(item))
         except Exception as e:
@@ -606,35 +968,112 @@ class NobelPrizeSchedule:
 
 
 class CalendarAggregator:
-    def __init__(self):
+    def __init__(self, max_workers=None):
         # self.holiday_api = HolidayAPI(config.holiday_api_key)
         self.public_holidays_api = NagerPublicHolidaysAPI()
-        self.hijri_calendar_api = HijriCalendarAPI()
+        # Real-world Islamic month starts can involve an actual moon-sighting
+        # decision a purely computed prediction might not track exactly, so
+        # Hijri stays merged into get_events() below rather than joining
+        # Inadiutorium in the backfill -- but the local engine computes it
+        # from the tabular calendar plus a sighting-override table, and only
+        # touches the network when those overrides are explicitly refreshed
+        # (see LocalHijriCalendar.refresh_overrides).
+        if config.HIJRI_CALENDAR_ENGINE == 'remote':
+            self.hijri_calendar_api = HijriCalendarAPI()
+        else:
+            self.hijri_calendar_api = LocalHijriCalendar()
         # Genuinely live/changeable data -- merged into get_events() below,
-        # same as the two above. Real-world Islamic month starts can involve
-        # an actual moon-sighting decision a purely computed prediction
-        # might not track exactly, so Hijri stays on this cycle rather than
-        # joining Inadiutorium below, even though both are rule-computed.
+        # same as Nager.
         self.launch_library_api = LaunchLibraryAPI()
         # Computed/curated, not merged into get_events() below -- see
         # InadiutoriumAPI's/HebcalAPI's/NobelPrizeSchedule's docstrings.
         # Used instead by backfill_computed_calendar_events.
-        self.inadiutorium_api = InadiutoriumAPI()
-        self.hebcal_api = HebcalAPI()
-        self.usno_astronomical_events_api = USNOAstronomicalEventsAPI()
+        if config.LITURGICAL_CALENDAR_ENGINE == 'remote':
+            self.inadiutorium_api = InadiutoriumAPI()
+        else:
+            self.inadiutorium_api = LocalLiturgicalCalendar(cross_check=config.LITURGICAL_CALENDAR_CROSS_CHECK)
+        if config.HEBREW_CALENDAR_ENGINE == 'remote':
+            self.hebcal_api = HebcalAPI()
+        else:
+            self.hebcal_api = LocalHebcalCalendar(cross_check=config.HEBREW_CALENDAR_CROSS_CHECK)
+        if config.ASTRONOMY_ENGINE == 'remote':
+            self.usno_astronomical_events_api = USNOAstronomicalEventsAPI()
+        else:
+            self.usno_astronomical_events_api = LocalAstronomicalEvents(cross_check=config.ASTRONOMY_CROSS_CHECK)
         self.nobel_prize_schedule = NobelPrizeSchedule()
-
-    def get_events(self, year):
-        # holidays = self.holiday_api.get_events(["US", "DE", "GB", "CA", "RU"], year)
-        public_holidays = self.public_holidays_api.get_events(["US", "DE", "GB", "CA", "RU"], year)
-        hijri = self.hijri_calendar_api.get_events(year)
-        launches = self.launch_library_api.get_events(year)
-
+        # Size of the worker pool get_events_for_years fans out over; 1
+        # falls back to fetching every source strictly one after another.
+        # Per-upstream caps still apply underneath this -- see each
+        # client's MAX_CONCURRENT_REQUESTS.
+        self.max_workers = config.CALENDAR_FETCH_MAX_WORKERS if max_workers is None else max_workers
+        self.public_holiday_country_codes = list(config.PUBLIC_HOLIDAY_COUNTRY_CODES)
+
+    def get_events(self, year, failed_sources=None, sources=None):
+        return self.get_events_for_years([year], failed_sources=failed_sources, sources=sources)
+
+    def get_events_for_years(self, years, failed_sources=None, sources=None):
+        """Fetch and merge every live source for all of `years` in one pass.
+
+        Every per-source, per-year fetch is submitted to one bounded worker
+        pool at once (and Nager/Hijri fan their own per-country/per-month
+        calls out underneath that), so a refresh costs roughly the slowest
+        single upstream call rather than the sum of 36+ sequential round
+        trips. Launch Library is fetched once regardless of how many years
+        are asked for, since it ignores `year` anyway (see
+        LaunchLibraryAPI.get_events). The merge/sort step runs once, over
+        everything, after all fetches have finished.
+
+        By default the first source to fail fails the whole fetch. With
+        `failed_sources` (a set), a failing source is left out instead and
+        its SOURCE name added to the set, and the others are still merged
+        -- so the caller can keep that source's previous events rather
+        than losing all of them. A source any of whose requests was
+        answered from a stale cached copy (see http_cache) counts as
+        failed here too: its data is only as new as its last good refresh.
+
+        `sources`, a set of (SOURCE name, year) pairs, limits the fetch to
+        those -- see refresh_cadence. Launch Library's one fetch is made if
+        any of its years is asked for.
+        """
+        years = list(years)
+
+        def wanted(client, year):
+            return sources is None or (client.SOURCE, year) in sources
+
+        sourced_calls = []
+        for year in years:
+            # holidays = self.holiday_api.get_events(["US", "DE", "GB", "CA", "RU"], year)
+            if wanted(self.public_holidays_api, year):
+                sourced_calls.append((self.public_holidays_api.SOURCE, partial(
+                    self.public_holidays_api.get_events,
+                    self.public_holiday_country_codes, year, max_workers=self.max_workers)))
+            if wanted(self.hijri_calendar_api, year):
+                sourced_calls.append((self.hijri_calendar_api.SOURCE, partial(
+                    self.hijri_calendar_api.get_events, year, max_workers=self.max_workers)))
+        if any(wanted(self.launch_library_api, year) for year in years):
+            sourced_calls.append((self.launch_library_api.SOURCE,
+                                  partial(self.launch_library_api.get_events, years[0])))
+
+        def skipping_failures(source, call):
+            try:
+                with http_client.noting_stale() as stale_urls:
+                    events = call()
+            except Exception as e:
+                logger.warning(f"Leaving {source} out of this fetch: {e}")
+                failed_sources.add(source)
+                return []
+            if stale_urls:
+                logger.warning(f"Leaving {source} out of this fetch: {stale_urls[0]} "
+                               f"was only available from the cache")
+                failed_sources.add(source)
+                return []
+            return events
+
+        calls = [call if failed_sources is None else partial(skipping_failures, source, call)
+                 for source, call in sourced_calls]
         all_events = []
-        Event.merge_events(all_events, public_holidays)
-        Event.merge_events(all_events, hijri)
-        Event.merge_events(all_events, launches)
+        index = {}
+        for events in fetch_all(calls, self.max_workers):
+            Event.merge_events(all_events, events, index)
         all_events.sort(key=lambda e: (e.date))
         return all_events
-
-
@@ -0,0 +1,73 @@
+"""Per-viewer generations for the calendar read path.
+
+Every change to the VisibleEvent projection -- whichever EventCache
+writer, share change or delete caused it -- records the viewer ids whose
+rows it touched on the session (VisibleEvent.note_changed). When that
+session commits, each of those viewers gets a fresh generation token in
+CalendarGeneration, written in the same transaction; the global rows'
+generation is the one for GLOBAL_VIEWER_ID. Anything cached from a
+viewer's calendar (GlobalEventSnapshot, the /api/calendar/events response
+cache) remembers the generations it was built at and is stale as soon as
+they move. A rolled-back session bumps nothing, and since every bump is a
+new token, a generation that was rolled back is never seen again.
+
+Generations live in the database, not in memory, so a write committed by
+another process -- a second server worker, `flask visible-events rebuild`
+-- invalidates this process's caches too: checking costs a primary-key
+read per viewer. A viewer without a row is at the initial generation, ''.
+"""
+from uuid import uuid4
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from ..models import CalendarGeneration, db
+from ..models.visible_event import CHANGED_VIEWERS_KEY, GLOBAL_VIEWER_ID
+
+
+def of(viewer_ids):
+    """The viewers' current generations, in order."""
+    viewer_ids = list(viewer_ids)
+    generations = dict(db.session.execute(
+        select(CalendarGeneration.viewer_id, CalendarGeneration.generation)
+        .where(CalendarGeneration.viewer_id.in_(viewer_ids))
+    ).all())
+    return tuple(generations.get(viewer_id, '') for viewer_id in viewer_ids)
+
+
+def current(viewer_id):
+    return of([viewer_id])[0]
+
+
+def current_global():
+    return current(GLOBAL_VIEWER_ID)
+
+
+def bump(viewer_ids, session=None):
+    """Give each viewer a new generation, in `session`'s transaction --
+    visible to other processes once it commits."""
+    session = session or db.session
+    viewer_ids = set(viewer_ids)
+    generation = uuid4().hex
+    session.execute(update(CalendarGeneration)
+                    .where(CalendarGeneration.viewer_id.in_(viewer_ids))
+                    .values(generation=generation))
+    known = set(session.scalars(select(CalendarGeneration.viewer_id)
+                                .where(CalendarGeneration.viewer_id.in_(viewer_ids))))
+    if viewer_ids - known:
+        session.execute(CalendarGeneration.__table__.insert(),
+                        [{'viewer_id': viewer_id, 'generation': generation} for viewer_id in viewer_ids - known])
+
+
+@event.listens_for(Session, 'before_commit')
+def _bump_on_commit(session):
+    # Flush first: the flush is what notes the changed viewers.
+    session.flush()
+    viewer_ids = session.info.pop(CHANGED_VIEWERS_KEY, None)
+    if viewer_ids:
+        bump(viewer_ids, session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_on_rollback(session):
+    session.info.pop(CHANGED_VIEWERS_KEY, None)
@@ -0,0 +1,89 @@
+"""In-memory cache of /api/calendar/events response bodies.
+
+The dashboard's day/week/month/year tabs ask for the same few ranges over
+and over, and each request used to re-read the user's events and redo the
+Ancient Egyptian date for every one of them. Bodies are now kept per
+(user, normalized range, selected fields, format -- the JSON array or the
+NDJSON stream the year tab reads), together with the generations of that
+user's and of the global rows (see calendar_generations) they were built
+at. An entry only answers while both are unchanged, so any EventCache
+write, share change or refresh that affects the user retires it.
+
+The range is normalized to what the query can actually tell apart: event
+dates are whole minutes, so a start is rounded up and an end down to the
+minute, with the time zone dropped the same way get_calendar_events drops
+it. Entries are evicted least recently used first, past
+CALENDAR_RESPONSE_CACHE_SIZE, and stats() reports hits and misses for
+/health.
+
+The bodies themselves are per process, but the generations they are
+checked against are read from the database, so a write committed by any
+process retires them here too.
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from . import calendar_generations
+from ..models.visible_event import GLOBAL_VIEWER_ID
+from ..utils.config import config
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+_hits = 0
+_misses = 0
+
+
+def normalize_range(start_date, end_date):
+    """(start, end) as the cache key's range. A missing start is now, as
+    in get_calendar_events."""
+    start_date = (start_date or datetime.now()).replace(tzinfo=None)
+    if start_date.second or start_date.microsecond:
+        start_date = start_date.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    if end_date:
+        end_date = end_date.replace(tzinfo=None, second=0, microsecond=0)
+    return start_date, end_date
+
+
+def generations(user_id):
+    """Generations to store with, and check, a user's entries. Read them
+    before building a body, so a write that lands meanwhile makes it stale."""
+    return calendar_generations.of([user_id, GLOBAL_VIEWER_ID])
+
+
+def get(user_id, date_range, fields=None, fmt='json'):
+    """The cached body, or None on a miss."""
+    global _hits, _misses
+    key = (user_id, date_range, fields, fmt)
+    current = generations(user_id)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] == current:
+            _entries.move_to_end(key)
+            _hits += 1
+            return entry[1]
+        if entry is not None:
+            del _entries[key]
+        _misses += 1
+        return None
+
+
+def put(user_id, date_range, built_at, body, fields=None, fmt='json'):
+    key = (user_id, date_range, fields, fmt)
+    with _lock:
+        _entries[key] = (built_at, body)
+        _entries.move_to_end(key)
+        while len(_entries) > config.CALENDAR_RESPONSE_CACHE_SIZE:
+            _entries.popitem(last=False)
+
+
+def stats():
+    with _lock:
+        return {'size': len(_entries), 'hits': _hits, 'misses': _misses}
+
+
+def clear():
+    global _hits, _misses
+    with _lock:
+        _entries.clear()
+        _hits = _misses = 0
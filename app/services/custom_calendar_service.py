@@ -1,9 +1,11 @@
+import hashlib
 from calendar import isleap, monthrange
 from datetime import date, datetime, timedelta
 
 import yaml
 
-from ..models import EventCache, db
+from ..models import CalendarMaterialization, EventCache, VisibleEvent, db
+from .event_cache_sync import sync_event_cache
 from ..utils.translations import _
 
 MAX_ENTRIES = 200
@@ -15,6 +17,14 @@ CUSTOM_CALENDAR_SOURCE = 'Custom Calendar'
 # validators below. Shared with entity_calendar_service.py, which imports
 # this tuple and the composite validators rather than redefining them.
 VALID_RECURRENCES = ('once', 'annual', 'nth_weekday', 'periodic_years', 'seasonal')
+# Version of parse_descriptor's output shape, part of the hash stored with a
+# descriptor's parsed entries. Bump it when that shape changes, so entries
+# parsed under the old rules are parsed again rather than reused.
+PARSED_ENTRIES_VERSION = 1
+
+# libyaml's loader where PyYAML was built with it -- same safe constructors,
+# several times faster on a descriptor near MAX_RAW_YAML_BYTES.
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 class DescriptorValidationError(ValueError):
@@ -29,9 +39,10 @@ def parse_descriptor(raw_yaml):
     """Parse and validate a user's calendar descriptor YAML into a list of
     normalized entry dicts.
 
-    Uses yaml.safe_load exclusively -- never yaml.load/FullLoader/UnsafeLoader.
-    This is fully untrusted, user-supplied content, and unsafe PyYAML loading
-    can deserialize arbitrary Python objects via tags like !!python/object.
+    Uses a safe loader exclusively (SafeLoader, or its libyaml twin
+    CSafeLoader) -- never FullLoader/UnsafeLoader. This is fully untrusted,
+    user-supplied content, and unsafe PyYAML loading can deserialize
+    arbitrary Python objects via tags like !!python/object.
     """
     if raw_yaml is None or not raw_yaml.strip():
         raise DescriptorValidationError(_('Calendar descriptor is empty.'))
@@ -42,7 +53,7 @@ def parse_descriptor(raw_yaml):
         )
 
     try:
-        parsed = yaml.safe_load(raw_yaml)
+        parsed = yaml.load(raw_yaml, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise DescriptorValidationError(_('Invalid YAML syntax: {0}').format(e))
 
@@ -59,6 +70,31 @@ def parse_descriptor(raw_yaml):
     return [_validate_entry(raw_entry, index) for index, raw_entry in enumerate(raw_entries)]
 
 
+def descriptor_hash(raw_yaml):
+    """Key a descriptor's parsed entries are stored under: its YAML and
+    PARSED_ENTRIES_VERSION."""
+    return hashlib.sha256(f'{PARSED_ENTRIES_VERSION}:{raw_yaml}'.encode('utf-8')).hexdigest()
+
+
+def store_parsed_entries(descriptor, entries):
+    """Keep parse_descriptor's result for `descriptor`'s current YAML on
+    the descriptor itself. The caller commits."""
+    descriptor.parsed_entries = entries
+    descriptor.parsed_hash = descriptor_hash(descriptor.raw_yaml)
+
+
+def descriptor_entries(descriptor):
+    """`descriptor`'s normalized entries: the stored ones if they were
+    parsed from its current YAML under the current PARSED_ENTRIES_VERSION,
+    otherwise parsed now and stored (the caller commits). Raises
+    DescriptorValidationError like parse_descriptor."""
+    if descriptor.parsed_entries is not None and descriptor.parsed_hash == descriptor_hash(descriptor.raw_yaml):
+        return descriptor.parsed_entries
+    entries = parse_descriptor(descriptor.raw_yaml)
+    store_parsed_entries(descriptor, entries)
+    return entries
+
+
 def _validate_entry(raw_entry, index):
     label = _('Entry {0}').format(index + 1)
     if not isinstance(raw_entry, dict):
@@ -314,25 +350,37 @@ def expand_entries_for_year(entries, year):
 
 
 def regenerate_event_cache_for_user(user_id, entries, years):
-    """Delete and recreate a user's Custom Calendar EventCache rows for the
-    given years, from already-parsed entries. Shared by the synchronous
-    on-save path and the periodic background refresh so both stay in sync."""
-    for year in years:
-        EventCache.query.filter_by(user_id=user_id, source=CUSTOM_CALENDAR_SOURCE, year=year).delete()
-        for occurrence in expand_entries_for_year(entries, year):
-            db.session.add(EventCache(
-                title=occurrence['title'],
-                date=occurrence['date'],
-                description=occurrence['description'],
-                location=occurrence['location'],
-                source=CUSTOM_CALENDAR_SOURCE,
-                year=year,
-                user_id=user_id,
-            ))
+    """Bring a user's Custom Calendar EventCache rows for the given years in
+    line with already-parsed entries, writing only what changed (see
+    sync_event_cache). Shared by the synchronous on-save path and the
+    periodic background refresh so both stay in sync. All years go through
+    one sync_event_cache call, so a refresh is one read and at most one
+    bulk statement of each kind however many years it covers. Returns the
+    SyncResult."""
+    result = sync_event_cache(
+        EventCache.query.filter_by(user_id=user_id, source=CUSTOM_CALENDAR_SOURCE)
+        .filter(EventCache.year.in_(years)),
+        [{
+            'title': occurrence['title'],
+            'date': occurrence['date'],
+            'description': occurrence['description'],
+            'location': occurrence['location'],
+            'source': CUSTOM_CALENDAR_SOURCE,
+            'year': year,
+            'user_id': user_id,
+        } for year in years for occurrence in expand_entries_for_year(entries, year)],
+    )
     db.session.commit()
+    return result
 
 
 def delete_event_cache_for_user(user_id):
     """Remove all of a user's Custom Calendar EventCache rows, across all years."""
-    EventCache.query.filter_by(user_id=user_id, source=CUSTOM_CALENDAR_SOURCE).delete()
+    scope = EventCache.query.filter_by(user_id=user_id, source=CUSTOM_CALENDAR_SOURCE)
+    # A bulk delete skips the mapper events that keep VisibleEvent in step.
+    VisibleEvent.note_changed(db.session, VisibleEvent.unproject(
+        db.session.connection(), scope.with_entities(EventCache.id).scalar_subquery()
+    ))
+    scope.delete()
+    CalendarMaterialization.forget(CUSTOM_CALENDAR_SOURCE, user_id)
     db.session.commit()
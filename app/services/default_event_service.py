@@ -1,5 +1,6 @@
 from ..models import DefaultEventDescriptor, EventCache, db
 from .custom_calendar_service import expand_entries_for_year
+from .event_cache_sync import sync_event_cache
 
 DEFAULT_EVENT_SOURCE = 'Default Event'
 
@@ -25,15 +26,16 @@ def _to_expansion_entry(descriptor):
 
 
 def regenerate_event_cache_for_user_default_events(user_id, subscribed_ids, years):
-    """Delete and recreate a user's Default Event EventCache rows for the
-    given years, from whichever catalog rows in `subscribed_ids` still
-    exist. Shared by the synchronous on-save path and the periodic
+    """Bring a user's Default Event EventCache rows for the given years in
+    line with whichever catalog rows in `subscribed_ids` still exist,
+    writing only what changed (see sync_event_cache). Shared by the synchronous on-save path and the periodic
     background refresh, same pattern as regenerate_event_cache_for_user/
     regenerate_event_cache_for_entity.
 
     Called with an empty `subscribed_ids` (e.g. a user who unsubscribed
     from everything) still deletes any stale rows for `years` and inserts
     nothing -- there's no separate delete-only function for that reason.
+    Returns the SyncResult.
     """
     descriptors = (
         DefaultEventDescriptor.query.filter(DefaultEventDescriptor.id.in_(subscribed_ids)).all()
@@ -41,16 +43,18 @@ def regenerate_event_cache_for_user_default_events(user_id, subscribed_ids, year
     )
     entries = [_to_expansion_entry(d) for d in descriptors]
 
-    for year in years:
-        EventCache.query.filter_by(user_id=user_id, source=DEFAULT_EVENT_SOURCE, year=year).delete()
-        for occurrence in expand_entries_for_year(entries, year):
-            db.session.add(EventCache(
-                title=occurrence['title'],
-                date=occurrence['date'],
-                description=occurrence['description'],
-                location=occurrence['location'],
-                source=DEFAULT_EVENT_SOURCE,
-                year=year,
-                user_id=user_id,
-            ))
+    result = sync_event_cache(
+        EventCache.query.filter_by(user_id=user_id, source=DEFAULT_EVENT_SOURCE)
+        .filter(EventCache.year.in_(years)),
+        [{
+            'title': occurrence['title'],
+            'date': occurrence['date'],
+            'description': occurrence['description'],
+            'location': occurrence['location'],
+            'source': DEFAULT_EVENT_SOURCE,
+            'year': year,
+            'user_id': user_id,
+        } for year in years for occurrence in expand_entries_for_year(entries, year)],
+    )
     db.session.commit()
+    return result
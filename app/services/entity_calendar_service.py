@@ -1,7 +1,8 @@
 from calendar import monthrange
 from datetime import datetime
 
-from ..models import EventCache, db
+from ..models import CalendarMaterialization, EventCache, VisibleEvent, db
+from .event_cache_sync import sync_event_cache
 from .custom_calendar_service import (
     expand_entries_for_year, VALID_RECURRENCES,
     _validate_nth_weekday_fields, _validate_periodic_years_fields, _validate_seasonal_fields,
@@ -140,26 +141,36 @@ def _to_expansion_entry(stored_entry):
 
 
 def regenerate_event_cache_for_entity(entity, years):
-    """Delete and recreate an entity's Entity-Calendar EventCache rows for
-    the given years, from its current calendar_entries. Shared by the
-    synchronous on-save path and the periodic background refresh."""
+    """Bring an entity's Entity-Calendar EventCache rows for the given years
+    in line with its current calendar_entries, writing only what changed
+    (see sync_event_cache). Shared by the synchronous on-save path and the
+    periodic background refresh, in one sync_event_cache call like
+    regenerate_event_cache_for_user. Returns the SyncResult."""
     expansion_entries = [_to_expansion_entry(e) for e in entity.get_calendar_entries()]
 
-    for year in years:
-        EventCache.query.filter_by(entity_id=entity.id, source=ENTITY_CALENDAR_SOURCE, year=year).delete()
-        for occurrence in expand_entries_for_year(expansion_entries, year):
-            db.session.add(EventCache(
-                title=occurrence['title'],
-                date=occurrence['date'],
-                description=occurrence['description'],
-                source=ENTITY_CALENDAR_SOURCE,
-                year=year,
-                entity_id=entity.id,
-            ))
+    result = sync_event_cache(
+        EventCache.query.filter_by(entity_id=entity.id, source=ENTITY_CALENDAR_SOURCE)
+        .filter(EventCache.year.in_(years)),
+        [{
+            'title': occurrence['title'],
+            'date': occurrence['date'],
+            'description': occurrence['description'],
+            'source': ENTITY_CALENDAR_SOURCE,
+            'year': year,
+            'entity_id': entity.id,
+        } for year in years for occurrence in expand_entries_for_year(expansion_entries, year)],
+    )
     db.session.commit()
+    return result
 
 
 def delete_event_cache_for_entity(entity_id):
     """Remove all of an entity's Entity Calendar EventCache rows, across all years."""
-    EventCache.query.filter_by(entity_id=entity_id, source=ENTITY_CALENDAR_SOURCE).delete()
+    scope = EventCache.query.filter_by(entity_id=entity_id, source=ENTITY_CALENDAR_SOURCE)
+    # A bulk delete skips the mapper events that keep VisibleEvent in step.
+    VisibleEvent.note_changed(db.session, VisibleEvent.unproject(
+        db.session.connection(), scope.with_entities(EventCache.id).scalar_subquery()
+    ))
+    scope.delete()
+    CalendarMaterialization.forget(ENTITY_CALENDAR_SOURCE, entity_id)
     db.session.commit()
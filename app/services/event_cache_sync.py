@@ -0,0 +1,139 @@
+"""Diff-based refresh of a slice of EventCache.
+
+Every EventCache writer (update_event_cache's global rows, the per-user
+custom calendar and Default Event rows, per-entity calendar rows, the
+computed-calendar backfill) regenerates the full set of rows for some scope
+-- a year of one source for one owner -- from scratch. Deleting the scope
+and re-adding it rewrote thousands of unchanged rows on every refresh,
+handed every event a new id (so SuggestionQueueItem rows with
+item_type='event' pointed at rows that no longer existed) and left the
+SQLite file to grow from the churn.
+
+sync_event_cache instead compares the desired rows against what is already
+stored, by a content hash per row (EventCache.content_hash):
+
+  - a stored row whose hash matches a desired row is left alone;
+  - a stored row with the same title and date as a desired row but other
+    changed content (description, location) is updated in place, keeping
+    its id;
+  - whatever is left over is inserted or deleted.
+
+All three happen as bulk statements, and a refresh where nothing changed
+issues no writes at all. Bulk statements skip the ORM's mapper events, so
+the VisibleEvent projection of the rows touched is brought up to date here
+too, and the viewers whose rows changed are noted for
+calendar_generations to bump once committed. Callers still own the transaction -- this never commits.
+
+The work is split in two so a caller can keep SQLite's write lock short:
+plan_event_cache_sync only reads and diffs, and apply_event_cache_sync
+issues the writes. Plan every scope first, then apply them all and commit,
+and the lock is held for the changed rows' statements alone -- readers on
+other connections meanwhile see the previous commit in full, and the
+commit swaps every scope over at once. That is also why refreshes aren't
+written as a shadow copy under a new generation: rows are updated in place,
+keeping their ids, and GlobalEventSnapshot already swaps whole snapshots
+for in-process readers.
+"""
+from dataclasses import dataclass
+
+from sqlalchemy import delete, insert, update
+
+from ..models import EventCache, VisibleEvent, db
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self):
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def __iadd__(self, other):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.deleted += other.deleted
+        self.unchanged += other.unchanged
+        return self
+
+
+@dataclass
+class SyncPlan:
+    """The writes that bring one scope in line: updates (mappings with
+    their id), deletes (ids), inserts (mappings), and the counts."""
+    updates: list
+    deletes: list
+    inserts: list
+    result: SyncResult
+
+
+def _identity(title, date):
+    return (title, date)
+
+
+def sync_event_cache(scope, rows):
+    """Make the EventCache rows matched by `scope` (an EventCache query,
+    e.g. EventCache.query.filter_by(user_id=..., source=..., year=...))
+    equal to `rows`, a list of EventCache column mappings that all fall
+    inside that scope. Returns a SyncResult."""
+    return apply_event_cache_sync(plan_event_cache_sync(scope, rows))
+
+
+def plan_event_cache_sync(scope, rows):
+    """The SyncPlan for sync_event_cache(scope, rows), reading but not
+    writing."""
+    desired_by_hash = {}
+    for row in rows:
+        row = dict(row, content_hash=EventCache.compute_content_hash(row))
+        desired_by_hash.setdefault(row['content_hash'], []).append(row)
+
+    stale = []
+    result = SyncResult()
+    existing = scope.with_entities(EventCache.id, EventCache.title, EventCache.date, EventCache.content_hash)
+    for row_id, title, date, content_hash in existing.order_by(EventCache.id):
+        matches = desired_by_hash.get(content_hash)
+        if matches:
+            matches.pop()
+            result.unchanged += 1
+        else:
+            stale.append((row_id, title, date))
+
+    remaining = [row for matches in desired_by_hash.values() for row in matches]
+    remaining_by_identity = {}
+    for row in remaining:
+        remaining_by_identity.setdefault(_identity(row['title'], row['date']), []).append(row)
+
+    updates = []
+    deletes = []
+    for row_id, title, date in stale:
+        matches = remaining_by_identity.get(_identity(title, date))
+        if matches:
+            updates.append(dict(matches.pop(), id=row_id))
+        else:
+            deletes.append(row_id)
+    inserts = [row for matches in remaining_by_identity.values() for row in matches]
+    result.updated, result.deleted, result.inserted = len(updates), len(deletes), len(inserts)
+    return SyncPlan(updates, deletes, inserts, result)
+
+
+def apply_event_cache_sync(plan):
+    """Issue a SyncPlan's writes. Returns its SyncResult."""
+    updates, deletes, inserts = plan.updates, plan.deletes, plan.inserts
+    connection = db.session.connection()
+    viewers = set()
+    if updates:
+        db.session.execute(update(EventCache), updates)
+        viewers |= VisibleEvent.reproject(connection, [row['id'] for row in updates])
+    if deletes:
+        viewers |= VisibleEvent.unproject(connection, deletes)
+        db.session.execute(delete(EventCache).where(EventCache.id.in_(deletes)))
+    if inserts:
+        inserted_ids = db.session.execute(
+            insert(EventCache).returning(EventCache.id, sort_by_parameter_order=True), inserts
+        ).scalars().all()
+        viewers |= VisibleEvent.project(connection, inserted_ids)
+    VisibleEvent.note_changed(db.session, viewers)
+    return plan.result
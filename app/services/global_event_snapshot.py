@@ -0,0 +1,83 @@
+"""Process-wide, immutable snapshot of the global calendar rows.
+
+Global EventCache rows (user_id and entity_id both NULL -- public holidays,
+religious and astronomical calendars) are the bulk of the table, identical
+for every user, and change at most once per update_event_cache or
+backfill_computed_calendar_events run. get_calendar_events used to read and
+serialize them from SQLite on every request; it now takes them from a
+GlobalEventSnapshot instead -- ready-made event dicts sorted by (date, id),
+range-searched with bisect -- and only reads the user's own rows from the
+database, merging the two by date.
+
+Invalidation is by the global rows' generation (see calendar_generations),
+which any commit that changed a global row -- update_event_cache and the
+backfill, through sync_event_cache, or an ORM write, in this process or
+another -- moves along with it. The next read rebuilds the snapshot and
+swaps it in whole, so readers only ever see one complete snapshot or the
+next.
+"""
+import math
+import threading
+from bisect import bisect_left, bisect_right
+
+from . import calendar_generations
+from ..models import VisibleEvent
+from ..models.visible_event import GLOBAL_VIEWER_ID
+from ..utils.date_annotations import annotations_for
+
+_snapshot = None
+_build_lock = threading.Lock()
+
+
+class GlobalEventSnapshot:
+    """Global events as parallel tuples sorted by (date, event id): `keys`
+    those pairs, for bisect, and `events` the API dicts
+    (VisibleEvent.to_dict plus the date's annotations). Never mutated once
+    built."""
+    __slots__ = ('generation', 'keys', 'events')
+
+    def __init__(self, generation, keys, events):
+        self.generation = generation
+        self.keys = keys
+        self.events = events
+
+    def between(self, start_date, end_date=None, after=None):
+        """The events dated start_date..end_date inclusive, as (key, event)
+        pairs in key order, past the `after` key if one is given."""
+        lo = bisect_left(self.keys, (start_date,))
+        if after:
+            lo = max(lo, bisect_right(self.keys, after))
+        hi = bisect_right(self.keys, (end_date, math.inf)) if end_date else len(self.keys)
+        return ((self.keys[i], self.events[i]) for i in range(lo, hi))
+
+
+def event_dict(row):
+    """API dict for a VisibleEvent row, as get_calendar_events returns it:
+    to_dict plus the per-day annotations (see date_annotations)."""
+    result = row.to_dict()
+    result.update(annotations_for(row.date))
+    return result
+
+
+def get_snapshot():
+    """The snapshot for the current generation, building it on first use
+    after a bump. Needs an app context."""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.generation == calendar_generations.current_global():
+        return snapshot
+    with _build_lock:
+        # Read before querying: a bump that lands mid-build leaves this
+        # snapshot already stale, so the next read rebuilds again.
+        generation = calendar_generations.current_global()
+        if _snapshot is not None and _snapshot.generation == generation:
+            return _snapshot
+        rows = VisibleEvent.query.filter_by(viewer_id=GLOBAL_VIEWER_ID) \
+            .order_by(VisibleEvent.date, VisibleEvent.event_id).all()
+        _snapshot = GlobalEventSnapshot(
+            generation,
+            tuple((row.date, row.event_id) for row in rows),
+            tuple(event_dict(row) for row in rows),
+        )
+        return _snapshot
+
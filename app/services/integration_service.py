@@ -1,14 +1,48 @@
+import heapq
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import itemgetter
 from flask_login import current_user
-from .calendar_aggregator import CalendarAggregator, format_event
+from . import global_event_snapshot
+from .calendar_aggregator import CalendarAggregator, event_cache_row, format_event
 from .open_weather import OpenWeatherAPI
 from .schedules_manager import SchedulesManager
-from ..utils.ancient_egyptian_calendar import to_ancient_egyptian_date, format_ancient_egyptian_date
 from ..utils.config import config
+from ..utils.date_annotations import ANNOTATIONS
 from ..utils.logging_setup import get_logger
 
 logger = get_logger('integration_service')
 
+# Rows fetched per round trip while streaming a user's own calendar rows,
+# or looking up details for a run of events.
+EVENT_BATCH_SIZE = 500
+
+# What each calendar event carries by default -- its own columns and the
+# per-day annotations -- and what `fields=` may ask for: those plus
+# 'details', EventCache's deferred structured metadata.
+EVENT_FIELDS = ('id', 'title', 'start_time', 'description', 'location', 'sources') + tuple(ANNOTATIONS)
+SELECTABLE_EVENT_FIELDS = EVENT_FIELDS + ('details',)
+
+def _select_fields(events, fields):
+    """New dicts holding just `fields` of each event. Details are read
+    from EventCache -- the only place they're stored -- for a batch of
+    events at a time, and only when asked for."""
+    from ..models import EventCache
+
+    if 'details' not in fields:
+        for event in events:
+            yield {field: event[field] for field in fields}
+        return
+    while True:
+        batch = list(islice(events, EVENT_BATCH_SIZE))
+        if not batch:
+            return
+        details = dict(EventCache.query.filter(EventCache.id.in_([event['id'] for event in batch]))
+                       .with_entities(EventCache.id, EventCache.details))
+        for event in batch:
+            yield {field: details.get(event['id']) if field == 'details' else event[field] for field in fields}
+
+
 class IntegrationService:
     def __init__(self):
         self.weather_api = OpenWeatherAPI()
@@ -53,7 +87,7 @@ class IntegrationService:
             logger.error(f"Error getting current schedule: {str(e)}", exc_info=True)
             raise Exception(f"Error getting current schedule: {str(e)}")
 
-    def get_calendar_events(self, start_date=None, end_date=None, user=None):
+    def get_calendar_events(self, start_date=None, end_date=None, user=None, fields=None):
         """Get calendar events for the specified date range from the cache.
 
         Reads from EventCache rather than the live holiday/religious-calendar
@@ -75,7 +109,10 @@ class IntegrationService:
         interacted with that place, noisier than the other calendar sources
         here, which are all universally relevant). Never another user's
         custom-calendar rows, and never another user's private view of an
-        entity they don't have access to.
+        entity they don't have access to. Those rules are applied when rows
+        are written, into the VisibleEvent projection of EventCache, which is
+        what this actually reads -- the global rows by way of the
+        in-process GlobalEventSnapshot.
 
         `user` defaults to the logged-in current_user, for the normal
         request path (the dashboard's /api/calendar/events). The
@@ -88,59 +125,104 @@ class IntegrationService:
         computed for whatever date the event actually falls on (not just
         "today"), so it's visible across the day/week/month/year views this
         method already serves rather than being a separate "today only"
-        display.
+        display. It's looked up per date (date_annotations), not worked out
+        again for each event.
+
+        `fields` picks which keys each dict has (SELECTABLE_EVENT_FIELDS),
+        EVENT_FIELDS by default -- a month grid needs only id, title,
+        start_time and sources.
+
+        Events come in (date, id) order; iter_calendar_events yields the
+        same events one at a time, a page at a time if asked.
         """
-        from ..models import Entity, EventCache, db
+        try:
+            return list(self.iter_calendar_events(start_date, end_date, user, fields=fields))
+        except Exception as e:
+            return []  # Return empty list on error instead of raising
+
+    def iter_calendar_events(self, start_date=None, end_date=None, user=None, after=None, limit=None,
+                             fields=None):
+        """get_calendar_events as a generator, for keyset pagination and
+        streaming: events in (date, id) order, starting past `after` -- the
+        (date, id) of the last event already handed out -- and stopping after
+        `limit` of them. Neither side of the merge is read further than
+        needed, so memory stays flat however long the range. Errors
+        propagate."""
+        from ..models import VisibleEvent, db
 
         if user is None:
             user = current_user
 
-        try:
-            if not start_date:
-                start_date = datetime.now()
+        if not start_date:
+            start_date = datetime.now()
+        # The dashboard sends UTC ISO strings. Cached dates are naive,
+        # and were always compared as stored, ignoring the offset.
+        start_date = start_date.replace(tzinfo=None)
+        if end_date:
+            end_date = end_date.replace(tzinfo=None)
 
-            visible_entity_ids = Entity.query.filter(
-                db.or_(
-                    Entity.user_id == user.id,
-                    Entity.shared_with.contains([user.id])
-                )
-            ).with_entities(Entity.id)
-
-            query = EventCache.query.filter(
-                EventCache.date >= start_date,
-                db.or_(
-                    db.and_(EventCache.user_id.is_(None), EventCache.entity_id.is_(None)),
-                    EventCache.user_id == user.id,
-                    EventCache.entity_id.in_(visible_entity_ids)
-                )
-            )
-            if end_date:
-                query = query.filter(EventCache.date <= end_date)
-
-            events = []
-            for event in query.order_by(EventCache.date).all():
-                event_dict = event.to_dict()
-                event_dict['ancient_egyptian_date'] = format_ancient_egyptian_date(
-                    to_ancient_egyptian_date(event.date)
-                )
-                events.append(event_dict)
-            return events
-        except Exception as e:
-            return []  # Return empty list on error instead of raising
+        # Who-sees-what is resolved on write, into VisibleEvent. The
+        # global rows come from the in-process snapshot (see
+        # global_event_snapshot); only the user's own are read here.
+        query = VisibleEvent.query.filter(
+            VisibleEvent.viewer_id == user.id,
+            VisibleEvent.date >= start_date,
+        )
+        if end_date:
+            query = query.filter(VisibleEvent.date <= end_date)
+        if after:
+            after_date, after_id = after
+            query = query.filter(db.or_(
+                VisibleEvent.date > after_date,
+                db.and_(VisibleEvent.date == after_date, VisibleEvent.event_id > after_id),
+            ))
+        own_events = (
+            ((row.date, row.event_id), global_event_snapshot.event_dict(row))
+            for row in query.order_by(VisibleEvent.date, VisibleEvent.event_id).yield_per(EVENT_BATCH_SIZE)
+        )
+        global_events = global_event_snapshot.get_snapshot().between(start_date, end_date, after)
+        events = (event for _, event in heapq.merge(global_events, own_events, key=itemgetter(0)))
+        if limit is not None:
+            events = islice(events, limit)
+        # Always new dicts, so callers can't alter the shared snapshot.
+        return _select_fields(events, fields or EVENT_FIELDS)
 
-    def fetch_live_calendar_events(self, start_date=None, end_date=None):
+    def fetch_live_calendar_events(self, start_date=None, end_date=None, as_cache_rows=False, failed_sources=None,
+                                   sources=None):
         """Fetch calendar events directly from the live upstream APIs (Nager,
         Inadiutorium, Hijri) via CalendarAggregator, bypassing the cache.
 
         Used only by the update_event_cache background job to refresh
         EventCache -- request handlers should use get_calendar_events instead,
         which reads the cache that this method's caller populates.
+
+        A range spanning several years is fetched in a single concurrent
+        fan-out (CalendarAggregator.get_events_for_years) rather than one
+        full refresh per year.
+
+        With as_cache_rows=True, returns typed EventCache column mappings
+        (see event_cache_row) instead of the formatted API dicts, for the
+        caller that writes them straight into the cache.
+
+        Any failure normally returns []. With `failed_sources` (a set), a
+        source that fails is skipped and named in the set while the rest are
+        still returned, and any other error is raised -- so the caller can
+        tell a failed fetch from a genuinely empty one and keep the cached
+        rows it has.
+
+        `sources` limits the fetch to those (source, year) pairs -- see
+        CalendarAggregator.get_events_for_years.
         """
         try:
             if not start_date:
                 start_date = datetime.now()
-            # Get events for the current year
-            events = self.calendar_aggregator.get_events(start_date.year)
+            years = list(range(start_date.year, end_date.year + 1)) if end_date else [start_date.year]
+            if len(years) == 1:
+                events = self.calendar_aggregator.get_events(years[0], failed_sources=failed_sources,
+                                                             sources=sources)
+            else:
+                events = self.calendar_aggregator.get_events_for_years(years, failed_sources=failed_sources,
+                                                                       sources=sources)
             # Filter events by date range if end_date is specified
             if end_date:
                 events = [e for e in events if start_date <= e.date <= end_date]
@@ -151,15 +233,18 @@ class IntegrationService:
             if not isinstance(events, list):
                 return []
 
+            convert = event_cache_row if as_cache_rows else format_event
             formatted_events = []
             for event in events:
                 try:
-                    formatted_events.append(format_event(event))
+                    formatted_events.append(convert(event))
                 except Exception as e:
                     continue  # Skip events that can't be formatted
 
             return formatted_events
         except Exception as e:
+            if failed_sources is not None:
+                raise
             return []  # Return empty list on error instead of raising
 
     def get_dashboard_data(self, city=None):
@@ -10,12 +10,16 @@ from datetime import datetime
 
 import requests
 
+from ..utils import http_client
 from ..utils.config import config
 from ..utils.logging_setup import get_logger
 
 logger = get_logger('mustermeister_client')
 
 REQUEST_TIMEOUT_SECONDS = 15
+# Generous for a poll every few hours; over budget, the refresh fails like
+# an outage and the cached tasks stay as they are.
+RATE_LIMIT = http_client.RateLimit(max_requests=30, window_seconds=3600, max_concurrency=1)
 
 # The only tool that returns the full open-task set in one call -- the
 # others are each scoped to a subset (overdue-only, high-priority-only,
@@ -84,8 +88,8 @@ def fetch_open_tasks():
     params.append(('limit', config.MUSTERMEISTER_TASK_LIMIT))
 
     try:
-        response = requests.get(
-            url, headers=_auth_headers(), params=params, timeout=REQUEST_TIMEOUT_SECONDS
+        response = http_client.get(
+            url, headers=_auth_headers(), params=params, timeout=REQUEST_TIMEOUT_SECONDS, rate_limit=RATE_LIMIT
         )
     except requests.exceptions.RequestException as e:
         raise MustermeisterClientError(f'Request to Mustermeister failed: {e}') from e
@@ -1,10 +1,17 @@
 import requests
 from flask import current_app
+from ..utils import http_client
 from ..utils.config import config
 from ..utils.logging_setup import get_logger
 
 logger = get_logger('ollama_service')
 
+# Generation can legitimately take minutes on a large prompt/model -- same
+# ceiling as extensions.llm.LLM.DEFAULT_TIMEOUT. The connection check only
+# needs to know whether the server answers at all.
+QUERY_TIMEOUT_SECONDS = 180
+CONNECTION_CHECK_TIMEOUT_SECONDS = 5
+
 class OllamaService:
     def __init__(self):
         self.base_url = config.OLLAMA_BASE_URL
@@ -13,13 +20,14 @@ class OllamaService:
     def query(self, prompt, model=None):
         """Send a query to Ollama's API and return the response"""
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": model or self.model,
                     "prompt": prompt,
                     "stream": False
-                }
+                },
+                timeout=QUERY_TIMEOUT_SECONDS
             )
             response.raise_for_status()
             return response.json()['response']
@@ -30,7 +38,7 @@ class OllamaService:
     def check_connection(self):
         """Check if Ollama service is available"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = http_client.get(f"{self.base_url}/api/tags", timeout=CONNECTION_CHECK_TIMEOUT_SECONDS)
             return response.status_code == 200
         except requests.exceptions.RequestException as e:
             logger.error(f"Error checking Ollama connection: {e}")
@@ -1,6 +1,6 @@
 from datetime import datetime
-import requests
 
+from ..utils import http_client
 from ..utils.config import config
 
 
@@ -122,7 +122,7 @@ class OpenWeatherAPI:
 
     def get_coordinates(self, city=config.open_weather_city):
         url = f"{self.GEO_ENDPOINT}?q={city}&limit=3&appid={self.api_key}"
-        response = requests.get(url, timeout=self.REQUEST_TIMEOUT_SECONDS)
+        response = http_client.get(url, timeout=self.REQUEST_TIMEOUT_SECONDS)
         resp_json = response.json()[0]
         return float(resp_json["lat"]), float(resp_json["lon"])
 
@@ -130,10 +130,10 @@ class OpenWeatherAPI:
         lat, lon = self.get_coordinates(city)
 
         current_weather_url = f"{self.WEATHER_ENDPOINT}?lat={lat}&lon={lon}&appid={self.api_key}&units=imperial"
-        current_weather_response = requests.get(current_weather_url, timeout=self.REQUEST_TIMEOUT_SECONDS)
+        current_weather_response = http_client.get(current_weather_url, timeout=self.REQUEST_TIMEOUT_SECONDS)
 
         hourly_forecast_url = f"{self.HOURLY_FORECAST_ENDPOINT}?lat={lat}&lon={lon}&appid={self.api_key}&units=imperial"
-        hourly_forecast_response = requests.get(hourly_forecast_url, timeout=self.REQUEST_TIMEOUT_SECONDS)
+        hourly_forecast_response = http_client.get(hourly_forecast_url, timeout=self.REQUEST_TIMEOUT_SECONDS)
 
         weather = OpenWeatherResponse(current_weather_response.json(), hourly_forecast_response.json())
         return weather
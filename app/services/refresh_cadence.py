@@ -0,0 +1,72 @@
+"""How often update_event_cache re-fetches each live calendar source, per year.
+
+The job runs every EVENT_CACHE_UPDATE_INTERVAL hours, and used to fetch
+every live source (Nager, Hijri, Launch Library) for both years each time,
+whether or not anything had changed upstream. Each (source, year) now keeps
+its own interval in SourceRefresh, adapted to how often its data actually
+changes:
+
+  - after a fetch whose rows fingerprint the same as last time, the
+    interval grows by EVENT_REFRESH_BACKOFF_FACTOR, up to
+    EVENT_REFRESH_MAX_INTERVAL_HOURS;
+  - after a fetch that changed anything, it drops back to the minimum;
+  - the minimum is EVENT_CACHE_UPDATE_INTERVAL for the current year, and
+    EVENT_REFRESH_FAR_YEAR_FACTOR times that per year further ahead.
+
+So Launch Library, which changes between most runs, stays on every run,
+while next year's public holidays settle at a refresh every few weeks. A
+run fetches only the (source, year) pairs that are due. Stored intervals
+are clamped to the current bounds when read, so a year rolling over or a
+config change takes effect at once.
+"""
+from datetime import timedelta
+
+from ..models import CalendarMaterialization, SourceRefresh, db
+from ..utils.config import config
+
+
+def min_interval_hours(year, current_year):
+    return config.EVENT_CACHE_UPDATE_INTERVAL * config.EVENT_REFRESH_FAR_YEAR_FACTOR ** max(0, year - current_year)
+
+
+def _clamped(interval_hours, year, current_year):
+    return min(max(interval_hours, min_interval_hours(year, current_year)),
+               max(config.EVENT_REFRESH_MAX_INTERVAL_HOURS, min_interval_hours(year, current_year)))
+
+
+def due(sources, years, now):
+    """The (source, year) pairs of `sources` x `years` to fetch at `now`.
+    A pair counts as due up to half a job interval early, so a refresh
+    landing a little after its run started isn't pushed a whole run back."""
+    current_year = min(years)
+    slack = timedelta(hours=config.EVENT_CACHE_UPDATE_INTERVAL / 2)
+    refreshes = {
+        (row.source, row.year): row
+        for row in SourceRefresh.query.filter(SourceRefresh.source.in_(list(sources)),
+                                              SourceRefresh.year.in_(list(years)))
+    }
+    pairs = set()
+    for source in sources:
+        for year in years:
+            refresh = refreshes.get((source, year))
+            if refresh is None or refresh.refreshed_at + timedelta(
+                    hours=_clamped(refresh.interval_hours, year, current_year)) <= now + slack:
+                pairs.add((source, year))
+    return pairs
+
+
+def record(source, year, rows, now, current_year):
+    """Note that `source`'s rows for `year` were refreshed to `rows` at
+    `now`, and set when it's next due. Returns whether they changed since
+    the last refresh. The caller commits."""
+    fingerprint = CalendarMaterialization.fingerprint_of(
+        sorted(rows, key=lambda row: (row['date'], row['title'], row['description'] or '')))
+    refresh = db.session.get(SourceRefresh, (source, year))
+    changed = refresh is None or refresh.fingerprint != fingerprint
+    if changed:
+        interval_hours = min_interval_hours(year, current_year)
+    else:
+        interval_hours = _clamped(refresh.interval_hours * config.EVENT_REFRESH_BACKOFF_FACTOR, year, current_year)
+    db.session.merge(SourceRefresh(source=source, year=year, fingerprint=fingerprint,
+                                   interval_hours=interval_hours, refreshed_at=now))
+    return changed
@@ -180,7 +180,7 @@ def _entity_candidates(user, now):
         db.or_(
             Entity.user_id == user.id,
             Entity.is_public == True,
-            Entity.shared_with.contains([user.id])
+            Entity.shared_with_user(user.id)
         )
     ).all()
 
@@ -1,18 +1,21 @@
+import time
 from datetime import datetime
 from ..models import (
-    Activity, BriefKorbMessageCache, DefaultEventDescriptor, Entity, EventCache,
+    Activity, BriefKorbMessageCache, CalendarMaterialization, DefaultEventDescriptor, Entity, EventCache,
     MustermeisterTaskCache, User, UserCalendarDescriptor, db,
 )
 from ..services.activity_service import infer_activity_importance
 from ..services.integration_service import integration_service
-from ..services.calendar_aggregator import format_event
+from ..services.calendar_aggregator import event_cache_row
 from ..services.custom_calendar_service import (
-    parse_descriptor, regenerate_event_cache_for_user, DescriptorValidationError
+    CUSTOM_CALENDAR_SOURCE, descriptor_entries, regenerate_event_cache_for_user, DescriptorValidationError
 )
-from ..services.entity_calendar_service import regenerate_event_cache_for_entity
-from ..services.default_event_service import regenerate_event_cache_for_user_default_events
-from ..services import briefkorb_client, mustermeister_client
+from ..services.entity_calendar_service import ENTITY_CALENDAR_SOURCE, regenerate_event_cache_for_entity
+from ..services.event_cache_sync import apply_event_cache_sync, plan_event_cache_sync, sync_event_cache
+from ..services.default_event_service import DEFAULT_EVENT_SOURCE, regenerate_event_cache_for_user_default_events
+from ..services import briefkorb_client, mustermeister_client, refresh_cadence
 from ..services.suggestion_queue_service import refresh_queue_for_user
+from ..utils import http_client
 from ..utils.config import config
 from ..utils.logging_setup import get_logger
 from ..services.backup_service import get_backup_service
@@ -57,44 +60,116 @@ def update_activity_importance(app):
             logger.error(f"Error updating activity importance: {e}")
             db.session.rollback()
 
+def _live_calendar_sources():
+    """Source-name -> API client mapping for the live calendar sources
+    update_event_cache refreshes (see CalendarAggregator.get_events_for_years),
+    each on its own cadence per year -- see refresh_cadence."""
+    aggregator = integration_service.calendar_aggregator
+    return {client.SOURCE: client
+            for client in (aggregator.public_holidays_api, aggregator.hijri_calendar_api,
+                           aggregator.launch_library_api)}
+
+
+def _refresh_live_calendar_events(years):
+    """Fetch the live sources whose refresh is due for `years` and sync
+    their global EventCache rows."""
+    now = datetime.utcnow()
+    due = refresh_cadence.due(list(_live_calendar_sources()), years, now)
+    skipped = len(_live_calendar_sources()) * len(years) - len(due)
+    if not due:
+        logger.info(f"No live calendar source due for a refresh ({skipped} not due)")
+        return
+    # Launch Library's one rolling-window fetch covers every year (see
+    # get_events_for_years), so once it's due for one year, all of them are
+    # refreshed from it.
+    launch_library = integration_service.calendar_aggregator.launch_library_api.SOURCE
+    if any(source == launch_library for source, _ in due):
+        skipped -= len({(launch_library, year) for year in years} - due)
+        due |= {(launch_library, year) for year in years}
+
+    # Get fresh events for the due sources and years from the live APIs
+    # (get_calendar_events reads this cache rather than fetching live --
+    # see integration_service) in one concurrent fetch covering both
+    # years, then split them back out per year below. The request scope
+    # sends identical upstream requests only once (e.g. Launch Library's
+    # rolling window, which is the same for both years). A source that
+    # can't be fetched -- or could only be served from a stale cached
+    # response (see http_cache) -- is named in failed_sources and left out
+    # of the sync below, so its rows stay as the last good refresh left
+    # them rather than being deleted, and its refresh cadence isn't backed
+    # off as if the upstream had answered with unchanged data.
+    failed_sources = set()
+    with http_client.request_scope():
+        rows = integration_service.fetch_live_calendar_events(
+            start_date=datetime(min(years), 1, 1),
+            end_date=datetime(max(years), 12, 31),
+            as_cache_rows=True,
+            failed_sources=failed_sources,
+            sources=due,
+        )
+    if failed_sources:
+        logger.warning(f"Keeping last good event cache rows for {', '.join(sorted(failed_sources))}")
+    refreshed = {(source, year) for source, year in due if source not in failed_sources}
+
+    # Both years are diffed first and written together in one short
+    # transaction (see event_cache_sync), so readers see the previous
+    # refresh until the new one commits, all at once.
+    plans = {}
+    refreshed_rows = []
+    for year in years:
+        # Sync the global cache for this year -- user_id=None AND
+        # entity_id=None scopes this to the global/public rows only.
+        # Per-user custom calendar rows and per-entity calendar rows (both
+        # refreshed separately) also have user_id NULL in the entity case,
+        # so entity_id=None is required here too, or this would wipe out
+        # entity calendar rows every run. Also excludes computed-calendar
+        # sources (Hebcal/USNO/Nobel Prize/Inadiutorium) -- those are
+        # refreshed only by backfill_computed_calendar_events, and
+        # fetch_live_calendar_events never returns them, so syncing them
+        # here would delete them until the next backfill run without ever
+        # reinserting them. Live sources not refreshed this run (not due,
+        # or failed) are left alone the same way.
+        kept = [*_computed_calendar_sources(),
+                *(source for source in _live_calendar_sources() if (source, year) not in refreshed)]
+        scope = EventCache.query.filter_by(year=year, user_id=None, entity_id=None) \
+            .filter(EventCache.source.notin_(kept))
+        year_rows = [row for row in rows if row['year'] == year and (row['source'], year) in refreshed]
+        plans[year] = plan_event_cache_sync(scope, year_rows)
+        refreshed_rows.extend((source, year, [row for row in year_rows if row['source'] == source])
+                              for source, refreshed_year in sorted(refreshed) if refreshed_year == year)
+
+    # Recorded only now that every year is planned: the session flushes
+    # these on its next query, and the first write must not come before
+    # the last read.
+    started = time.perf_counter()
+    changed = [f"{source} {year}" for source, year, source_rows in refreshed_rows
+               if refresh_cadence.record(source, year, source_rows, now, min(years))]
+    for plan in plans.values():
+        apply_event_cache_sync(plan)
+    db.session.commit()
+    write_ms = (time.perf_counter() - started) * 1000
+    for year, plan in plans.items():
+        result = plan.result
+        logger.info(f"Updated event cache for year {year}: {result.inserted} inserted, "
+                    f"{result.updated} updated, {result.deleted} deleted, {result.unchanged} unchanged")
+    logger.info(f"Live calendar sources: {len(refreshed)} refreshed ({len(changed)} changed"
+                f"{': ' + ', '.join(changed) if changed else ''}), {skipped} not due, "
+                f"{len(due) - len(refreshed)} failed")
+    logger.info(f"Event cache refresh written and committed in {write_ms:.0f} ms")
+
+
 def update_event_cache(app):
     """Background job to update the event cache"""
     with app.app_context():
         current_year = datetime.now().year
+        # The per-user and per-entity sources below are regenerated only
+        # when their input (fingerprinted -- see CalendarMaterialization) or
+        # the year window has changed since the last successful run, and
+        # the live sources are fetched only once their refresh is due (see
+        # refresh_cadence), so a run over unchanged data is mostly reads.
+        years = [current_year, current_year + 1]
         try:
-            # Get events for current and next year
-            for year in [current_year, current_year + 1]:
-                # Get fresh events from the live APIs (get_calendar_events reads
-                # this cache rather than fetching live -- see integration_service)
-                events = integration_service.fetch_live_calendar_events(
-                    start_date=datetime(year, 1, 1),
-                    end_date=datetime(year, 12, 31)
-                )
-
-                # Delete existing global cache for this year -- user_id=None
-                # AND entity_id=None scopes this to the global/public rows
-                # only. Per-user custom calendar rows and per-entity calendar
-                # rows (both refreshed separately below) also have user_id
-                # NULL in the entity case, so entity_id=None is required here
-                # too, or this would wipe out entity calendar rows every run.
-                # Also excludes computed-calendar sources (Hebcal/USNO/Nobel
-                # Prize/Inadiutorium) -- those are refreshed only by
-                # backfill_computed_calendar_events, and fetch_live_calendar_events
-                # never returns them, so deleting them here would wipe them
-                # out until the next backfill run without ever reinserting
-                # them.
-                EventCache.query.filter_by(year=year, user_id=None, entity_id=None) \
-                    .filter(EventCache.source.notin_(list(_computed_calendar_sources().keys()))) \
-                    .delete(synchronize_session=False)
-
-                # Add new events to cache
-                for event_dict in events:
-                    cache_entry = EventCache.from_event_dict(event_dict)
-                    db.session.add(cache_entry)
-
-                db.session.commit()
-                logger.info(f"Updated event cache for year {year}")
-
+            _refresh_live_calendar_events(years)
         except Exception as e:
             logger.error(f"Error updating event cache: {str(e)}")
             db.session.rollback()
@@ -102,36 +177,65 @@ def update_event_cache(app):
         # Refresh each user's custom calendar independently -- a parse
         # failure for one user's descriptor must not prevent other users'
         # descriptors (or the global cache above) from refreshing.
+        counts = {'regenerated': 0, 'skipped': 0, 'failed': 0}
         for descriptor in UserCalendarDescriptor.query.all():
             try:
-                entries = parse_descriptor(descriptor.raw_yaml)
-                regenerate_event_cache_for_user(descriptor.user_id, entries, years=[current_year, current_year + 1])
+                fingerprint = CalendarMaterialization.fingerprint_of(descriptor.raw_yaml)
+                if CalendarMaterialization.is_current(CUSTOM_CALENDAR_SOURCE, descriptor.user_id, fingerprint, years):
+                    counts['skipped'] += 1
+                    continue
+                entries = descriptor_entries(descriptor)
+                regenerate_event_cache_for_user(descriptor.user_id, entries, years=years)
                 if descriptor.last_parse_error is not None:
                     descriptor.last_parse_error = None
-                    db.session.commit()
+                CalendarMaterialization.record(CUSTOM_CALENDAR_SOURCE, descriptor.user_id, fingerprint, years)
+                db.session.commit()
+                counts['regenerated'] += 1
             except DescriptorValidationError as e:
                 logger.error(f"Error parsing custom calendar for user {descriptor.user_id}: {e}")
                 descriptor.last_parse_error = str(e)
                 db.session.commit()
+                counts['failed'] += 1
             except Exception as e:
                 logger.error(f"Error refreshing custom calendar for user {descriptor.user_id}: {e}")
                 db.session.rollback()
+                counts['failed'] += 1
+        logger.info(f"Custom calendars: {counts['regenerated']} regenerated, {counts['skipped']} unchanged, "
+                    f"{counts['failed']} failed")
 
         # Refresh each entity's calendar independently -- same reasoning as
         # the per-user loop above: one entity's data shouldn't block others.
-        entities_with_calendars = Entity.query.filter(Entity.calendar_entries.isnot(None)).all()
-        for entity in entities_with_calendars:
+        # Ids and entries are read up front, for the same reason as the
+        # subscriptions below.
+        entities_with_calendars = [
+            (entity.id, entity.get_calendar_entries())
+            for entity in Entity.query.filter(Entity.calendar_entries.isnot(None)).all()
+        ]
+        counts = {'regenerated': 0, 'skipped': 0, 'failed': 0}
+        for entity_id, calendar_entries in entities_with_calendars:
             try:
-                regenerate_event_cache_for_entity(entity, years=[current_year, current_year + 1])
+                fingerprint = CalendarMaterialization.fingerprint_of(calendar_entries)
+                if CalendarMaterialization.is_current(ENTITY_CALENDAR_SOURCE, entity_id, fingerprint, years):
+                    counts['skipped'] += 1
+                    continue
+                regenerate_event_cache_for_entity(db.session.get(Entity, entity_id), years=years)
+                CalendarMaterialization.record(ENTITY_CALENDAR_SOURCE, entity_id, fingerprint, years)
+                db.session.commit()
+                counts['regenerated'] += 1
             except Exception as e:
-                logger.error(f"Error refreshing calendar for entity {entity.id}: {e}")
+                logger.error(f"Error refreshing calendar for entity {entity_id}: {e}")
                 db.session.rollback()
+                counts['failed'] += 1
+        logger.info(f"Entity calendars: {counts['regenerated']} regenerated, {counts['skipped']} unchanged, "
+                    f"{counts['failed']} failed")
 
         # Refresh each user's subscribed Default Events (the app-wide
         # catalog, e.g. Kentucky Derby) independently -- same reasoning as
         # the two loops above. Skipped entirely for a user with no
         # subscriptions, so this is a no-op until someone opts into
-        # anything on the settings page.
+        # anything on the settings page. A user's fingerprint covers the
+        # catalog rows they subscribe to, so editing one regenerates just
+        # its subscribers.
         #
         # Reads (id, subscribed_ids) into plain tuples up front, before the
         # loop runs, rather than keeping the User ORM objects themselves and
@@ -141,26 +245,43 @@ def update_event_cache(app):
         # user.preferences access would otherwise force an implicit reload
         # of an already-expired instance. Plain tuples sidestep that
         # entirely, since nothing after this point touches a User attribute.
-        if DefaultEventDescriptor.query.count():
+        catalog = {
+            descriptor.id: (descriptor.title, descriptor.recurrence, descriptor.recurrence_params,
+                            descriptor.description, descriptor.location)
+            for descriptor in DefaultEventDescriptor.query.all()
+        }
+        if catalog:
             users_with_subscriptions = [
                 (user.id, (user.preferences or {}).get('subscribed_default_events') or [])
                 for user in User.query.all()
             ]
+            counts = {'regenerated': 0, 'skipped': 0, 'failed': 0}
             for user_id, subscribed_ids in users_with_subscriptions:
                 if not subscribed_ids:
                     continue
                 try:
-                    regenerate_event_cache_for_user_default_events(
-                        user_id, subscribed_ids, years=[current_year, current_year + 1]
+                    fingerprint = CalendarMaterialization.fingerprint_of(
+                        [(descriptor_id, catalog.get(descriptor_id)) for descriptor_id in sorted(set(subscribed_ids))]
                     )
+                    if CalendarMaterialization.is_current(DEFAULT_EVENT_SOURCE, user_id, fingerprint, years):
+                        counts['skipped'] += 1
+                        continue
+                    regenerate_event_cache_for_user_default_events(user_id, subscribed_ids, years=years)
+                    CalendarMaterialization.record(DEFAULT_EVENT_SOURCE, user_id, fingerprint, years)
+                    db.session.commit()
+                    counts['regenerated'] += 1
                 except Exception as e:
                     logger.error(f"Error refreshing default events for user {user_id}: {e}")
                     db.session.rollback()
+                    counts['failed'] += 1
+            logger.info(f"Default Events: {counts['regenerated']} regenerated, {counts['skipped']} unchanged, "
+                        f"{counts['failed']} failed")
 
 def backfill_computed_calendar_events(app):
     """Background job to backfill computed/deterministic calendar sources
-    (Hebrew via Hebcal; equinoxes/solstices/eclipses/moon phases via USNO;
-    the curated Nobel Prize schedule; the Roman Catholic liturgical calendar
+    (Hebrew, computed locally or via Hebcal; equinoxes/solstices/eclipses/
+    moon phases, computed locally or via USNO; the curated Nobel Prize
+    schedule; the Roman Catholic liturgical calendar, generated locally or
     via Inadiutorium; Coptic, once added) a wide horizon ahead.
 
     Unlike update_event_cache's sources (Nager, Hijri, Launch Library),
@@ -171,7 +292,7 @@ def backfill_computed_calendar_events(app):
     happens once (an effective one-time backfill) and roughly once a year
     after that, to extend the tail.
     """
-    with app.app_context():
+    with app.app_context(), http_client.request_scope():
         current_year = datetime.now().year
         target_years = set(range(current_year, current_year + COMPUTED_CALENDAR_BACKFILL_YEARS))
 
@@ -189,11 +310,11 @@ def backfill_computed_calendar_events(app):
             for year in missing_years:
                 try:
                     events = api.get_events(year)
-                    # Defensive: clear any partial rows from a previously
-                    # interrupted backfill of this year before reinserting.
-                    EventCache.query.filter_by(source=source_name, year=year).delete()
-                    for event in events:
-                        db.session.add(EventCache.from_event_dict(format_event(event)))
+                    # Syncing rather than inserting also reconciles any
+                    # partial rows from a previously interrupted backfill
+                    # of this year.
+                    sync_event_cache(EventCache.query.filter_by(source=source_name, year=year),
+                                     [event_cache_row(event) for event in events])
                     db.session.commit()
                     logger.info(f"Backfilled {source_name} events for year {year}")
                 except Exception as e:
@@ -0,0 +1,326 @@
+"""Equinoxes, solstices, perihelion/aphelion, moon phases and solar eclipses
+computed in-process, in the same item shapes the USNO Astronomical
+Applications API returns.
+
+Everything here follows Jean Meeus, "Astronomical Algorithms" (2nd ed.):
+equinoxes/solstices from chapter 27 (mean instant plus the 24-term periodic
+correction), perihelion/aphelion from chapter 38, moon phases from chapter
+49 and solar eclipses from chapter 54. Equinoxes, solstices and moon phases
+land within a minute or two of USNO across 1000-3000 CE, and eclipse
+dates/types match the published canon. Perihelion/aphelion are the
+exception: Earth's apsides are smeared by the Moon's pull, and Meeus's
+correction terms only get the instant to within a few hours -- so on rare
+years whose apsis falls near midnight UT, the date can be a day off.
+
+All series are evaluated in Terrestrial (Dynamical) Time and converted to UT
+with the Espenak & Meeus polynomial for Delta T, so `time` fields line up
+with USNO's (which are UT, rounded to the minute).
+
+The per-event functions are plain arithmetic on a single lunation/year
+index, so a batch over many years is a straight loop with no shared state
+-- events_for_years() returns a whole year range in one call. (The same
+series vectorize directly over an array of k values; NumPy isn't a
+dependency of this app, and at a few hundred events per year it isn't
+needed.)
+"""
+
+import math
+from datetime import datetime, timedelta
+
+J2000 = 2451545.0
+J2000_DATETIME = datetime(2000, 1, 1, 12, 0)
+SYNODIC_MONTH = 29.530588861
+
+SEASON_MEAN_TERMS = {
+    # month: (phenom, JDE0 polynomial in Y = (year - 2000) / 1000)
+    3: ('Equinox', (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057)),
+    6: ('Solstice', (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030)),
+    9: ('Equinox', (2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078)),
+    12: ('Solstice', (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032)),
+}
+
+# Meeus Table 27.C: (A, B, C) for S = sum(A * cos(B + C*T)).
+SEASON_PERIODIC_TERMS = (
+    (485, 324.96, 1934.136), (203, 337.23, 32964.467), (199, 342.08, 20.186),
+    (182, 27.85, 445267.112), (156, 73.14, 45036.886), (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934), (74, 296.72, 3034.906), (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147), (52, 297.17, 150.678), (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562), (44, 325.15, 31555.956), (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328), (17, 288.79, 4562.452), (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921), (12, 95.39, 14577.848), (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259), (9, 227.73, 1222.114), (8, 15.45, 16859.074),
+)
+
+PHASE_NAMES = ('New Moon', 'First Quarter', 'Full Moon', 'Last Quarter')
+
+# Meeus 49: planetary arguments A2..A14 as (constant, rate per lunation,
+# coefficient), shared by all four phases. A1 also has a T^2 term, so it's
+# evaluated separately in phase_jde.
+PLANETARY_ARGUMENTS = (
+    (251.88, 0.016321, 0.000165), (251.83, 26.651886, 0.000164),
+    (349.42, 36.412478, 0.000126), (84.66, 18.206239, 0.000110), (141.74, 53.303771, 0.000062),
+    (207.14, 2.453732, 0.000060), (154.84, 7.306860, 0.000056), (34.52, 27.261239, 0.000047),
+    (207.19, 0.121824, 0.000042), (291.34, 1.844379, 0.000040), (161.72, 24.198154, 0.000037),
+    (239.56, 25.513099, 0.000035), (331.55, 3.592518, 0.000023),
+)
+
+
+def _sin(degrees):
+    return math.sin(math.radians(degrees))
+
+
+def _cos(degrees):
+    return math.cos(math.radians(degrees))
+
+
+def delta_t_seconds(year):
+    """TT - UT in seconds (Espenak & Meeus polynomial fits)."""
+    if 2005 <= year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t * t
+    if 1986 <= year < 2005:
+        t = year - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if 1961 <= year < 1986:
+        t = year - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    u = (year - 1820) / 100
+    if 2050 <= year < 2150:
+        return -20 + 32 * u * u - 0.5628 * (2150 - year)
+    return -20 + 32 * u * u
+
+
+def jde_to_datetime(jde):
+    """Julian Ephemeris Day (TT) -> naive UT datetime."""
+    tt = J2000_DATETIME + timedelta(days=jde - J2000)
+    return tt - timedelta(seconds=delta_t_seconds(tt.year))
+
+
+def _round_to_minute(moment):
+    return (moment + timedelta(seconds=30)).replace(second=0, microsecond=0)
+
+
+def _item(moment, key, value):
+    moment = _round_to_minute(moment)
+    return {
+        'year': moment.year, 'month': moment.month, 'day': moment.day,
+        key: value, 'time': moment.strftime('%H:%M'),
+    }
+
+
+# -- Seasons (Meeus 27) and perihelion/aphelion (Meeus 38) --
+
+def season_jde(year, month):
+    _, coefficients = SEASON_MEAN_TERMS[month]
+    y = (year - 2000) / 1000
+    jde0 = sum(c * y ** power for power, c in enumerate(coefficients))
+    t = (jde0 - J2000) / 36525
+    w = 35999.373 * t - 2.47
+    delta_lambda = 1 + 0.0334 * _cos(w) + 0.0007 * _cos(2 * w)
+    s = sum(a * _cos(b + c * t) for a, b, c in SEASON_PERIODIC_TERMS)
+    return jde0 + 0.00001 * s / delta_lambda
+
+
+def apsis_jde(year, aphelion=False):
+    """Earth's perihelion (or aphelion) in `year`, corrected for the
+    Earth-Moon barycenter offset -- without it the instant can be off by
+    more than a day."""
+    k = round(0.99997 * (year - 2000.01))
+    if aphelion:
+        k += 0.5
+    jde = 2451547.507 + 365.2596358 * k + 0.0000000156 * k * k
+    a1 = 328.41 + 132.788585 * k
+    a2 = 316.13 + 584.903153 * k
+    a3 = 346.20 + 450.380738 * k
+    a4 = 136.95 + 659.306737 * k
+    a5 = 249.52 + 329.653368 * k
+    if aphelion:
+        jde += -1.352 * _sin(a1) + 0.061 * _sin(a2) + 0.062 * _sin(a3) + 0.029 * _sin(a4) + 0.031 * _sin(a5)
+    else:
+        jde += 1.278 * _sin(a1) - 0.055 * _sin(a2) - 0.091 * _sin(a3) - 0.056 * _sin(a4) - 0.045 * _sin(a5)
+    return jde
+
+
+def seasons(year):
+    """USNO /seasons `data` items for `year`: both equinoxes, both
+    solstices, perihelion and aphelion, in date order."""
+    items = [_item(jde_to_datetime(season_jde(year, month)), 'phenom', phenom)
+             for month, (phenom, _) in SEASON_MEAN_TERMS.items()]
+    items.append(_item(jde_to_datetime(apsis_jde(year)), 'phenom', 'Perihelion'))
+    items.append(_item(jde_to_datetime(apsis_jde(year, aphelion=True)), 'phenom', 'Aphelion'))
+    items.sort(key=lambda item: (item['month'], item['day'], item['time']))
+    return items
+
+
+# -- Moon phases (Meeus 49) --
+
+def _lunar_arguments(k):
+    """Mean elements at lunation `k` (k = 0 is the new moon of 2000-01-06)."""
+    t = k / 1236.85
+    jde = (2451550.09766 + SYNODIC_MONTH * k + 0.00015437 * t ** 2
+           - 0.000000150 * t ** 3 + 0.00000000073 * t ** 4)
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    m = 2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3
+    mp = (201.5643 + 385.81693528 * k + 0.0107582 * t ** 2 + 0.00001238 * t ** 3
+          - 0.000000058 * t ** 4)
+    f = (160.7108 + 390.67050284 * k - 0.0016118 * t ** 2 - 0.00000227 * t ** 3
+         + 0.000000011 * t ** 4)
+    omega = 124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3
+    return t, jde, e, m, mp, f, omega
+
+
+def phase_jde(k):
+    """JDE of the phase at lunation index `k`, where the fractional part of
+    k selects the phase (.0 new, .25 first quarter, .5 full, .75 last)."""
+    t, jde, e, m, mp, f, omega = _lunar_arguments(k)
+    fraction = round((k % 1) * 4) % 4
+
+    if fraction in (0, 2):
+        new = fraction == 0
+        jde += ((-0.40720 if new else -0.40614) * _sin(mp)
+                + (0.17241 if new else 0.17302) * e * _sin(m)
+                + (0.01608 if new else 0.01614) * _sin(2 * mp)
+                + (0.01039 if new else 0.01043) * _sin(2 * f)
+                + (0.00739 if new else 0.00734) * e * _sin(mp - m)
+                + (-0.00514 if new else -0.00515) * e * _sin(mp + m)
+                + (0.00208 if new else 0.00209) * e * e * _sin(2 * m)
+                - 0.00111 * _sin(mp - 2 * f)
+                - 0.00057 * _sin(mp + 2 * f)
+                + 0.00056 * e * _sin(2 * mp + m)
+                - 0.00042 * _sin(3 * mp)
+                + 0.00042 * e * _sin(m + 2 * f)
+                + 0.00038 * e * _sin(m - 2 * f)
+                - 0.00024 * e * _sin(2 * mp - m)
+                - 0.00017 * _sin(omega)
+                - 0.00007 * _sin(mp + 2 * m)
+                + 0.00004 * _sin(2 * mp - 2 * f)
+                + 0.00004 * _sin(3 * m)
+                + 0.00003 * _sin(mp + m - 2 * f)
+                + 0.00003 * _sin(2 * mp + 2 * f)
+                - 0.00003 * _sin(mp + m + 2 * f)
+                + 0.00003 * _sin(mp - m + 2 * f)
+                - 0.00002 * _sin(mp - m - 2 * f)
+                - 0.00002 * _sin(3 * mp + m)
+                + 0.00002 * _sin(4 * mp))
+    else:
+        jde += (-0.62801 * _sin(mp)
+                + 0.17172 * e * _sin(m)
+                - 0.01183 * e * _sin(mp + m)
+                + 0.00862 * _sin(2 * mp)
+                + 0.00804 * _sin(2 * f)
+                + 0.00454 * e * _sin(mp - m)
+                + 0.00204 * e * e * _sin(2 * m)
+                - 0.00180 * _sin(mp - 2 * f)
+                - 0.00070 * _sin(mp + 2 * f)
+                - 0.00040 * _sin(3 * mp)
+                - 0.00034 * e * _sin(2 * mp - m)
+                + 0.00032 * e * _sin(m + 2 * f)
+                + 0.00032 * e * _sin(m - 2 * f)
+                - 0.00028 * e * e * _sin(mp + 2 * m)
+                + 0.00027 * e * _sin(2 * mp + m)
+                - 0.00017 * _sin(omega)
+                - 0.00005 * _sin(mp - m - 2 * f)
+                + 0.00004 * _sin(2 * mp + 2 * f)
+                - 0.00004 * _sin(mp + m + 2 * f)
+                + 0.00004 * _sin(mp - 2 * m)
+                + 0.00003 * _sin(mp + m - 2 * f)
+                + 0.00003 * _sin(3 * m)
+                + 0.00002 * _sin(2 * mp - 2 * f)
+                + 0.00002 * _sin(mp - m + 2 * f)
+                - 0.00002 * _sin(3 * mp + m))
+        w = (0.00306 - 0.00038 * e * _cos(m) + 0.00026 * _cos(mp) - 0.00002 * _cos(mp - m)
+             + 0.00002 * _cos(mp + m) + 0.00002 * _cos(2 * f))
+        jde += w if fraction == 1 else -w
+
+    jde += 0.000325 * _sin(299.77 + 0.107408 * k - 0.009173 * t * t)
+    jde += sum(coefficient * _sin(base + rate * k) for base, rate, coefficient in PLANETARY_ARGUMENTS)
+    return jde
+
+
+def _lunations_in_year(year):
+    first = math.floor((year - 2000) * 12.3685) - 1
+    return range(first, first + 15)
+
+
+def moon_phases(year):
+    """USNO /moon/phases/year `phasedata` items for `year`, in date order."""
+    items = []
+    for k in _lunations_in_year(year):
+        for quarter, phase in enumerate(PHASE_NAMES):
+            item = _item(jde_to_datetime(phase_jde(k + quarter / 4)), 'phase', phase)
+            if item['year'] == year:
+                items.append(item)
+    items.sort(key=lambda item: (item['month'], item['day'], item['time']))
+    return items
+
+
+# -- Solar eclipses (Meeus 54) --
+
+def solar_eclipse(k):
+    """Greatest eclipse for the new moon at integer lunation `k`, as
+    (jde, kind), or None when that new moon has no solar eclipse. `kind`
+    is 'Total', 'Annular', 'Hybrid' or 'Partial'."""
+    t, jde, e, m, mp, f, omega = _lunar_arguments(k)
+    if abs(_sin(f)) > 0.36:
+        return None
+
+    f1 = f - 0.02665 * _sin(omega)
+    a1 = 299.77 + 0.107408 * k - 0.009173 * t * t
+    jde += (-0.4075 * _sin(mp)
+            + 0.1721 * e * _sin(m)
+            + 0.0161 * _sin(2 * mp)
+            - 0.0097 * _sin(2 * f1)
+            + 0.0073 * e * _sin(mp - m)
+            - 0.0050 * e * _sin(mp + m)
+            - 0.0023 * _sin(mp - 2 * f1)
+            + 0.0021 * e * _sin(2 * m)
+            + 0.0012 * _sin(mp + 2 * f1)
+            + 0.0006 * e * _sin(2 * mp + m)
+            - 0.0004 * _sin(3 * mp)
+            - 0.0003 * e * _sin(m + 2 * f1)
+            + 0.0003 * _sin(a1)
+            - 0.0002 * e * _sin(m - 2 * f1)
+            - 0.0002 * e * _sin(2 * mp - m)
+            - 0.0002 * _sin(omega))
+
+    p = (0.2070 * e * _sin(m) + 0.0024 * e * _sin(2 * m) - 0.0392 * _sin(mp) + 0.0116 * _sin(2 * mp)
+         - 0.0073 * e * _sin(mp + m) + 0.0067 * e * _sin(mp - m) + 0.0118 * _sin(2 * f1))
+    q = (5.2207 - 0.0048 * e * _cos(m) + 0.0020 * e * _cos(2 * m) - 0.3299 * _cos(mp)
+         - 0.0060 * e * _cos(mp + m) + 0.0041 * e * _cos(mp - m))
+    w = abs(_cos(f1))
+    gamma = (p * _cos(f1) + q * _sin(f1)) * (1 - 0.0048 * w)
+    u = 0.0059 + 0.0046 * e * _cos(m) - 0.0182 * _cos(mp) + 0.0004 * _cos(2 * mp) - 0.0005 * _cos(m + mp)
+
+    if abs(gamma) > 1.5433 + u:
+        return None
+    if abs(gamma) > 0.9972 + abs(u):
+        return jde, 'Partial'
+    if u < 0:
+        return jde, 'Total'
+    if u > 0.0047 or u >= 0.00464 * math.sqrt(max(0.0, 1 - gamma * gamma)):
+        return jde, 'Annular'
+    return jde, 'Hybrid'
+
+
+def solar_eclipses(year):
+    """USNO /eclipses/solar/year `eclipses_in_year` items for `year`."""
+    items = []
+    for k in _lunations_in_year(year):
+        eclipse = solar_eclipse(k)
+        if eclipse is None:
+            continue
+        jde, kind = eclipse
+        item = _item(jde_to_datetime(jde), 'event', f'{kind} Solar Eclipse')
+        if item['year'] == year:
+            items.append(item)
+    return items
+
+
+def events_for_years(years):
+    """Every item above for each of `years` in one call:
+    {year: {'seasons': [...], 'eclipses': [...], 'moon_phases': [...]}}."""
+    return {
+        year: {'seasons': seasons(year), 'eclipses': solar_eclipses(year), 'moon_phases': moon_phases(year)}
+        for year in years
+    }
@@ -0,0 +1,123 @@
+"""Per-upstream circuit breakers for http_client.
+
+When an upstream (Nager, aladhan, ...) is down, every call to it used to
+wait out its timeout -- and its retries -- before failing, so one dead host
+cost timeout-times-requests on every refresh. Each host now has a
+CircuitBreaker, in the same spirit as LLM.FAILURE_THRESHOLD for Ollama:
+
+  closed     requests go out. HTTP_BREAKER_FAILURE_THRESHOLD consecutive
+             failures -- a connection error or timeout, or a 5xx status --
+             open it.
+  open       requests are refused without being sent, raising CircuitOpen,
+             for HTTP_BREAKER_RESET_SECONDS.
+  half_open  after that, a single trial request goes out (the others are
+             still refused). Success closes the breaker again; failure
+             reopens it for another HTTP_BREAKER_RESET_SECONDS.
+
+CircuitOpen is a requests.exceptions.RequestException, so callers handle it
+exactly like the upstream being down -- a cached GET serves its stored
+copy (see http_cache) -- only in microseconds instead of a full timeout.
+Requests dropped by the host's rate limit (see rate_limit) never reached
+the upstream, so they count as neither success nor failure.
+"""
+import threading
+import time
+
+import requests
+
+from .logging_setup import get_logger
+from .rate_limit import RateLimitExceeded
+
+logger = get_logger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+SERVER_ERRORS = range(500, 600)
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    """A request was refused unsent because its host's breaker is open."""
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, host, failure_threshold, reset_seconds):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def _admit(self):
+        """Let a request through, or raise CircuitOpen."""
+        with self._lock:
+            if self._state == OPEN:
+                retry_in = self._opened_at + self.reset_seconds - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpen(f"{self.host} is failing; not retrying for another {retry_in:.0f}s")
+                self._state = HALF_OPEN
+                logger.info(f"Circuit for {self.host} half-open; sending a trial request")
+            if self._state == HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpen(f"{self.host} is failing; waiting on a trial request")
+                self._trial_in_flight = True
+
+    def _record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit for {self.host} closed; upstream is answering again")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def _record_failure(self, reason):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(f"Circuit for {self.host} open after {self._failures} consecutive "
+                                   f"failures ({reason}); failing fast for {self.reset_seconds:.0f}s")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def _release(self):
+        """Neither outcome -- free the trial slot without counting it."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def call(self, send):
+        """Return `send()`'s response, unless the breaker is open, counting
+        its outcome towards the breaker's state."""
+        self._admit()
+        try:
+            response = send()
+        except RateLimitExceeded:
+            self._release()
+            raise
+        except requests.exceptions.RequestException as e:
+            self._record_failure(type(e).__name__)
+            raise
+        except BaseException:
+            self._release()
+            raise
+        if response.status_code in SERVER_ERRORS:
+            self._record_failure(f"HTTP {response.status_code}")
+        else:
+            self._record_success()
+        return response
+
+    def snapshot(self):
+        """State for /health: the state name, the current run of
+        consecutive failures, and while open, seconds until the next
+        trial request."""
+        with self._lock:
+            snapshot = {'state': self._state, 'consecutive_failures': self._failures}
+            if self._state == OPEN:
+                snapshot['retry_in_seconds'] = max(0, round(self._opened_at + self.reset_seconds - time.monotonic()))
+            return snapshot
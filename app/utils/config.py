@@ -61,6 +61,76 @@ class Config:
         # for data that almost never changes that fast.
         self.EVENT_CACHE_UPDATE_INTERVAL = int(os.getenv('EVENT_CACHE_UPDATE_INTERVAL', '24'))
 
+        # Per-source, per-year refresh cadence on top of that (see
+        # app/services/refresh_cadence.py). EVENT_CACHE_UPDATE_INTERVAL is
+        # the shortest interval, for the current year; each year further
+        # ahead starts EVENT_REFRESH_FAR_YEAR_FACTOR times longer. Every
+        # refresh that comes back unchanged multiplies a source's interval
+        # by EVENT_REFRESH_BACKOFF_FACTOR, up to
+        # EVENT_REFRESH_MAX_INTERVAL_HOURS; one that changed resets it.
+        self.EVENT_REFRESH_BACKOFF_FACTOR = float(os.getenv('EVENT_REFRESH_BACKOFF_FACTOR', '2'))
+        self.EVENT_REFRESH_FAR_YEAR_FACTOR = float(os.getenv('EVENT_REFRESH_FAR_YEAR_FACTOR', '4'))
+        self.EVENT_REFRESH_MAX_INTERVAL_HOURS = float(os.getenv('EVENT_REFRESH_MAX_INTERVAL_HOURS', '720'))
+
+        # Shared pooled HTTP transport (app/utils/http_client.py) used by
+        # every upstream client. Pool size is keep-alive connections kept
+        # per upstream host; retries apply only to idempotent requests that
+        # failed to connect or came back 502/503/504, backing off
+        # exponentially from HTTP_RETRY_BACKOFF_SECONDS. The timeout is the
+        # default for callers that don't pass their own.
+        self.HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))
+        self.HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+        self.HTTP_RETRY_BACKOFF_SECONDS = float(os.getenv('HTTP_RETRY_BACKOFF_SECONDS', '0.5'))
+        self.HTTP_DEFAULT_TIMEOUT_SECONDS = float(os.getenv('HTTP_DEFAULT_TIMEOUT_SECONDS', '10'))
+
+        # Longest a request to a rate-limited upstream (see
+        # app/utils/rate_limit.py) waits for its turn before it's dropped
+        # instead -- failing like an upstream outage, so cached GETs serve
+        # their stored copy. 0 never waits.
+        self.HTTP_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv('HTTP_RATE_LIMIT_MAX_WAIT_SECONDS', '30'))
+
+        # Per-upstream circuit breaker (see app/utils/circuit_breaker.py):
+        # this many consecutive failures (errors, timeouts, 5xx) stop
+        # requests to that host for HTTP_BREAKER_RESET_SECONDS, after which
+        # one trial request decides whether it's back. Meanwhile calls fail
+        # at once, and cached GETs serve their stored copy. 0 disables it.
+        self.HTTP_BREAKER_FAILURE_THRESHOLD = int(os.getenv('HTTP_BREAKER_FAILURE_THRESHOLD', '3'))
+        self.HTTP_BREAKER_RESET_SECONDS = float(os.getenv('HTTP_BREAKER_RESET_SECONDS', '300'))
+
+        # On-disk response cache for the calendar sources (see
+        # app/utils/http_cache.py): stored bodies are revalidated with
+        # If-None-Match/If-Modified-Since and served stale while an
+        # upstream is down. Disable to always re-download full bodies.
+        self.HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True').lower() == 'true'
+        # Stored responses not used for this many days are deleted (see
+        # http_cache.prune) -- e.g. a year window no refresh asks for any
+        # more. 0 keeps everything.
+        self.HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '30'))
+
+        # Worker pool size CalendarAggregator fans its per-source/per-year
+        # upstream fetches out over during an event cache refresh. Set to 1
+        # to fetch every source strictly one after another instead. Each
+        # upstream also has its own, smaller in-flight cap (see
+        # MAX_CONCURRENT_REQUESTS on the clients in calendar_aggregator.py),
+        # so raising this doesn't raise the load on any single API past that.
+        self.CALENDAR_FETCH_MAX_WORKERS = int(os.getenv('CALENDAR_FETCH_MAX_WORKERS', '8'))
+
+        # ISO 3166-1 alpha-2 codes whose public holidays (Nager.Date) are
+        # merged into the live calendar, comma-separated. One upstream call
+        # per country per year, so this is what a refresh's fan-out scales
+        # with; the merge itself is linear in the number of holidays.
+        self.PUBLIC_HOLIDAY_COUNTRY_CODES = [
+            code.strip().upper()
+            for code in os.getenv('PUBLIC_HOLIDAY_COUNTRY_CODES', 'US,DE,GB,CA,RU').split(',')
+            if code.strip()
+        ]
+
+        # Most /api/calendar/events responses kept in memory, across all
+        # users (app/services/calendar_response_cache.py), least recently
+        # used dropped first. Each user only ever has a handful live -- one
+        # per dashboard tab range -- so this bounds memory, not hit rate.
+        self.CALENDAR_RESPONSE_CACHE_SIZE = int(os.getenv('CALENDAR_RESPONSE_CACHE_SIZE', '512'))
+
         # How often computed/deterministic calendar sources (Hebrew via
         # Hebcal; Coptic, once added) get backfilled. These aren't
         # "refreshed" in the usual sense -- their dates never change once
@@ -71,6 +141,35 @@ class Config:
         # longer interval later, independently of Nager's cadence.
         self.COMPUTED_CALENDAR_BACKFILL_INTERVAL = int(os.getenv('COMPUTED_CALENDAR_BACKFILL_INTERVAL', '24'))
 
+        # Where Hebrew calendar holidays come from: 'local' computes them
+        # in-process (app/utils/hebrew_calendar.py, no network at all),
+        # 'remote' calls the Hebcal REST API once per year as before. With
+        # the local engine, HEBREW_CALENDAR_CROSS_CHECK additionally fetches
+        # each year from Hebcal and logs any date that disagrees -- a
+        # diagnostic only, the local result is still what gets cached.
+        self.HEBREW_CALENDAR_ENGINE = os.getenv('HEBREW_CALENDAR_ENGINE', 'local').lower()
+        self.HEBREW_CALENDAR_CROSS_CHECK = os.getenv('HEBREW_CALENDAR_CROSS_CHECK', 'False').lower() == 'true'
+
+        # Same switch for equinoxes/solstices/eclipses/moon phases: 'local'
+        # computes them in-process (app/utils/astronomy.py), 'remote' makes
+        # USNO's three calls per year. ASTRONOMY_CROSS_CHECK logs any event
+        # date the two disagree on.
+        self.ASTRONOMY_ENGINE = os.getenv('ASTRONOMY_ENGINE', 'local').lower()
+        self.ASTRONOMY_CROSS_CHECK = os.getenv('ASTRONOMY_CROSS_CHECK', 'False').lower() == 'true'
+
+        # Same switch for the Roman Catholic liturgical calendar: 'local'
+        # generates it in-process (app/utils/liturgical_calendar.py),
+        # 'remote' crawls the Inadiutorium API month by month (~20s each).
+        self.LITURGICAL_CALENDAR_ENGINE = os.getenv('LITURGICAL_CALENDAR_ENGINE', 'local').lower()
+        self.LITURGICAL_CALENDAR_CROSS_CHECK = os.getenv('LITURGICAL_CALENDAR_CROSS_CHECK', 'False').lower() == 'true'
+
+        # Same switch for Islamic holidays: 'local' computes them from the
+        # tabular Hijri calendar plus the sighting-override table
+        # (app/utils/hijri_calendar.py) with no network at all, 'remote'
+        # converts every month of every year via api.aladhan.com. Overrides
+        # are refreshed only on demand: `flask hijri-refresh-overrides`.
+        self.HIJRI_CALENDAR_ENGINE = os.getenv('HIJRI_CALENDAR_ENGINE', 'local').lower()
+
         # How often the suggestion queue (dashboard "you might want to do
         # this" list) is recomputed per user.
         self.SUGGESTION_QUEUE_REFRESH_INTERVAL = int(os.getenv('SUGGESTION_QUEUE_REFRESH_INTERVAL', '6'))
@@ -0,0 +1,36 @@
+"""Per-day annotations carried by every calendar event.
+
+Each event dict from get_calendar_events has, besides its own fields, a
+rendering of its date in other calendars -- today just the Ancient
+Egyptian civil date. Those depend on nothing but the day, so they're
+computed once per date and memoized here rather than rebuilt for every
+event row on every request. Another alternate calendar is one more entry
+in ANNOTATIONS.
+"""
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from .ancient_egyptian_calendar import format_ancient_egyptian_date, to_ancient_egyptian_date
+
+# Event field -> function of a date giving its value.
+ANNOTATIONS = {
+    'ancient_egyptian_date': lambda day: format_ancient_egyptian_date(to_ancient_egyptian_date(day)),
+}
+
+# Enough days for the computed-calendar backfill horizon (ten years ahead)
+# plus the year behind, so a full refresh doesn't churn the cache.
+CACHED_DAYS = 366 * 12
+
+
+def annotations_for(day):
+    """ANNOTATIONS' values for `day` (a date, or a datetime whose date is
+    used), as a read-only mapping shared between callers."""
+    if isinstance(day, datetime):
+        day = day.date()
+    return _annotations_for(day)
+
+
+@lru_cache(maxsize=CACHED_DAYS)
+def _annotations_for(day):
+    return MappingProxyType({field: annotate(day) for field, annotate in ANNOTATIONS.items()})
@@ -0,0 +1,306 @@
+"""Arithmetic Hebrew calendar and Jewish holiday computation.
+
+The Hebrew calendar is fully rule-based: each year starts from the molad
+(mean conjunction) of Tishrei, pushed forward by the dehiyyot (postponement
+rules) so that Rosh Hashana never falls on a Sunday, Wednesday or Friday and
+the year length stays within 353-355 (common) or 383-385 (leap) days. Leap
+years (a second Adar) follow the 19-year Metonic cycle. Given that, every
+holiday is a fixed Hebrew month/day, plus a handful of weekday-dependent
+shifts (fasts that would fall on Shabbat, the Israeli modern holidays).
+
+The conversion follows Reingold & Dershowitz, "Calendrical Calculations":
+dates are handled as R.D. fixed day numbers (day 1 = January 1 of year 1,
+proleptic Gregorian), which is exactly what date.toordinal()/fromordinal()
+use, so no further Gregorian arithmetic is needed here.
+
+holidays_for_gregorian_year() produces items in the same shape as the
+Hebcal REST API's `items` (title/date/category/subcat/hebrew), using
+Hebcal's titles for the Diaspora schedule with major, minor and modern
+holidays enabled -- i.e. what HebcalAPI requested with maj/min/mod=on -- so
+Event.from_hebcal_api can consume either one unchanged.
+"""
+
+from datetime import date, timedelta
+
+NISAN, IYYAR, SIVAN, TAMMUZ, AV, ELUL = 1, 2, 3, 4, 5, 6
+TISHREI, CHESHVAN, KISLEV, TEVET, SHEVAT, ADAR, ADAR_II = 7, 8, 9, 10, 11, 12, 13
+
+# R.D. of 1 Tishrei AM 1 (Julian October 7, 3761 BCE).
+HEBREW_EPOCH = -1373427
+
+PARTS_PER_DAY = 25920  # 24 hours * 1080 parts
+GREGORIAN_TO_HEBREW_YEAR_OFFSET = 3760
+
+MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = range(7)
+
+ROMAN_NUMERALS = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII']
+
+HEBREW_NAMES = {
+    'Rosh Hashana': 'ראש השנה',
+    'Yom Kippur': 'יום כפור',
+    'Sukkot': 'סוכות',
+    'Shmini Atzeret': 'שמיני עצרת',
+    'Simchat Torah': 'שמחת תורה',
+    'Chanukah': 'חנוכה',
+    'Purim': 'פורים',
+    'Pesach': 'פסח',
+    'Shavuot': 'שבועות',
+    "Tish'a B'Av": 'תשעה באב',
+    'Tzom Gedaliah': 'צום גדליה',
+    "Asara B'Tevet": 'עשרה בטבת',
+    'Tu BiShvat': 'ט״ו בשבט',
+    'Purim Katan': 'פורים קטן',
+    "Ta'anit Esther": 'תענית אסתר',
+    'Shushan Purim': 'שושן פורים',
+    "Ta'anit Bechorot": 'תענית בכורות',
+    'Pesach Sheni': 'פסח שני',
+    'Lag BaOmer': 'ל״ג בעומר',
+    'Tzom Tammuz': 'צום תמוז',
+    "Tu B'Av": 'ט״ו באב',
+    'Rosh Hashana LaBehemot': 'ראש השנה לבהמות',
+    'Leil Selichot': 'ליל סליחות',
+    'Yom HaShoah': 'יום השואה',
+    'Yom HaZikaron': 'יום הזיכרון',
+    "Yom HaAtzma'ut": 'יום העצמאות',
+    'Yom Yerushalayim': 'יום ירושלים',
+    'Sigd': 'סיגד',
+    'Yom HaAliyah': 'יום העלייה',
+}
+
+
+def is_leap_year(hebrew_year):
+    return (7 * hebrew_year + 1) % 19 < 7
+
+
+def _elapsed_days(hebrew_year):
+    """Days from the epoch to the molad of Tishrei of `hebrew_year`, after
+    the molad zaken / lo ADU rosh postponements."""
+    months_elapsed = (235 * hebrew_year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // PARTS_PER_DAY
+    if (3 * (days + 1)) % 7 < 3:
+        days += 1
+    return days
+
+
+def _year_length_correction(hebrew_year):
+    """The remaining two dehiyyot (GaTaRaD / BeTU'TaKPaT), expressed as a
+    0-2 day delay that keeps the year (and the one before it) a legal
+    length."""
+    previous = _elapsed_days(hebrew_year - 1)
+    current = _elapsed_days(hebrew_year)
+    following = _elapsed_days(hebrew_year + 1)
+    if following - current == 356:
+        return 2
+    if current - previous == 382:
+        return 1
+    return 0
+
+
+def new_year(hebrew_year):
+    """R.D. fixed day of 1 Tishrei (Rosh Hashana) of `hebrew_year`."""
+    return HEBREW_EPOCH + _elapsed_days(hebrew_year) + _year_length_correction(hebrew_year)
+
+
+def days_in_year(hebrew_year):
+    return new_year(hebrew_year + 1) - new_year(hebrew_year)
+
+
+def last_month_of_year(hebrew_year):
+    return ADAR_II if is_leap_year(hebrew_year) else ADAR
+
+
+def days_in_month(hebrew_year, month):
+    if month in (IYYAR, TAMMUZ, ELUL, TEVET, ADAR_II):
+        return 29
+    if month == ADAR and not is_leap_year(hebrew_year):
+        return 29
+    year_length = days_in_year(hebrew_year)
+    if month == CHESHVAN and year_length % 10 != 5:  # only "complete" years have a long Cheshvan
+        return 29
+    if month == KISLEV and year_length % 10 == 3:  # "deficient" years have a short Kislev
+        return 29
+    return 30
+
+
+def to_fixed(hebrew_year, month, day):
+    """R.D. fixed day number of a Hebrew date. Months are numbered from
+    Nisan (1) as in the Bible, while the year number changes at Tishrei
+    (7) -- so months before Tishrei come after it within one year."""
+    fixed = new_year(hebrew_year) + day - 1
+    if month < TISHREI:
+        for m in range(TISHREI, last_month_of_year(hebrew_year) + 1):
+            fixed += days_in_month(hebrew_year, m)
+        for m in range(NISAN, month):
+            fixed += days_in_month(hebrew_year, m)
+    else:
+        for m in range(TISHREI, month):
+            fixed += days_in_month(hebrew_year, m)
+    return fixed
+
+
+def to_gregorian(hebrew_year, month, day):
+    return date.fromordinal(to_fixed(hebrew_year, month, day))
+
+
+def _postpone_from_shabbat(d):
+    """Fasts (other than Yom Kippur) that would fall on Shabbat move to
+    Sunday."""
+    return d + timedelta(days=1) if d.weekday() == SATURDAY else d
+
+
+def _advance_from_shabbat(d):
+    """Ta'anit Esther/Ta'anit Bechorot move back to Thursday rather than
+    forward, so they don't collide with the holiday they precede."""
+    return d - timedelta(days=2) if d.weekday() == SATURDAY else d
+
+
+def _yom_hashoah(hebrew_year):
+    d = to_gregorian(hebrew_year, NISAN, 27)
+    if d.weekday() == FRIDAY:
+        return d - timedelta(days=1)
+    if d.weekday() == SUNDAY:
+        return d + timedelta(days=1)
+    return d
+
+
+def _yom_hazikaron(hebrew_year):
+    """4 Iyyar, moved so neither it nor Yom HaAtzma'ut (the next day)
+    touches Shabbat."""
+    d = to_gregorian(hebrew_year, IYYAR, 4)
+    if d.weekday() == FRIDAY:
+        return d - timedelta(days=2)
+    if d.weekday() == THURSDAY:
+        return d - timedelta(days=1)
+    if d.weekday() == SUNDAY:
+        return d + timedelta(days=1)
+    return d
+
+
+def _leil_selichot(hebrew_year):
+    """The Saturday night before Rosh Hashana, as long as that leaves at
+    least four days of Selichot -- otherwise the Saturday before that."""
+    rosh_hashana = date.fromordinal(new_year(hebrew_year + 1))
+    d = rosh_hashana - timedelta(days=4)
+    while d.weekday() != SATURDAY:
+        d -= timedelta(days=1)
+    return d
+
+
+def _item(title, d, subcat, base_name=None, erev=False):
+    hebrew = HEBREW_NAMES.get(base_name or title)
+    if hebrew and erev:
+        hebrew = f'ערב {hebrew}'
+    item = {'title': title, 'date': d.isoformat(), 'category': 'holiday', 'subcat': subcat}
+    if hebrew:
+        item['hebrew'] = hebrew
+    return item
+
+
+def holidays_for_hebrew_year(hebrew_year):
+    """Every major, minor and modern holiday of one Hebrew year (Tishrei
+    to Elul), in Hebcal's item shape, unsorted. Includes the Erev days of
+    the major holidays, as Hebcal does."""
+    y = hebrew_year
+
+    def g(month, day):
+        return to_gregorian(y, month, day)
+
+    one_day = timedelta(days=1)
+    adar = ADAR_II if is_leap_year(y) else ADAR
+    items = []
+
+    # Tishrei
+    rosh_hashana = g(TISHREI, 1)
+    items.append(_item(f'Rosh Hashana {y}', rosh_hashana, 'major', 'Rosh Hashana'))
+    items.append(_item('Rosh Hashana II', g(TISHREI, 2), 'major', 'Rosh Hashana'))
+    items.append(_item('Tzom Gedaliah', _postpone_from_shabbat(g(TISHREI, 3)), 'fast'))
+    items.append(_item('Erev Yom Kippur', g(TISHREI, 9), 'major', 'Yom Kippur', erev=True))
+    items.append(_item('Yom Kippur', g(TISHREI, 10), 'major'))
+    items.append(_item('Erev Sukkot', g(TISHREI, 14), 'major', 'Sukkot', erev=True))
+    for offset in range(7):
+        if offset < 2:
+            title = f'Sukkot {ROMAN_NUMERALS[offset]}'
+        elif offset < 6:
+            title = f"Sukkot {ROMAN_NUMERALS[offset]} (CH''M)"
+        else:
+            title = 'Sukkot VII (Hoshana Raba)'
+        items.append(_item(title, g(TISHREI, 15 + offset), 'major', 'Sukkot'))
+    items.append(_item('Shmini Atzeret', g(TISHREI, 22), 'major'))
+    items.append(_item('Simchat Torah', g(TISHREI, 23), 'major'))
+
+    # Cheshvan -- Kislev/Tevet. Chanukah is counted in days from the first
+    # candle rather than by month/day, since it straddles a Kislev whose
+    # length varies (29 or 30 days).
+    if y >= 5769:  # Sigd became an official Israeli holiday in 2008
+        items.append(_item('Sigd', g(CHESHVAN, 29), 'modern'))
+    first_candle = g(KISLEV, 24)
+    for candles in range(1, 9):
+        title = 'Chanukah: 1 Candle' if candles == 1 else f'Chanukah: {candles} Candles'
+        items.append(_item(title, first_candle + timedelta(days=candles - 1), 'major', 'Chanukah'))
+    items.append(_item('Chanukah: 8th Day', first_candle + timedelta(days=8), 'major', 'Chanukah'))
+    items.append(_item("Asara B'Tevet", g(TEVET, 10), 'fast'))
+    items.append(_item('Tu BiShvat', g(SHEVAT, 15), 'minor'))
+
+    # Adar
+    if is_leap_year(y):
+        items.append(_item('Purim Katan', g(ADAR, 14), 'minor'))
+    items.append(_item("Ta'anit Esther", _advance_from_shabbat(g(adar, 13)), 'fast'))
+    items.append(_item('Erev Purim', g(adar, 13), 'major', 'Purim', erev=True))
+    items.append(_item('Purim', g(adar, 14), 'major'))
+    items.append(_item('Shushan Purim', g(adar, 15), 'minor'))
+
+    # Nisan
+    if y >= 5776:  # Yom HaAliyah, since 2016
+        items.append(_item('Yom HaAliyah', g(NISAN, 10), 'modern'))
+    items.append(_item("Ta'anit Bechorot", _advance_from_shabbat(g(NISAN, 14)), 'fast'))
+    items.append(_item('Erev Pesach', g(NISAN, 14), 'major', 'Pesach', erev=True))
+    for offset in range(8):
+        title = f'Pesach {ROMAN_NUMERALS[offset]}'
+        if 2 <= offset <= 5:
+            title += " (CH''M)"
+        items.append(_item(title, g(NISAN, 15 + offset), 'major', 'Pesach'))
+    if y >= 5711:  # Yom HaShoah, since 1951
+        items.append(_item('Yom HaShoah', _yom_hashoah(y), 'modern'))
+
+    # Iyyar -- Sivan
+    if y >= 5709:  # Yom HaZikaron/Yom HaAtzma'ut, since 1949
+        yom_hazikaron = _yom_hazikaron(y)
+        items.append(_item('Yom HaZikaron', yom_hazikaron, 'modern'))
+        items.append(_item("Yom HaAtzma'ut", yom_hazikaron + one_day, 'modern'))
+    items.append(_item('Pesach Sheni', g(IYYAR, 14), 'minor'))
+    items.append(_item('Lag BaOmer', g(IYYAR, 18), 'minor'))
+    if y >= 5728:  # Yom Yerushalayim, since 1968
+        items.append(_item('Yom Yerushalayim', g(IYYAR, 28), 'modern'))
+    items.append(_item('Erev Shavuot', g(SIVAN, 5), 'major', 'Shavuot', erev=True))
+    items.append(_item('Shavuot I', g(SIVAN, 6), 'major', 'Shavuot'))
+    items.append(_item('Shavuot II', g(SIVAN, 7), 'major', 'Shavuot'))
+
+    # Tammuz -- Elul
+    items.append(_item('Tzom Tammuz', _postpone_from_shabbat(g(TAMMUZ, 17)), 'fast'))
+    tisha_bav = _postpone_from_shabbat(g(AV, 9))
+    items.append(_item("Erev Tish'a B'Av", tisha_bav - one_day, 'major', "Tish'a B'Av", erev=True))
+    items.append(_item("Tish'a B'Av", tisha_bav, 'major'))
+    items.append(_item("Tu B'Av", g(AV, 15), 'minor'))
+    items.append(_item('Rosh Hashana LaBehemot', g(ELUL, 1), 'minor'))
+    items.append(_item('Leil Selichot', _leil_selichot(y), 'minor'))
+    items.append(_item('Erev Rosh Hashana', g(ELUL, 29), 'major', 'Rosh Hashana', erev=True))
+
+    return items
+
+
+def holidays_for_gregorian_year(gregorian_year):
+    """Holidays falling within one Gregorian year, sorted by date. A
+    Gregorian year overlaps two Hebrew years -- the tail (Tevet to Elul) of
+    one and the head (Tishrei to Kislev/Tevet) of the next -- so both are
+    computed and filtered down."""
+    first_hebrew_year = gregorian_year + GREGORIAN_TO_HEBREW_YEAR_OFFSET
+    prefix = f'{gregorian_year:04d}-'
+    items = [
+        item
+        for hebrew_year in (first_hebrew_year, first_hebrew_year + 1)
+        for item in holidays_for_hebrew_year(hebrew_year)
+        if item['date'].startswith(prefix)
+    ]
+    items.sort(key=lambda item: item['date'])
+    return items
@@ -0,0 +1,204 @@
+"""Tabular Hijri calendar and Islamic holiday computation.
+
+The arithmetical (tabular) Islamic calendar alternates 30- and 29-day
+months, with a 30-day Dhu al-Hijjah in 11 of every 30 years (years 2, 5, 7,
+10, 13, 16, 18, 21, 24, 26 and 29 of the cycle). It tracks the mean lunar
+month closely, so month starts land on the day the published Umm al-Qura
+calendar (and api.aladhan.com's gToHCalendar) uses, or one day off from it.
+
+That one-day difference is what the override table is for. Real-world month
+starts can follow an actual moon sighting no arithmetic rule predicts, so
+<app data dir>/hijri_overrides.json maps a Hijri month ("1447-09") to the
+Gregorian date it actually started on ("2026-02-18"). An override moves that
+month's first day, and every holiday in it, and the previous month's length
+follows from it. The table is edited by hand or filled in by
+LocalHijriCalendar.refresh_overrides (the `flask hijri-refresh-overrides`
+command), and it only ever holds the months where the tabular date is wrong.
+
+The conversion follows Reingold & Dershowitz, "Calendrical Calculations",
+using R.D. fixed day numbers (date.toordinal()), same as hebrew_calendar.py.
+
+holidays_for_gregorian_year() produces day dicts in the same shape as the
+Aladhan gToHCalendar `data` entries (hijri/gregorian, with hijri.holidays)
+for the days that carry a holiday, so Event.from_hijri_api can consume
+either one unchanged.
+"""
+
+import json
+import os
+from datetime import date
+
+from .env import get_app_data_dir
+
+MUHARRAM, SAFAR, RABI_AL_AWWAL, RABI_AL_THANI, JUMADA_AL_ULA, JUMADA_AL_AKHIRAH = 1, 2, 3, 4, 5, 6
+RAJAB, SHABAN, RAMADAN, SHAWWAL, DHU_AL_QADAH, DHU_AL_HIJJAH = 7, 8, 9, 10, 11, 12
+
+# R.D. of 1 Muharram AH 1 (Julian July 16, 622 CE).
+ISLAMIC_EPOCH = 227015
+
+MONTH_NAMES = {
+    MUHARRAM: 'Muḥarram',
+    SAFAR: 'Ṣafar',
+    RABI_AL_AWWAL: 'Rabīʿ al-awwal',
+    RABI_AL_THANI: 'Rabīʿ al-thānī',
+    JUMADA_AL_ULA: 'Jumādá al-ūlá',
+    JUMADA_AL_AKHIRAH: 'Jumādá al-ākhirah',
+    RAJAB: 'Rajab',
+    SHABAN: 'Shaʿbān',
+    RAMADAN: 'Ramaḍān',
+    SHAWWAL: 'Shawwāl',
+    DHU_AL_QADAH: 'Dhū al-Qaʿdah',
+    DHU_AL_HIJJAH: 'Dhū al-Ḥijjah',
+}
+
+# (month, day) -> holiday name, using Aladhan's names so events stay the
+# same whichever engine produced them.
+HOLIDAYS = {
+    (MUHARRAM, 1): 'Islamic New Year',
+    (MUHARRAM, 10): 'Ashura',
+    (RABI_AL_AWWAL, 12): 'Mawlid al-Nabi',
+    (RAJAB, 27): 'Lailat-ul-Miraj',
+    (SHABAN, 15): "Lailat-ul-Bara'at",
+    (RAMADAN, 1): '1st Day of Ramadan',
+    (RAMADAN, 27): 'Lailat-ul-Qadr',
+    (SHAWWAL, 1): 'Eid-ul-Fitr',
+    (DHU_AL_HIJJAH, 8): 'Hajj',
+    (DHU_AL_HIJJAH, 9): 'Arafa',
+    (DHU_AL_HIJJAH, 10): 'Eid-ul-Adha',
+    (DHU_AL_HIJJAH, 11): 'Days of Tashriq',
+    (DHU_AL_HIJJAH, 12): 'Days of Tashriq',
+    (DHU_AL_HIJJAH, 13): 'Days of Tashriq',
+}
+
+OVERRIDES_FILENAME = 'hijri_overrides.json'
+
+
+def is_leap_year(hijri_year):
+    return (14 + 11 * hijri_year) % 30 < 11
+
+
+def tabular_to_fixed(hijri_year, month, day):
+    return (ISLAMIC_EPOCH - 1
+            + (hijri_year - 1) * 354
+            + (3 + 11 * hijri_year) // 30
+            + 29 * (month - 1)
+            + month // 2
+            + day)
+
+
+def tabular_from_fixed(fixed):
+    hijri_year = (30 * (fixed - ISLAMIC_EPOCH) + 10646) // 10631
+    prior_days = fixed - tabular_to_fixed(hijri_year, MUHARRAM, 1)
+    month = (11 * prior_days + 330) // 325
+    day = fixed - tabular_to_fixed(hijri_year, month, 1) + 1
+    return hijri_year, month, day
+
+
+def _next_month(hijri_year, month):
+    return (hijri_year + 1, MUHARRAM) if month == DHU_AL_HIJJAH else (hijri_year, month + 1)
+
+
+def _previous_month(hijri_year, month):
+    return (hijri_year - 1, DHU_AL_HIJJAH) if month == MUHARRAM else (hijri_year, month - 1)
+
+
+def override_key(hijri_year, month):
+    return f'{hijri_year}-{month:02d}'
+
+
+def get_overrides_path():
+    return get_app_data_dir() / OVERRIDES_FILENAME
+
+
+def load_overrides(path=None):
+    """Read the override table as {(hijri_year, month): R.D. of day 1}.
+    A missing file means no overrides."""
+    path = path or get_overrides_path()
+    try:
+        with open(path, encoding='utf-8') as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}
+    overrides = {}
+    for key, start in raw.items():
+        hijri_year, month = key.split('-')
+        overrides[(int(hijri_year), int(month))] = date.fromisoformat(start).toordinal()
+    return overrides
+
+
+def save_overrides(overrides, path=None):
+    path = path or get_overrides_path()
+    raw = {override_key(hijri_year, month): date.fromordinal(start).isoformat()
+           for (hijri_year, month), start in sorted(overrides.items())}
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(raw, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def month_start(hijri_year, month, overrides=None):
+    """R.D. of the first day of a Hijri month: the override if there is one,
+    else the tabular date."""
+    if overrides and (hijri_year, month) in overrides:
+        return overrides[(hijri_year, month)]
+    return tabular_to_fixed(hijri_year, month, 1)
+
+
+def month_starts_for_gregorian_year(gregorian_year, overrides=None):
+    """Every Hijri month that overlaps `gregorian_year`, as
+    [(hijri_year, month, first_day, last_day)] with R.D. bounds."""
+    start_fixed = date(gregorian_year, 1, 1).toordinal()
+    end_fixed = date(gregorian_year, 12, 31).toordinal()
+    # One month of slack either side covers any override pulling a month
+    # start across the year boundary.
+    hijri_year, month, _ = tabular_from_fixed(start_fixed)
+    hijri_year, month = _previous_month(hijri_year, month)
+    months = []
+    first_day = month_start(hijri_year, month, overrides)
+    while first_day <= end_fixed:
+        next_year, next_month = _next_month(hijri_year, month)
+        next_first_day = month_start(next_year, next_month, overrides)
+        if next_first_day > start_fixed:
+            months.append((hijri_year, month, first_day, next_first_day - 1))
+        hijri_year, month, first_day = next_year, next_month, next_first_day
+    return months
+
+
+def gregorian_to_hijri(gregorian_date, overrides=None):
+    """(hijri_year, month, day) for a Gregorian date, honouring overrides."""
+    fixed = gregorian_date.toordinal()
+    for hijri_year, month, first_day, last_day in month_starts_for_gregorian_year(gregorian_date.year, overrides):
+        if first_day <= fixed <= last_day:
+            return hijri_year, month, fixed - first_day + 1
+    return tabular_from_fixed(fixed)
+
+
+def _day_item(fixed, hijri_year, month, day, holidays):
+    gregorian_date = date.fromordinal(fixed)
+    return {
+        'hijri': {
+            'date': f'{day:02d}-{month:02d}-{hijri_year}',
+            'day': f'{day:02d}',
+            'month': {'number': month, 'en': MONTH_NAMES[month]},
+            'year': str(hijri_year),
+            'holidays': holidays,
+        },
+        'gregorian': {'date': gregorian_date.isoformat()},
+    }
+
+
+def holidays_for_gregorian_year(gregorian_year, overrides=None):
+    """Aladhan-shaped day dicts for every day of `gregorian_year` that
+    carries an Islamic holiday, in date order. `overrides` defaults to the
+    table on disk; pass {} for the pure tabular calendar."""
+    if overrides is None:
+        overrides = load_overrides()
+    items = []
+    for hijri_year, month, first_day, last_day in month_starts_for_gregorian_year(gregorian_year, overrides):
+        for day in range(1, last_day - first_day + 2):
+            holiday = HOLIDAYS.get((month, day))
+            fixed = first_day + day - 1
+            if holiday is None or date.fromordinal(fixed).year != gregorian_year:
+                continue
+            items.append(_day_item(fixed, hijri_year, month, day, [holiday]))
+    return items
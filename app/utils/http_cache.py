@@ -0,0 +1,273 @@
+"""On-disk HTTP response cache with conditional revalidation, used by
+http_client.get(..., cache=True) for the calendar sources.
+
+Nager/Hijri/Hebcal/USNO data almost never changes between refreshes, but
+update_event_cache and backfill_computed_calendar_events used to download
+full JSON bodies every run. Each successful response is now stored under
+<app data dir>/http_cache, keyed by the full request URL including query
+params, together with its ETag/Last-Modified validators. The next request
+for the same URL sends If-None-Match/If-Modified-Since, and a 304 is
+answered from disk. If the upstream is down (connection error, timeout,
+5xx) and a stored copy exists, that stale copy is served instead of
+failing the refresh. It carries a `Warning: 111` header (see is_stale), and
+noting_stale() collects the URLs answered that way, so a caller that
+fetches on a schedule can tell "unchanged upstream" from "upstream down".
+
+Entries not used (stored, revalidated or served) for
+HTTP_CACHE_MAX_AGE_DAYS are pruned -- a year window that has rolled out
+of every refresh, say -- at most once per PRUNE_INTERVAL_SECONDS, from
+store().
+
+request_scope() additionally deduplicates identical requests within one
+job run: the first response for a URL is memoized until the outermost
+scope exits, so e.g. LaunchLibraryAPI's rolling window is fetched once per
+refresh no matter how many years ask for it. The scope is held in a
+context variable, so it covers the job that opened it -- and the worker
+threads fetch_all runs its calls on, which get a copy of the job's
+context -- but not a web request served meanwhile, nor another job's
+scope.
+"""
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import config
+from .env import get_app_data_dir
+from .logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Headers worth keeping alongside a cached body -- validators for
+# revalidation, plus what Response.json()/.text need to decode it.
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+PRUNE_INTERVAL_SECONDS = 24 * 3600
+
+# RFC 7234's warning for a stored response served because revalidating it
+# failed.
+STALE_WARNING = '111 - "Revalidation Failed"'
+
+
+class _RequestScope:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.responses = {}
+        self.key_locks = {}
+
+
+_current_scope = contextvars.ContextVar('http_cache_request_scope', default=None)
+_stale_urls = contextvars.ContextVar('http_cache_stale_urls', default=None)
+_created_dirs = set()
+_last_pruned = {}
+_prune_lock = threading.Lock()
+
+
+def get_cache_dir():
+    cache_dir = get_app_data_dir() / 'http_cache'
+    if cache_dir not in _created_dirs:
+        cache_dir.mkdir(exist_ok=True)
+        _created_dirs.add(cache_dir)
+    return cache_dir
+
+
+def cache_key(url, params=None):
+    """Stable key for a GET: the fully prepared URL, so `params=` and the
+    same query baked into the URL string map to the same entry."""
+    prepared_url = requests.Request('GET', url, params=params).prepare().url
+    return hashlib.sha256(prepared_url.encode('utf-8')).hexdigest()
+
+
+class CachedEntry:
+    def __init__(self, url, status_code, headers, body, stored_at):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def conditional_headers(self):
+        headers = {}
+        if self.headers.get('ETag'):
+            headers['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def to_response(self, stale=False):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        if stale:
+            response.headers['Warning'] = STALE_WARNING
+        response._content = self.body
+        response.url = self.url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+def load(key):
+    """The stored entry for `key`, or None. Marks it as used, for prune()."""
+    cache_dir = get_cache_dir()
+    try:
+        with open(cache_dir / f'{key}.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(cache_dir / f'{key}.body', 'rb') as f:
+            body = f.read()
+        os.utime(cache_dir / f'{key}.json')
+    except (OSError, ValueError):
+        return None
+    return CachedEntry(meta['url'], meta['status_code'], meta['headers'], body, meta['stored_at'])
+
+
+def store(key, response):
+    """Write body first, then metadata, each via rename -- a reader never
+    sees metadata pointing at a half-written body."""
+    cache_dir = get_cache_dir()
+    meta = {
+        'url': response.url,
+        'status_code': response.status_code,
+        'headers': {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+        'stored_at': time.time(),
+    }
+    try:
+        _write_atomic(cache_dir / f'{key}.body', response.content)
+        _write_atomic(cache_dir / f'{key}.json', json.dumps(meta).encode('utf-8'))
+    except OSError as e:
+        logger.warning(f"Could not write HTTP cache entry for {response.url}: {e}")
+    _prune_if_due(cache_dir)
+
+
+def prune(cache_dir, max_age_seconds):
+    """Delete the entries in `cache_dir` last used more than
+    `max_age_seconds` ago. Returns how many were deleted."""
+    cutoff = time.time() - max_age_seconds
+    pruned = 0
+    for meta_path in cache_dir.glob('*.json'):
+        try:
+            if meta_path.stat().st_mtime >= cutoff:
+                continue
+            meta_path.unlink()
+            meta_path.with_suffix('.body').unlink(missing_ok=True)
+            pruned += 1
+        except OSError:
+            continue
+    return pruned
+
+
+def _prune_if_due(cache_dir):
+    if config.HTTP_CACHE_MAX_AGE_DAYS <= 0:
+        return
+    with _prune_lock:
+        now = time.monotonic()
+        if cache_dir in _last_pruned and now - _last_pruned[cache_dir] < PRUNE_INTERVAL_SECONDS:
+            return
+        _last_pruned[cache_dir] = now
+    pruned = prune(cache_dir, config.HTTP_CACHE_MAX_AGE_DAYS * 24 * 3600)
+    if pruned:
+        logger.info(f"Pruned {pruned} HTTP cache entries unused for {config.HTTP_CACHE_MAX_AGE_DAYS} days")
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def request_scope():
+    """Deduplicate identical cached GETs for the duration of one job run.
+    Nested scopes share the outermost one's memo."""
+    if _current_scope.get() is not None:
+        yield
+        return
+    token = _current_scope.set(_RequestScope())
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+
+
+def is_stale(response):
+    """Whether `response` is a stored copy served because the upstream
+    couldn't be reached."""
+    return response.headers.get('Warning') == STALE_WARNING
+
+
+@contextmanager
+def noting_stale():
+    """Collect the URLs answered with a stale copy (see is_stale) inside
+    the block -- on fetch_all's worker threads too -- into the list it
+    yields."""
+    stale_urls = []
+    token = _stale_urls.set(stale_urls)
+    try:
+        yield stale_urls
+    finally:
+        _stale_urls.reset(token)
+
+
+def cached_get(send, url, params=None, headers=None, **kwargs):
+    """GET `url` through `send` (http_client's pooled request function),
+    revalidating against and falling back to the on-disk copy."""
+    response = _cached_get(send, url, params, headers, **kwargs)
+    stale_urls = _stale_urls.get()
+    if stale_urls is not None and is_stale(response):
+        stale_urls.append(response.url)
+    return response
+
+
+def _cached_get(send, url, params, headers, **kwargs):
+    key = cache_key(url, params)
+    scope = _current_scope.get()
+    if scope is None:
+        return _revalidate(send, key, url, params, headers, **kwargs)
+
+    with scope.lock:
+        key_lock = scope.key_locks.setdefault(key, threading.Lock())
+    # Held across the fetch so a concurrent identical request (e.g. two
+    # years of a fan-out asking for the same window) waits for the first
+    # one's response instead of issuing its own.
+    with key_lock:
+        response = scope.responses.get(key)
+        if response is None:
+            response = _revalidate(send, key, url, params, headers, **kwargs)
+            if response.status_code < 400:
+                scope.responses[key] = response
+        return response
+
+
+def _revalidate(send, key, url, params, headers, **kwargs):
+    entry = load(key)
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+
+    try:
+        response = send('GET', url, params=params, headers=request_headers, **kwargs)
+    except requests.exceptions.RequestException as e:
+        if entry is None:
+            raise
+        logger.warning(f"Upstream unavailable for {url} ({e}); serving cached copy from {_age(entry)}")
+        return entry.to_response(stale=True)
+
+    if response.status_code == 304 and entry is not None:
+        logger.debug(f"Not modified: {url}")
+        return entry.to_response()
+    if response.status_code >= 500 and entry is not None:
+        logger.warning(f"Upstream returned {response.status_code} for {url}; serving cached copy from {_age(entry)}")
+        return entry.to_response(stale=True)
+    if response.status_code == 200:
+        store(key, response)
+    return response
+
+
+def _age(entry):
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.stored_at))
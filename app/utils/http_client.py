@@ -0,0 +1,233 @@
+"""Shared, pooled HTTP transport for every upstream client in this app.
+
+Every outbound call (calendar sources, OpenWeather, Mustermeister, BriefKorb,
+Ollama, the extensions/ scrapers) goes through get()/post()/request() here
+instead of bare requests.get/requests.post, so connections are kept alive
+and reused across calls rather than paying a fresh TCP+TLS handshake each
+time -- e.g. HijriCalendarAPI's twelve monthly calls to api.aladhan.com now
+share one pooled connection set instead of opening twelve.
+
+One requests.Session per upstream host, created lazily on first use, each
+with its own keep-alive connection pool (sized by HTTP_POOL_MAXSIZE, or a
+per-host override), retry policy and default timeout. Sessions are shared
+across threads: urllib3's connection pools are thread-safe, and cookie
+handling -- the one piece of Session state that isn't -- is switched off,
+since none of these APIs are cookie-authenticated.
+
+Retries only cover idempotent methods (GET/HEAD) and transient failures
+(connection errors, 502/503/504), with exponential backoff. A POST to e.g.
+Ollama's /api/generate is never silently re-sent. Callers still see plain
+requests.exceptions.* errors and requests.Response objects, so existing
+error handling (raise_for_status, status_code checks) is unchanged.
+
+get(..., cache=True) additionally goes through the on-disk revalidating
+response cache (see http_cache); request_scope() wraps a job run so
+identical cached GETs within it are sent only once, and noting_stale()
+collects the URLs within it answered from a stale copy.
+
+Hosts with a rate_limit (in HOST_SETTINGS, configure_host, or passed per
+call by the clients of config-only hosts) are held to that budget -- see
+rate_limit. A request that would wait longer than
+HTTP_RATE_LIMIT_MAX_WAIT_SECONDS for its turn raises RateLimitExceeded
+instead of going out, and a cached GET serves its stored copy.
+
+Every host also has a circuit breaker (see circuit_breaker): after
+HTTP_BREAKER_FAILURE_THRESHOLD consecutive failures, requests to it raise
+CircuitOpen without being sent until HTTP_BREAKER_RESET_SECONDS have
+passed, so a dead upstream costs nothing per call rather than a timeout
+each. breaker_states() reports them for /health.
+"""
+import threading
+from dataclasses import dataclass, replace
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import http_cache
+from .circuit_breaker import CircuitBreaker, CircuitOpen
+from .config import config
+from .rate_limit import HostRateLimiter, RateLimit, RateLimitExceeded
+from .logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_METHODS = frozenset({'GET', 'HEAD'})
+
+
+@dataclass(frozen=True)
+class HostSettings:
+    """Transport settings for one upstream host. None means "use the
+    app-wide default from config" (see _resolve_settings)."""
+    timeout: Optional[float] = None
+    pool_maxsize: Optional[int] = None
+    max_retries: Optional[int] = None
+    rate_limit: Optional[RateLimit] = None  # None: unlimited
+
+
+# Hosts whose defaults differ from the app-wide ones. Only applies when a
+# caller doesn't pass its own timeout -- the clients that already document
+# a specific timeout (e.g. BRIEFKORB's REQUEST_TIMEOUT_SECONDS) keep
+# passing it explicitly.
+HOST_SETTINGS = {
+    # Documented as ~20s per monthly call -- see InadiutoriumAPI. Calls
+    # that do go out are spaced half a second apart, as the client used to
+    # sleep after each one.
+    'calapi.inadiutorium.cz': HostSettings(timeout=30, rate_limit=RateLimit(min_interval=0.5)),
+    # Twelve monthly calls per year; large enough that a concurrent
+    # refresh (see CalendarAggregator) never waits on a free connection.
+    'api.aladhan.com': HostSettings(pool_maxsize=12),
+    # 15 requests/hour on the free tier -- a retry burns budget.
+    'll.thespacedevs.com': HostSettings(max_retries=0, rate_limit=RateLimit(max_requests=15, window_seconds=3600)),
+}
+
+_sessions = {}
+_host_overrides = {}
+_limiters = {}
+_breakers = {}
+_lock = threading.Lock()
+
+
+def configure_host(host, timeout=None, pool_maxsize=None, max_retries=None, rate_limit=None):
+    """Override transport settings for `host` at runtime -- for hosts only
+    known from config (e.g. MUSTERMEISTER_BASE_URL) rather than listed in
+    HOST_SETTINGS. Drops any existing session and request budget for that
+    host so the next call picks the new settings up."""
+    with _lock:
+        _host_overrides[host] = HostSettings(timeout=timeout, pool_maxsize=pool_maxsize, max_retries=max_retries,
+                                             rate_limit=rate_limit)
+        session = _sessions.pop(host, None)
+        _limiters.pop(host, None)
+    if session is not None:
+        session.close()
+
+
+def _resolve_settings(host):
+    settings = _host_overrides.get(host) or HOST_SETTINGS.get(host) or HostSettings()
+    return replace(
+        settings,
+        timeout=settings.timeout if settings.timeout is not None else config.HTTP_DEFAULT_TIMEOUT_SECONDS,
+        pool_maxsize=settings.pool_maxsize if settings.pool_maxsize is not None else config.HTTP_POOL_MAXSIZE,
+        max_retries=settings.max_retries if settings.max_retries is not None else config.HTTP_MAX_RETRIES,
+    )
+
+
+def _build_session(settings):
+    retry = Retry(
+        total=settings.max_retries,
+        connect=settings.max_retries,
+        read=settings.max_retries,
+        status=settings.max_retries,
+        backoff_factor=config.HTTP_RETRY_BACKOFF_SECONDS,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        # Hand the final 5xx response back to the caller rather than
+        # raising MaxRetryError, so status-code checks in the clients
+        # (e.g. BriefKorb's documented 502/503 bodies) keep working.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _session_for(host):
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _build_session(_resolve_settings(host))
+            _sessions[host] = session
+            logger.debug(f"Opened pooled HTTP session for {host}")
+        return session
+
+
+def _limiter_for(host, rate_limit):
+    """The host's HostRateLimiter, or None if it has no budget. The
+    host's configured rate_limit wins over one passed per call."""
+    limiter = _limiters.get(host)
+    if limiter is not None:
+        return limiter
+    rate_limit = _resolve_settings(host).rate_limit or rate_limit
+    if rate_limit is None:
+        return None
+    with _lock:
+        return _limiters.setdefault(host, HostRateLimiter(host, rate_limit))
+
+
+def _breaker_for(host):
+    """The host's CircuitBreaker, or None if breakers are switched off."""
+    breaker = _breakers.get(host)
+    if breaker is not None or config.HTTP_BREAKER_FAILURE_THRESHOLD <= 0:
+        return breaker
+    with _lock:
+        return _breakers.setdefault(host, CircuitBreaker(
+            host, config.HTTP_BREAKER_FAILURE_THRESHOLD, config.HTTP_BREAKER_RESET_SECONDS))
+
+
+def breaker_states():
+    """Host -> its breaker's snapshot, for every host called so far."""
+    with _lock:
+        breakers = dict(_breakers)
+    return {host: breaker.snapshot() for host, breaker in sorted(breakers.items())}
+
+
+def _send(method, url, host, timeout, rate_limit, **kwargs):
+    limiter = _limiter_for(host, rate_limit)
+    if limiter is None:
+        return _session_for(host).request(method, url, timeout=timeout, **kwargs)
+    with limiter.acquire(config.HTTP_RATE_LIMIT_MAX_WAIT_SECONDS):
+        return _session_for(host).request(method, url, timeout=timeout, **kwargs)
+
+
+def request(method, url, timeout=None, rate_limit=None, **kwargs):
+    """Send `method` to `url` over the shared pooled session for its host.
+    Accepts the same keyword arguments as requests.request; `timeout`
+    defaults to the host's configured timeout when not given. `rate_limit`
+    is the budget for a host that has none configured (see rate_limit).
+    Raises CircuitOpen while the host's breaker is open."""
+    host = urlsplit(url).netloc
+    if timeout is None:
+        timeout = _resolve_settings(host).timeout
+    send = lambda: _send(method, url, host, timeout, rate_limit, **kwargs)
+    breaker = _breaker_for(host)
+    if breaker is None:
+        return send()
+    return breaker.call(send)
+
+
+def get(url, cache=False, **kwargs):
+    """GET `url`. With cache=True, revalidate against (and fall back to)
+    the on-disk response cache -- for slow-changing upstream data only."""
+    if cache and config.HTTP_CACHE_ENABLED:
+        return http_cache.cached_get(request, url, **kwargs)
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+request_scope = http_cache.request_scope
+noting_stale = http_cache.noting_stale
+
+
+def close_all():
+    """Close every pooled session (and its keep-alive connections), and
+    start every host's request budget and breaker afresh."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        _limiters.clear()
+        _breakers.clear()
+    for session in sessions:
+        session.close()
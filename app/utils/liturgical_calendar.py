@@ -0,0 +1,343 @@
+"""Roman Catholic General Roman Calendar (ordinary form), computed locally.
+
+Every day of the liturgical year follows from two layers:
+
+- the temporale -- Easter (Gregorian computus) and Advent (the fourth
+  Sunday before Christmas) anchor everything movable: seasons, season
+  weeks, Sundays, Ash Wednesday, Holy Week, the Triduum, Ascension,
+  Pentecost and the solemnities that follow it;
+- the sanctorale -- fixed-date solemnities, feasts and obligatory
+  memorials.
+
+Where both fall on the same day, the Table of Liturgical Days decides: the
+lower rank number wins (1.1 Triduum ... 3.13 weekday). An impeded
+solemnity is transferred to the next free day; an impeded feast or
+memorial simply isn't celebrated that year, except that memorials in
+privileged seasons (Lent, late Advent, the Christmas octave) survive as a
+secondary, optional celebration.
+
+days_for_year() produces one dict per day in the same shape as the
+Inadiutorium calendar API (calapi.inadiutorium.cz) -- date, season,
+season_week, celebrations [{title, colour, rank, rank_num}] -- so
+Event.from_inadiutorium_api can consume either one unchanged. Optional
+memorials and national/diocesan propers aren't included; the default
+Inadiutorium calendar also leaves the propers out.
+"""
+
+from datetime import date, timedelta
+
+ADVENT, CHRISTMAS, LENT, TRIDUUM, EASTER, ORDINARY = 'advent', 'christmas', 'lent', 'triduum', 'easter', 'ordinary'
+WHITE, RED, GREEN, VIOLET = 'white', 'red', 'green', 'violet'
+
+# (rank, rank_num) from the Table of Liturgical Days.
+TRIDUUM_RANK = ('triduum', 1.1)
+PRIMARY = ('primary', 1.2)
+SOLEMNITY = ('solemnity', 1.3)
+FEAST_LORD = ('feast', 2.5)
+SUNDAY_UNPRIVILEGED = ('sunday', 2.6)
+FEAST = ('feast', 2.7)
+FERIAL_PRIVILEGED = ('ferial', 2.9)
+MEMORIAL = ('memorial', 3.10)
+OPTIONAL_MEMORIAL = ('optional memorial', 3.12)
+FERIAL = ('ferial', 3.13)
+
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+SUNDAY = 6
+
+# (month, day): (rank, colour, title)
+SANCTORALE = {
+    (1, 1): (SOLEMNITY, WHITE, 'Mary, Mother of God'),
+    (1, 2): (MEMORIAL, WHITE, 'Saints Basil the Great and Gregory Nazianzen, bishops and doctors'),
+    (1, 17): (MEMORIAL, WHITE, 'Saint Anthony, abbot'),
+    (1, 21): (MEMORIAL, RED, 'Saint Agnes, virgin and martyr'),
+    (1, 24): (MEMORIAL, WHITE, 'Saint Francis de Sales, bishop and doctor'),
+    (1, 25): (FEAST, WHITE, 'Conversion of Saint Paul, apostle'),
+    (1, 26): (MEMORIAL, WHITE, 'Saints Timothy and Titus, bishops'),
+    (1, 28): (MEMORIAL, WHITE, 'Saint Thomas Aquinas, priest and doctor'),
+    (1, 31): (MEMORIAL, WHITE, 'Saint John Bosco, priest'),
+    (2, 2): (FEAST_LORD, WHITE, 'Presentation of the Lord'),
+    (2, 5): (MEMORIAL, RED, 'Saint Agatha, virgin and martyr'),
+    (2, 6): (MEMORIAL, RED, 'Saints Paul Miki and companions, martyrs'),
+    (2, 10): (MEMORIAL, WHITE, 'Saint Scholastica, virgin'),
+    (2, 14): (MEMORIAL, WHITE, 'Saints Cyril, monk, and Methodius, bishop'),
+    (2, 22): (FEAST, WHITE, 'Chair of Saint Peter, apostle'),
+    (2, 23): (MEMORIAL, RED, 'Saint Polycarp, bishop and martyr'),
+    (3, 7): (MEMORIAL, RED, 'Saints Perpetua and Felicity, martyrs'),
+    (3, 19): (SOLEMNITY, WHITE, 'Saint Joseph, Spouse of the Blessed Virgin Mary'),
+    (3, 25): (SOLEMNITY, WHITE, 'Annunciation of the Lord'),
+    (4, 7): (MEMORIAL, WHITE, 'Saint John Baptist de la Salle, priest'),
+    (4, 11): (MEMORIAL, RED, 'Saint Stanislaus, bishop and martyr'),
+    (4, 25): (FEAST, RED, 'Saint Mark, evangelist'),
+    (4, 29): (MEMORIAL, WHITE, 'Saint Catherine of Siena, virgin and doctor'),
+    (5, 2): (MEMORIAL, WHITE, 'Saint Athanasius, bishop and doctor'),
+    (5, 3): (FEAST, RED, 'Saints Philip and James, apostles'),
+    (5, 14): (FEAST, RED, 'Saint Matthias, apostle'),
+    (5, 26): (MEMORIAL, WHITE, 'Saint Philip Neri, priest'),
+    (5, 31): (FEAST, WHITE, 'Visitation of the Blessed Virgin Mary'),
+    (6, 1): (MEMORIAL, RED, 'Saint Justin, martyr'),
+    (6, 3): (MEMORIAL, RED, 'Saints Charles Lwanga and companions, martyrs'),
+    (6, 5): (MEMORIAL, RED, 'Saint Boniface, bishop and martyr'),
+    (6, 11): (MEMORIAL, RED, 'Saint Barnabas, apostle'),
+    (6, 13): (MEMORIAL, WHITE, 'Saint Anthony of Padua, priest and doctor'),
+    (6, 21): (MEMORIAL, WHITE, 'Saint Aloysius Gonzaga, religious'),
+    (6, 24): (SOLEMNITY, WHITE, 'Nativity of Saint John the Baptist'),
+    (6, 28): (MEMORIAL, RED, 'Saint Irenaeus, bishop, martyr and doctor'),
+    (6, 29): (SOLEMNITY, RED, 'Saints Peter and Paul, apostles'),
+    (7, 3): (FEAST, RED, 'Saint Thomas, apostle'),
+    (7, 11): (MEMORIAL, WHITE, 'Saint Benedict, abbot'),
+    (7, 15): (MEMORIAL, WHITE, 'Saint Bonaventure, bishop and doctor'),
+    (7, 22): (FEAST, WHITE, 'Saint Mary Magdalene'),
+    (7, 25): (FEAST, RED, 'Saint James, apostle'),
+    (7, 26): (MEMORIAL, WHITE, 'Saints Joachim and Anne, parents of the Blessed Virgin Mary'),
+    (7, 29): (MEMORIAL, WHITE, 'Saints Martha, Mary and Lazarus'),
+    (7, 31): (MEMORIAL, WHITE, 'Saint Ignatius of Loyola, priest'),
+    (8, 1): (MEMORIAL, WHITE, 'Saint Alphonsus Mary Liguori, bishop and doctor'),
+    (8, 4): (MEMORIAL, WHITE, 'Saint John Mary Vianney, priest'),
+    (8, 6): (FEAST_LORD, WHITE, 'Transfiguration of the Lord'),
+    (8, 8): (MEMORIAL, WHITE, 'Saint Dominic, priest'),
+    (8, 10): (FEAST, RED, 'Saint Lawrence, deacon and martyr'),
+    (8, 11): (MEMORIAL, WHITE, 'Saint Clare, virgin'),
+    (8, 14): (MEMORIAL, RED, 'Saint Maximilian Mary Kolbe, priest and martyr'),
+    (8, 15): (SOLEMNITY, WHITE, 'Assumption of the Blessed Virgin Mary'),
+    (8, 20): (MEMORIAL, WHITE, 'Saint Bernard, abbot and doctor'),
+    (8, 21): (MEMORIAL, WHITE, 'Saint Pius X, pope'),
+    (8, 22): (MEMORIAL, WHITE, 'Queenship of the Blessed Virgin Mary'),
+    (8, 24): (FEAST, RED, 'Saint Bartholomew, apostle'),
+    (8, 27): (MEMORIAL, WHITE, 'Saint Monica'),
+    (8, 28): (MEMORIAL, WHITE, 'Saint Augustine, bishop and doctor'),
+    (8, 29): (MEMORIAL, RED, 'Passion of Saint John the Baptist'),
+    (9, 3): (MEMORIAL, WHITE, 'Saint Gregory the Great, pope and doctor'),
+    (9, 8): (FEAST, WHITE, 'Nativity of the Blessed Virgin Mary'),
+    (9, 13): (MEMORIAL, WHITE, 'Saint John Chrysostom, bishop and doctor'),
+    (9, 14): (FEAST_LORD, RED, 'Exaltation of the Holy Cross'),
+    (9, 15): (MEMORIAL, WHITE, 'Our Lady of Sorrows'),
+    (9, 16): (MEMORIAL, RED, 'Saints Cornelius, pope, and Cyprian, bishop, martyrs'),
+    (9, 20): (MEMORIAL, RED, 'Saints Andrew Kim Tae-gon, priest, Paul Chong Ha-sang, and companions, martyrs'),
+    (9, 21): (FEAST, RED, 'Saint Matthew, apostle and evangelist'),
+    (9, 23): (MEMORIAL, WHITE, 'Saint Pius of Pietrelcina, priest'),
+    (9, 27): (MEMORIAL, WHITE, 'Saint Vincent de Paul, priest'),
+    (9, 29): (FEAST, WHITE, 'Saints Michael, Gabriel and Raphael, archangels'),
+    (9, 30): (MEMORIAL, WHITE, 'Saint Jerome, priest and doctor'),
+    (10, 1): (MEMORIAL, WHITE, 'Saint Thérèse of the Child Jesus, virgin and doctor'),
+    (10, 2): (MEMORIAL, WHITE, 'Holy Guardian Angels'),
+    (10, 4): (MEMORIAL, WHITE, 'Saint Francis of Assisi'),
+    (10, 7): (MEMORIAL, WHITE, 'Our Lady of the Rosary'),
+    (10, 15): (MEMORIAL, WHITE, 'Saint Teresa of Jesus, virgin and doctor'),
+    (10, 17): (MEMORIAL, RED, 'Saint Ignatius of Antioch, bishop and martyr'),
+    (10, 18): (FEAST, RED, 'Saint Luke, evangelist'),
+    (10, 28): (FEAST, RED, 'Saints Simon and Jude, apostles'),
+    (11, 1): (SOLEMNITY, WHITE, 'All Saints'),
+    (11, 2): (SOLEMNITY, VIOLET, 'Commemoration of All the Faithful Departed'),
+    (11, 4): (MEMORIAL, WHITE, 'Saint Charles Borromeo, bishop'),
+    (11, 9): (FEAST_LORD, WHITE, 'Dedication of the Lateran Basilica'),
+    (11, 10): (MEMORIAL, WHITE, 'Saint Leo the Great, pope and doctor'),
+    (11, 11): (MEMORIAL, WHITE, 'Saint Martin of Tours, bishop'),
+    (11, 12): (MEMORIAL, RED, 'Saint Josaphat, bishop and martyr'),
+    (11, 21): (MEMORIAL, WHITE, 'Presentation of the Blessed Virgin Mary'),
+    (11, 22): (MEMORIAL, RED, 'Saint Cecilia, virgin and martyr'),
+    (11, 30): (FEAST, RED, 'Saint Andrew, apostle'),
+    (12, 3): (MEMORIAL, WHITE, 'Saint Francis Xavier, priest'),
+    (12, 7): (MEMORIAL, WHITE, 'Saint Ambrose, bishop and doctor'),
+    (12, 8): (SOLEMNITY, WHITE, 'Immaculate Conception of the Blessed Virgin Mary'),
+    (12, 13): (MEMORIAL, RED, 'Saint Lucy, virgin and martyr'),
+    (12, 14): (MEMORIAL, WHITE, 'Saint John of the Cross, priest and doctor'),
+    (12, 26): (FEAST, RED, 'Saint Stephen, the first martyr'),
+    (12, 27): (FEAST, WHITE, 'Saint John, apostle and evangelist'),
+    (12, 28): (FEAST, RED, 'Holy Innocents, martyrs'),
+}
+
+
+def easter_sunday(year):
+    """Gregorian computus (the "anonymous Gregorian algorithm")."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741 -- the algorithm's own name
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def first_sunday_of_advent(year):
+    christmas = date(year, 12, 25)
+    fourth_sunday = christmas - timedelta(days=(christmas.weekday() + 1) % 7 or 7)
+    return fourth_sunday - timedelta(weeks=3)
+
+
+def _sunday_on_or_before(d):
+    return d - timedelta(days=(d.weekday() + 1) % 7)
+
+
+def _ordinal(n):
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f'{n}{suffix}'
+
+
+def _celebration(title, colour, rank):
+    rank_name, rank_num = rank
+    return {'title': title, 'colour': colour, 'rank': rank_name, 'rank_num': rank_num}
+
+
+class _Year:
+    """Temporale anchors for the liturgical days falling in one civil
+    year."""
+
+    def __init__(self, year):
+        self.year = year
+        self.easter = easter_sunday(year)
+        self.ash_wednesday = self.easter - timedelta(days=46)
+        self.palm_sunday = self.easter - timedelta(days=7)
+        self.holy_thursday = self.easter - timedelta(days=3)
+        self.ascension = self.easter + timedelta(days=39)
+        self.pentecost = self.easter + timedelta(days=49)
+        self.advent = first_sunday_of_advent(year)
+        self.epiphany = date(year, 1, 6)
+        self.baptism = self.epiphany + timedelta(days=7 - (self.epiphany.weekday() + 1) % 7)
+        christmas = date(year, 12, 25)
+        octave_sundays = [christmas + timedelta(days=n) for n in range(1, 7)
+                          if (christmas + timedelta(days=n)).weekday() == SUNDAY]
+        self.holy_family = octave_sundays[0] if octave_sundays else date(year, 12, 30)
+
+    def season(self, d):
+        """(season, season_week) for `d`."""
+        if d <= self.baptism:
+            previous_christmas = date(self.year - 1, 12, 25)
+            return CHRISTMAS, (_sunday_on_or_before(d) - _sunday_on_or_before(previous_christmas)).days // 7 + 1
+        if d < self.ash_wednesday:
+            return ORDINARY, (_sunday_on_or_before(d) - self.baptism).days // 7 + 1
+        if d < self.holy_thursday:
+            # Ash Wednesday to the following Saturday is week 0; weeks
+            # count from the 1st Sunday of Lent.
+            first_sunday = self.ash_wednesday + timedelta(days=4)
+            if d < first_sunday:
+                return LENT, 0
+            return LENT, (_sunday_on_or_before(d) - first_sunday).days // 7 + 1
+        if d < self.easter:
+            return TRIDUUM, 1
+        if d <= self.pentecost:
+            return EASTER, (_sunday_on_or_before(d) - self.easter).days // 7 + 1
+        if d < self.advent:
+            return ORDINARY, 34 - ((self.advent - _sunday_on_or_before(d)).days // 7 - 1)
+        if d < date(self.year, 12, 25):
+            return ADVENT, (_sunday_on_or_before(d) - self.advent).days // 7 + 1
+        return CHRISTMAS, (_sunday_on_or_before(d) - _sunday_on_or_before(date(self.year, 12, 25))).days // 7 + 1
+
+    def temporale(self, d, season, week):
+        """The day's proper (movable) celebration."""
+        weekday = d.weekday()
+        weekday_name = WEEKDAY_NAMES[weekday]
+        is_sunday = weekday == SUNDAY
+
+        movable = {
+            self.ash_wednesday: (PRIMARY, VIOLET, 'Ash Wednesday'),
+            self.palm_sunday: (PRIMARY, RED, 'Palm Sunday of the Passion of the Lord'),
+            self.holy_thursday: (TRIDUUM_RANK, WHITE, "Thursday of the Lord's Supper"),
+            self.easter - timedelta(days=2): (TRIDUUM_RANK, RED, 'Friday of the Passion of the Lord'),
+            self.easter - timedelta(days=1): (TRIDUUM_RANK, VIOLET, 'Holy Saturday'),
+            self.easter: (TRIDUUM_RANK, WHITE, 'Easter Sunday of the Resurrection of the Lord'),
+            self.ascension: (PRIMARY, WHITE, 'Ascension of the Lord'),
+            self.pentecost: (PRIMARY, RED, 'Pentecost Sunday'),
+            self.pentecost + timedelta(days=7): (SOLEMNITY, WHITE, 'Most Holy Trinity'),
+            self.pentecost + timedelta(days=11): (SOLEMNITY, WHITE, 'Most Holy Body and Blood of Christ'),
+            self.pentecost + timedelta(days=19): (SOLEMNITY, WHITE, 'Most Sacred Heart of Jesus'),
+            self.advent - timedelta(days=7): (SOLEMNITY, WHITE, 'Our Lord Jesus Christ, King of the Universe'),
+            self.epiphany: (PRIMARY, WHITE, 'Epiphany of the Lord'),
+            self.baptism: (FEAST_LORD, WHITE, 'Baptism of the Lord'),
+            self.holy_family: (FEAST_LORD, WHITE, 'Holy Family of Jesus, Mary and Joseph'),
+            date(self.year, 12, 25): (PRIMARY, WHITE, 'Nativity of the Lord'),
+        }
+        if d in movable:
+            rank, colour, title = movable[d]
+            return _celebration(title, colour, rank)
+
+        if season == ADVENT:
+            privileged = d.month == 12 and d.day >= 17
+            if is_sunday:
+                return _celebration(f'{_ordinal(week)} Sunday of Advent', VIOLET, PRIMARY)
+            return _celebration(f'{weekday_name}, {_ordinal(week)} week of Advent', VIOLET,
+                                FERIAL_PRIVILEGED if privileged else FERIAL)
+        if season == CHRISTMAS:
+            if d.month == 12:
+                return _celebration(f'{_ordinal(d.day - 24)} day in the Octave of Christmas', WHITE, FERIAL_PRIVILEGED)
+            if is_sunday:
+                return _celebration('2nd Sunday after Christmas', WHITE, SUNDAY_UNPRIVILEGED)
+            if d > self.epiphany:
+                return _celebration(f'{weekday_name} after Epiphany', WHITE, FERIAL)
+            return _celebration(f'{weekday_name} of Christmas Time', WHITE, FERIAL)
+        if season == LENT:
+            if week == 0:
+                return _celebration(f'{weekday_name} after Ash Wednesday', VIOLET, FERIAL_PRIVILEGED)
+            if d > self.palm_sunday:
+                return _celebration(f'{weekday_name} of Holy Week', VIOLET, PRIMARY)
+            if is_sunday:
+                return _celebration(f'{_ordinal(week)} Sunday of Lent', VIOLET, PRIMARY)
+            return _celebration(f'{weekday_name}, {_ordinal(week)} week of Lent', VIOLET, FERIAL_PRIVILEGED)
+        if season == EASTER:
+            if d < self.easter + timedelta(days=7):
+                return _celebration(f'{weekday_name} within the Octave of Easter', WHITE, PRIMARY)
+            if is_sunday:
+                return _celebration(f'{_ordinal(week)} Sunday of Easter', WHITE, PRIMARY)
+            return _celebration(f'{weekday_name}, {_ordinal(week)} week of Easter', WHITE, FERIAL)
+        if is_sunday:
+            return _celebration(f'{_ordinal(week)} Sunday in Ordinary Time', GREEN, SUNDAY_UNPRIVILEGED)
+        return _celebration(f'{weekday_name}, {_ordinal(week)} week in Ordinary Time', GREEN, FERIAL)
+
+    def movable_memorials(self):
+        return {
+            self.pentecost + timedelta(days=1): (MEMORIAL, WHITE, 'Blessed Virgin Mary, Mother of the Church'),
+            self.pentecost + timedelta(days=20): (MEMORIAL, WHITE, 'Immaculate Heart of the Blessed Virgin Mary'),
+        }
+
+
+def days_for_year(year):
+    """One Inadiutorium-shaped dict per day of `year`, in date order."""
+    calendar = _Year(year)
+    start = date(year, 1, 1)
+    days = []
+    for offset in range((date(year + 1, 1, 1) - start).days):
+        d = start + timedelta(days=offset)
+        season, week = calendar.season(d)
+        days.append({
+            'date': d.isoformat(),
+            'season': season,
+            'season_week': week,
+            'celebrations': [calendar.temporale(d, season, week)],
+            'weekday': WEEKDAY_NAMES[d.weekday()].lower(),
+        })
+
+    by_date = {day['date']: day for day in days}
+    sanctorale = {date(year, month, day): entry for (month, day), entry in SANCTORALE.items()}
+    sanctorale.update(calendar.movable_memorials())
+    transferred = []
+    for d in sorted(sanctorale):
+        rank, colour, title = sanctorale[d]
+        celebration = _celebration(title, colour, rank)
+        day = by_date[d.isoformat()]
+        temporale = day['celebrations'][0]
+        if celebration['rank_num'] < temporale['rank_num']:
+            day['celebrations'] = [celebration]
+        elif rank == SOLEMNITY:
+            transferred.append((d, celebration))
+        elif rank == MEMORIAL and temporale['rank_num'] == FERIAL_PRIVILEGED[1] and d.weekday() != SUNDAY:
+            # Memorials in privileged seasons become optional commemorations.
+            day['celebrations'].append(_celebration(title, colour, OPTIONAL_MEMORIAL))
+
+    for d, celebration in transferred:
+        if celebration['title'].startswith('Saint Joseph') and calendar.palm_sunday <= d < calendar.easter:
+            # St Joseph in Holy Week is anticipated to the Saturday before
+            # Palm Sunday rather than pushed past the Easter octave.
+            target = calendar.palm_sunday - timedelta(days=1)
+        else:
+            target = d + timedelta(days=1)
+            while by_date[target.isoformat()]['celebrations'][0]['rank_num'] <= SOLEMNITY[1]:
+                target += timedelta(days=1)
+        by_date[target.isoformat()]['celebrations'] = [celebration]
+
+    return days
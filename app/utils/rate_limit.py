@@ -0,0 +1,107 @@
+"""Per-upstream request budgets for http_client.
+
+Some upstreams publish limits (Launch Library: 15 requests/hour on the
+free tier) and the internal services shouldn't be hammered either, but the
+fetch path used to send whatever a refresh asked for. Each limited host
+now gets a HostRateLimiter built from its RateLimit:
+
+  - a token bucket holding max_requests tokens, refilled evenly over
+    window_seconds -- a request takes one (no bucket if max_requests is
+    None);
+  - at most max_concurrency requests in flight at once;
+  - request starts at least min_interval seconds apart.
+
+A request that can't go yet is queued -- it sleeps until its turn, in
+arrival order -- as long as that's within the caller's max_wait. Past that
+it isn't sent at all: acquire() raises RateLimitExceeded, a
+requests.exceptions.RequestException, so callers handle it exactly like
+the upstream being down. For cached GETs that means the stored copy is
+served instead (see http_cache).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """A request would have waited longer than allowed for its turn."""
+    pass
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    max_requests: Optional[int] = None
+    window_seconds: float = 0
+    max_concurrency: Optional[int] = None
+    min_interval: float = 0
+
+
+class HostRateLimiter:
+    def __init__(self, host, limit):
+        self.host = host
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._tokens = float(limit.max_requests or 0)
+        self._refilled_at = time.monotonic()
+        self._last_start = None
+        self._in_flight = (threading.BoundedSemaphore(limit.max_concurrency)
+                           if limit.max_concurrency else None)
+
+    def _reserve(self, max_wait):
+        """Take a token and a start time, returning how long to sleep
+        until that start time, and the reservation to give back to
+        _unreserve if the request isn't sent after all."""
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if self.limit.max_requests:
+                rate = self.limit.max_requests / self.limit.window_seconds
+                self._tokens = min(self.limit.max_requests, self._tokens + (now - self._refilled_at) * rate)
+                self._refilled_at = now
+                # Tokens go negative while requests are queued, so each one
+                # waits for its own token to refill, in order.
+                if self._tokens < 1:
+                    start = now + (1 - self._tokens) / rate
+            if self._last_start is not None:
+                start = max(start, self._last_start + self.limit.min_interval)
+            if start - now > max_wait:
+                raise RateLimitExceeded(
+                    f"{self.host} is over its request budget; next slot in {start - now:.0f}s"
+                )
+            if self.limit.max_requests:
+                self._tokens -= 1
+            previous_start, self._last_start = self._last_start, start
+            return start - now, (start, previous_start)
+
+    def _unreserve(self, reservation):
+        """Give back a reservation whose request was never sent."""
+        start, previous_start = reservation
+        with self._lock:
+            if self.limit.max_requests:
+                self._tokens += 1
+            # Later reservations were spaced after this one; only the
+            # latest can hand its start time back.
+            if self._last_start == start:
+                self._last_start = previous_start
+
+    @contextmanager
+    def acquire(self, max_wait):
+        """Hold a request slot for the duration of the block, waiting at
+        most `max_wait` seconds for it."""
+        wait, reservation = self._reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        if self._in_flight is None:
+            yield
+            return
+        if not self._in_flight.acquire(timeout=max(0, max_wait - wait)):
+            self._unreserve(reservation)
+            raise RateLimitExceeded(f"{self.host} already has {self.limit.max_concurrency} requests in flight")
+        try:
+            yield
+        finally:
+            self._in_flight.release()
@@ -0,0 +1,73 @@
+"""Benchmark: "which entities are shared with this user" via the
+shared_with JSON column versus the entity_share table.
+
+Builds an in-memory database with --entities places owned by --users users,
+each place shared with a few random other users, then times the visibility
+lookup both ways for a sample of users.
+
+Run from the repository root:
+
+    python -m benchmarks.entity_visibility [--entities 20000]
+"""
+import argparse
+import random
+import time
+
+from app import create_app
+from app.models import Entity, EntityShare, User, db
+
+
+def populate(entities, users, shares_per_entity):
+    rng = random.Random(0)
+    db.session.execute(db.insert(User), [
+        {'id': user_id, 'username': f'user{user_id}', 'email': f'user{user_id}@example.com'}
+        for user_id in range(1, users + 1)
+    ])
+    entity_rows = []
+    share_rows = []
+    for entity_id in range(1, entities + 1):
+        owner = rng.randint(1, users)
+        shared_with = sorted(set(rng.sample(range(1, users + 1), shares_per_entity)) - {owner})
+        entity_rows.append({'id': entity_id, 'name': f'Place {entity_id}', 'user_id': owner,
+                            'is_public': False, 'shared_with': shared_with})
+        share_rows.extend({'entity_id': entity_id, 'user_id': user_id} for user_id in shared_with)
+    db.session.execute(db.insert(Entity), entity_rows)
+    db.session.execute(db.insert(EntityShare), share_rows)
+    db.session.commit()
+
+
+def time_lookups(condition_for, user_ids):
+    started = time.perf_counter()
+    total = 0
+    for user_id in user_ids:
+        total += Entity.query.filter(condition_for(user_id)).with_entities(Entity.id).count()
+    return (time.perf_counter() - started) / len(user_ids), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entities', type=int, default=20_000)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--shares-per-entity', type=int, default=3)
+    parser.add_argument('--lookups', type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        populate(args.entities, args.users, args.shares_per_entity)
+        user_ids = random.Random(1).sample(range(1, args.users + 1), args.lookups)
+
+        json_time, json_total = time_lookups(lambda user_id: Entity.shared_with.contains([user_id]), user_ids)
+        share_time, share_total = time_lookups(Entity.shared_with_user, user_ids)
+
+        # On SQLite, JSON contains() is a LIKE on the serialized list: it
+        # looks for the literal text "[<id>]", so it only ever matched
+        # entities shared with exactly that one user -- the counts differ.
+        print(f'{args.entities} entities, {args.users} users, per lookup:')
+        print(f'  shared_with JSON contains  {json_time * 1000:8.3f} ms  ({json_total} matches)')
+        print(f'  entity_share index         {share_time * 1000:8.3f} ms  ({share_total} matches)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark: writing EventCache rows one ORM object at a time versus
+sync_event_cache's bulk statements.
+
+Two workloads, each run on a fresh in-memory database for each writer:
+
+  global refresh   --global-rows rows of one source for one year, written
+                   once, then refreshed unchanged, then refreshed with 5%
+                   of the descriptions edited -- update_event_cache's
+                   shape.
+  custom calendars --users users with --entries annual entries each,
+                   regenerated for two years, then regenerated unchanged
+                   -- update_event_cache's per-user loop.
+
+  per object  the old writers: session.delete() every stored row in the
+              scope, session.add() an EventCache per row, commit. The
+              VisibleEvent projection follows through the mapper events.
+  bulk        sync_event_cache: one read of the scope, then an executemany
+              UPDATE, DELETE and multi-row INSERT for just what changed.
+
+Run from the repository root:
+
+    python -m benchmarks.event_cache_writes [--global-rows 10000] [--users 1000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.models import EventCache, User, VisibleEvent, db
+from app.services.custom_calendar_service import (
+    CUSTOM_CALENDAR_SOURCE, expand_entries_for_year, regenerate_event_cache_for_user,
+)
+from app.services.event_cache_sync import sync_event_cache
+
+YEAR = 2026
+YEARS = [YEAR, YEAR + 1]
+
+
+def global_rows(count, edited=0):
+    start = datetime(YEAR, 1, 1)
+    return [{
+        'title': f'Holiday {i}',
+        'date': start + timedelta(minutes=(i * 53) % (365 * 24 * 60)),
+        'description': f'Observed in C{i % 60:02d}' + (' (edited)' if i < edited else ''),
+        'location': f'C{i % 60:02d}',
+        'source': 'Nager',
+        'year': YEAR,
+    } for i in range(count)]
+
+
+def custom_entries(user_id, count):
+    return [{
+        'title': f'Entry {user_id}-{i}', 'recurrence': 'annual', 'month': i % 12 + 1, 'day': i % 28 + 1,
+        'year': None, 'description': None, 'location': None,
+    } for i in range(count)]
+
+
+def per_object_sync(scope, rows):
+    for row in scope.all():
+        db.session.delete(row)
+    db.session.add_all(EventCache(**row) for row in rows)
+
+
+def per_object_regenerate(user_id, entries, years):
+    for year in years:
+        per_object_sync(
+            EventCache.query.filter_by(user_id=user_id, source=CUSTOM_CALENDAR_SOURCE, year=year),
+            [{'title': o['title'], 'date': o['date'], 'description': o['description'], 'location': o['location'],
+              'source': CUSTOM_CALENDAR_SOURCE, 'year': year, 'user_id': user_id}
+             for o in expand_entries_for_year(entries, year)],
+        )
+    db.session.commit()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def run_global(app, writer, count):
+    with app.app_context():
+        db.create_all()
+        scope = lambda: EventCache.query.filter_by(year=YEAR, user_id=None, entity_id=None)
+
+        def write(rows):
+            writer(scope(), rows)
+            db.session.commit()
+
+        times = [timed(lambda: write(global_rows(count))),
+                 timed(lambda: write(global_rows(count))),
+                 timed(lambda: write(global_rows(count, edited=count // 20)))]
+        assert VisibleEvent.query.count() == EventCache.query.count() == count
+        db.session.remove()
+        db.drop_all()
+        return times
+
+
+def run_custom(app, regenerate, users, entries):
+    with app.app_context():
+        db.create_all()
+        db.session.execute(db.insert(User), [
+            {'id': user_id, 'username': f'user{user_id}', 'email': f'user{user_id}@example.com'}
+            for user_id in range(1, users + 1)
+        ])
+        db.session.commit()
+        calendars = [(user_id, custom_entries(user_id, entries)) for user_id in range(1, users + 1)]
+
+        def regenerate_all():
+            for user_id, user_entries in calendars:
+                regenerate(user_id, user_entries, YEARS)
+
+        times = [timed(regenerate_all), timed(regenerate_all)]
+        assert EventCache.query.count() == users * entries * len(YEARS)
+        db.session.remove()
+        db.drop_all()
+        return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--global-rows', type=int, default=10_000)
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--entries', type=int, default=10)
+    args = parser.parse_args()
+    app = create_app('testing')
+
+    def report(label, legacy, bulk):
+        print(f'  {label:<22} {legacy * 1000:10.1f} ms  {bulk * 1000:10.1f} ms  ({legacy / bulk:5.1f}x)')
+
+    legacy = run_global(app, per_object_sync, args.global_rows)
+    bulk = run_global(app, sync_event_cache, args.global_rows)
+    print(f'global refresh, {args.global_rows} rows{"":<4} per object        bulk')
+    for label, legacy_time, bulk_time in zip(('first write', 'unchanged', '5% edited'), legacy, bulk):
+        report(label, legacy_time, bulk_time)
+
+    legacy = run_custom(app, per_object_regenerate, args.users, args.entries)
+    bulk = run_custom(app, regenerate_event_cache_for_user, args.users, args.entries)
+    print(f'custom calendars, {args.users} users x {args.entries} entries x {len(YEARS)} years')
+    for label, legacy_time, bulk_time in zip(('first write', 'unchanged'), legacy, bulk):
+        report(label, legacy_time, bulk_time)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark: upstream items -> EventCache rows, before and after the typed
+ingestion pipeline.
+
+Parses a synthetic feed of Nager-shaped public-holiday items (100k by
+default) into Events and then into EventCache instances, two ways:
+
+  string round trip  __dict__ Events -> format_event (strftime) ->
+                     EventCache.from_event_dict as it was (strptime twice)
+  typed              slotted Events -> event_cache_row -> EventCache(**row)
+
+and reports wall time per stage plus peak memory held by the parsed
+Events (tracemalloc).
+
+Run from the repository root:
+
+    python -m benchmarks.event_ingestion [--events 100000]
+"""
+import argparse
+import datetime
+import time
+import tracemalloc
+
+from app.models import EventCache
+from app.services.calendar_aggregator import Event, event_cache_row, format_event
+
+
+class LegacyEvent:
+    """Event.__init__ as it was before __slots__: per-instance __dict__,
+    lists grown by append/extend."""
+
+    def __init__(self, name="", date=None, source=None, fixed=False, country=None, other_name=None, notes=None):
+        self.name = str(name) if name else ""
+        self.date = date
+        self.sources = []
+        self.fixed = fixed
+        self.countries = []
+        self.other_names = []
+        self.notes = []
+        if source is not None:
+            if not source in self.sources:
+                self.sources.append(source)
+        if country is not None:
+            if isinstance(country, list):
+                self.countries.extend([str(c) for c in country])
+            else:
+                self.countries.append(str(country))
+        if notes is not None:
+            if isinstance(notes, list):
+                self.notes.extend([str(n) if not isinstance(n, dict) else n for n in notes])
+            else:
+                self.notes.append(str(notes) if not isinstance(notes, dict) else notes)
+        if other_name is not None:
+            if not other_name in self.other_names:
+                self.other_names.append(str(other_name))
+
+
+def build_feed(count):
+    start = datetime.date(2026, 1, 1)
+    return [
+        {
+            "date": (start + datetime.timedelta(days=i % 730)).isoformat(),
+            "localName": f"Feiertag {i}",
+            "name": f"Holiday {i}",
+            "countryCode": f"C{i % 60:02d}",
+            "fixed": bool(i % 2),
+            "launchYear": 1900 + i % 100,
+        }
+        for i in range(count)
+    ]
+
+
+def parse(feed, event_class):
+    # Same fields Event.from_nager_public_holidays_api fills in.
+    return [
+        event_class(name=item["name"], date=datetime.datetime.fromisoformat(item["date"]),
+                    source="Nager Public Holidays API", fixed=item["fixed"], country=item["countryCode"],
+                    other_name=item["localName"], notes=[{"launchYear": item["launchYear"]}])
+        for item in feed
+    ]
+
+
+def legacy_from_event_dict(event_dict):
+    return EventCache(
+        title=event_dict['title'],
+        date=datetime.datetime.strptime(event_dict['start_time'], '%Y-%m-%d %H:%M'),
+        description=event_dict.get('description'),
+        location=event_dict.get('location'),
+        source=event_dict['sources'][0] if event_dict.get('sources') else None,
+        year=datetime.datetime.strptime(event_dict['start_time'], '%Y-%m-%d %H:%M').year,
+    )
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def measure_parse(feed, event_class):
+    tracemalloc.start()
+    elapsed, events = timed(parse, feed, event_class)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+    feed = build_feed(args.events)
+
+    # Parsing is timed untraced; tracemalloc only supplies the memory figure.
+    legacy_parse, legacy_events = timed(parse, feed, LegacyEvent)
+    typed_parse, typed_events = timed(parse, feed, Event)
+    _, legacy_peak, _ = measure_parse(feed, LegacyEvent)
+    _, typed_peak, _ = measure_parse(feed, Event)
+
+    legacy_map, legacy_dicts = timed(lambda: [format_event(e) for e in legacy_events])
+    typed_map, typed_rows = timed(lambda: [event_cache_row(e) for e in typed_events])
+    legacy_build, legacy_rows = timed(lambda: [legacy_from_event_dict(d) for d in legacy_dicts])
+    typed_build, typed_instances = timed(lambda: [EventCache(**row) for row in typed_rows])
+
+    assert [(r.title, r.date, r.year) for r in legacy_rows[:1000]] == \
+        [(r.title, r.date, r.year) for r in typed_instances[:1000]]
+
+    def report(label, legacy, typed, unit="ms", scale=1000):
+        print(f"{label:<28} {legacy * scale:10.1f} {unit}  {typed * scale:10.1f} {unit}  ({legacy / typed:4.1f}x)")
+
+    print(f"{args.events} events{'':<15} string round trip        typed")
+    report("parse into Events", legacy_parse, typed_parse)
+    report("Event -> row", legacy_map, typed_map)
+    report("row -> EventCache", legacy_build, typed_build)
+    report("total", legacy_parse + legacy_map + legacy_build, typed_parse + typed_map + typed_build)
+    report("parsed Events, peak", legacy_peak, typed_peak, unit="MB", scale=1 / 2 ** 20)
+
+
+if __name__ == "__main__":
+    main()
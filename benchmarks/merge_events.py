@@ -0,0 +1,112 @@
+"""Micro-benchmark: Event.merge_events against the old nested-loop merge.
+
+Builds a synthetic multi-country, multi-year public-holiday feed shaped
+like Nager's (every country shares a handful of holidays such as New
+Year's Day and has its own national ones, each with a localName and a
+launchYear note) and merges it country by country, the way
+NagerPublicHolidaysAPI.get_events does.
+
+Run from the repository root:
+
+    python -m benchmarks.merge_events [--countries 60] [--years 3]
+"""
+import argparse
+import datetime
+import time
+
+from app.services.calendar_aggregator import Event
+
+SHARED_HOLIDAYS = [("New Year's Day", 1, 1), ("Christmas Day", 12, 25), ("Labour Day", 5, 1)]
+NATIONAL_HOLIDAYS_PER_COUNTRY = 12
+
+
+def build_feed(countries, years):
+    feed = []
+    for country_number in range(countries):
+        country = f"C{country_number:02d}"
+        for year in range(2026, 2026 + years):
+            events = []
+            for name, month, day in SHARED_HOLIDAYS:
+                events.append(Event(name=name, date=datetime.datetime(year, month, day),
+                                    source="Nager Public Holidays API", fixed=True, country=country,
+                                    other_name=f"{name} ({country})", notes=[{"launchYear": None}]))
+            for holiday in range(NATIONAL_HOLIDAYS_PER_COUNTRY):
+                date = datetime.datetime(year, 1, 1) + datetime.timedelta(days=(country_number * 7 + holiday * 29) % 365)
+                events.append(Event(name=f"{country} National Day {holiday}", date=date,
+                                    source="Nager Public Holidays API", fixed=False, country=country,
+                                    other_name=None, notes=[{"launchYear": 1900 + holiday}]))
+            feed.append(events)
+    return feed
+
+
+def legacy_merge(event, other):
+    if event.fixed is None and other.fixed is not None:
+        event.fixed = other.fixed
+    for country in other.countries:
+        if not country in event.countries:
+            event.countries.append(country)
+    for note in other.notes:
+        if not note in event.notes:
+            event.notes.append(note)
+    for other_name in other.other_names:
+        if not other_name in event.other_names:
+            event.other_names.append(other_name)
+
+
+def legacy_merge_events(events, events_to_merge):
+    for event_to_merge in events_to_merge:
+        has_merged_event = False
+        for event in events:
+            if event_to_merge.name == event.name and event_to_merge.date == event.date:
+                legacy_merge(event, event_to_merge)
+                has_merged_event = True
+                break
+        if not has_merged_event:
+            events.append(event_to_merge)
+
+
+def run_legacy(feed):
+    events = []
+    for batch in feed:
+        legacy_merge_events(events, batch)
+    return events
+
+
+def run_indexed(feed):
+    events = []
+    index = {}
+    for batch in feed:
+        Event.merge_events(events, batch, index)
+    return events
+
+
+def best_of(runs, fn, countries, years):
+    best = None
+    result = None
+    for _ in range(runs):
+        feed = build_feed(countries, years)
+        started = time.perf_counter()
+        result = fn(feed)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", type=int, default=60)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    for countries in sorted({5, 20, args.countries}):
+        legacy_time, legacy_events = best_of(args.runs, run_legacy, countries, args.years)
+        indexed_time, indexed_events = best_of(args.runs, run_indexed, countries, args.years)
+        assert [str(e) for e in legacy_events] == [str(e) for e in indexed_events]
+        print(f"{countries:3d} countries x {args.years} years, {len(indexed_events):5d} merged events: "
+              f"nested loop {legacy_time * 1000:8.1f} ms, indexed {indexed_time * 1000:6.1f} ms "
+              f"({legacy_time / indexed_time:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
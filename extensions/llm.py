@@ -7,9 +7,10 @@ import random
 import threading
 import time
 from typing import Optional, List
-from urllib import request
-from urllib.error import HTTPError
 
+import requests
+
+from app.utils import http_client
 from app.utils.config import config
 from app.utils.logging_setup import get_logger
 from app.utils.utils import Utils
@@ -262,15 +263,11 @@ class LLM:
         elif system_prompt is not None:
             logger.debug("Dropping system prompt from LLM request")
             
-        req = request.Request(
-            f"{config.OLLAMA_BASE_URL}/api/generate",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(data).encode("utf-8"),
-        )
         try:
             logger.debug("Making LLM request...")
-            response = request.urlopen(req, timeout=timeout).read().decode("utf-8")
-            resp_json = json.loads(response)
+            response = http_client.post(f"{config.OLLAMA_BASE_URL}/api/generate", json=data, timeout=timeout)
+            response.raise_for_status()
+            resp_json = response.json()
             result = LLMResult.from_json(resp_json, context_provided=context is not None)
             result.response = self._clean_response_for_models(
                 result.response,
@@ -283,15 +280,16 @@ class LLM:
             else:
                 raise LLMResponseException("LLM response is invalid!")
             return result
-        except HTTPError as e:
+        except requests.exceptions.HTTPError as e:
             self.increment_failure_count()
-            if e.code == 429:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 429:
                 message = self._build_http_error_message(
                     "Rate limited by the LLM provider (HTTP 429).", e, include_retry_after=True
                 )
                 logger.error(f"Rate limited by LLM provider (model {self.model_name}): {message}")
                 raise LLMRateLimitException(message) from e
-            if e.code == 403:
+            if status_code == 403:
                 message = self._build_http_error_message(
                     "Forbidden by the LLM provider (HTTP 403).", e
                 )
@@ -305,13 +303,15 @@ class LLM:
             raise LLMResponseException(f"Failed to generate LLM response: {e}")
 
     @staticmethod
-    def _build_http_error_message(prefix: str, error: HTTPError, include_retry_after: bool = False) -> str:
+    def _build_http_error_message(prefix: str, error: requests.exceptions.HTTPError,
+                                  include_retry_after: bool = False) -> str:
         """Build a human-readable message for an HTTP error response, using the server's JSON
         error body (Ollama's error responses are ``{"error": "..."}"``) and, for rate limiting,
         the Retry-After header, when available."""
         server_message = ""
+        response = error.response
         try:
-            body = error.read().decode("utf-8")
+            body = response.text if response is not None else ""
             if body:
                 parsed = json.loads(body)
                 if isinstance(parsed, dict) and parsed.get("error"):
@@ -323,7 +323,7 @@ class LLM:
         if server_message:
             parts.append(server_message)
         if include_retry_after:
-            retry_after = error.headers.get("Retry-After") if error.headers else None
+            retry_after = response.headers.get("Retry-After") if response is not None else None
             if retry_after:
                 parts.append(f"Retry after {retry_after} seconds.")
         return " ".join(parts)
@@ -1,8 +1,8 @@
 
 
 import datetime
-import requests
 
+from app.utils import http_client
 from library_data.blacklist import blacklist
 from ..utils.config import config
 from ..utils.logging_setup import get_logger
@@ -57,7 +57,7 @@ class NewsAPI:
         url = f"{self.ENDPOINT}?country={country}&apiKey={NewsAPI.KEY}"
         if topic is not None:
             url += "&q={}".format(topic)
-        news = NewsResponse(requests.get(url).json(), country)
+        news = NewsResponse(http_client.get(url).json(), country)
         return news
 
 
@@ -1,11 +1,11 @@
 import html
 import urllib.parse
-import urllib.request
 from bs4 import BeautifulSoup
 import pandas as pd
 import io
 import re
 
+from app.utils import http_client
 from ..utils.utils import Utils
 
 
@@ -28,8 +28,9 @@ class SoupUtils:
         if url is None:
             url = f"{base_url}{extension}"
         try:
-            response = urllib.request.urlopen(url)
-            html_string = response.read().decode("utf-8")
+            response = http_client.get(url)
+            response.raise_for_status()
+            html_string = response.content.decode("utf-8")
             soup = BeautifulSoup(html_string, "lxml")
             return soup
         except Exception as e:
@@ -1,6 +1,5 @@
 
-import requests
-
+from app.utils import http_client
 from extensions.soup_utils import SoupUtils
 
 class WikiOpenSearchResponse:
@@ -42,7 +41,7 @@ class WikiOpenSearchAPI:
 
     def search(self, query: str, limit=-1):
         try:
-            req = requests.get(self.__build_url(query, limit))
+            req = http_client.get(self.__build_url(query, limit))
             return WikiOpenSearchResponse(req.json())
         except Exception as e:
             print(f"Failed to connect to Wiki OpenSearch API: {e}")
@@ -50,7 +49,7 @@ class WikiOpenSearchAPI:
 
     def random_wiki(self):
         try:
-            req = requests.get(f'{self.BASE_URL}?action=query&generator=random&grnnamespace=0&grnlimit=1&prop=extracts&format=json')
+            req = http_client.get(f'{self.BASE_URL}?action=query&generator=random&grnnamespace=0&grnlimit=1&prop=extracts&format=json')
             return RandomWikiResponse(req.json())
         except Exception as e:
             print(f"Failed to connect to Wiki OpenSearch API: {e}")
@@ -0,0 +1,33 @@
+"""Add source refresh table
+
+Revision ID: a3e9d4b7c182
+Revises: f1d5a8c3e926
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3e9d4b7c182'
+down_revision = 'f1d5a8c3e926'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Starts empty: every live source and year is due on the first
+    # update_event_cache run after this, which records their cadence.
+    op.create_table('source_refresh',
+    sa.Column('source', sa.String(length=100), nullable=False),
+    sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('interval_hours', sa.Float(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source', 'year')
+    )
+
+
+def downgrade():
+    op.drop_table('source_refresh')
@@ -0,0 +1,66 @@
+"""Add entity share table
+
+Revision ID: a9d4e7b2c605
+Revises: f3c7a1e5d920
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d4e7b2c605'
+down_revision = 'f3c7a1e5d920'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('entity_share',
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['entity_id'], ['entity.id'], name='fk_entity_share_entity'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], name='fk_entity_share_user'),
+    sa.PrimaryKeyConstraint('entity_id', 'user_id')
+    )
+    with op.batch_alter_table('entity_share', schema=None) as batch_op:
+        batch_op.create_index('ix_entity_share_user_entity', ['user_id', 'entity_id'], unique=False)
+
+    with op.batch_alter_table('entity', schema=None) as batch_op:
+        batch_op.create_index('ix_entity_user_id', ['user_id'], unique=False)
+
+    # Backfill from the existing shared_with JSON lists. Ids of users that
+    # no longer exist are dropped rather than violating the foreign key.
+    connection = op.get_bind()
+    user_ids = {row[0] for row in connection.execute(sa.text('SELECT id FROM "user"'))}
+    shares = set()
+    for entity_id, shared_with in connection.execute(
+        sa.text('SELECT id, shared_with FROM entity WHERE shared_with IS NOT NULL')
+    ):
+        if isinstance(shared_with, str):
+            shared_with = json.loads(shared_with)
+        for user_id in shared_with or []:
+            if user_id in user_ids:
+                shares.add((entity_id, user_id))
+
+    entity_share = sa.table('entity_share',
+        sa.column('entity_id', sa.Integer),
+        sa.column('user_id', sa.Integer),
+    )
+    if shares:
+        op.bulk_insert(entity_share, [
+            {'entity_id': entity_id, 'user_id': user_id} for entity_id, user_id in sorted(shares)
+        ])
+
+
+def downgrade():
+    with op.batch_alter_table('entity', schema=None) as batch_op:
+        batch_op.drop_index('ix_entity_user_id')
+
+    with op.batch_alter_table('entity_share', schema=None) as batch_op:
+        batch_op.drop_index('ix_entity_share_user_entity')
+
+    op.drop_table('entity_share')
@@ -0,0 +1,65 @@
+"""Add visible event projection
+
+Revision ID: b6e2f8d41a97
+Revises: a9d4e7b2c605
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e2f8d41a97'
+down_revision = 'a9d4e7b2c605'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('visible_event',
+    sa.Column('viewer_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('date', sa.DateTime(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('location', sa.String(length=200), nullable=True),
+    sa.Column('source', sa.String(length=100), nullable=True),
+    sa.PrimaryKeyConstraint('viewer_id', 'event_id')
+    )
+    with op.batch_alter_table('visible_event', schema=None) as batch_op:
+        batch_op.create_index('ix_visible_event_viewer_date', ['viewer_id', 'date'], unique=False)
+        batch_op.create_index('ix_visible_event_event_id', ['event_id'], unique=False)
+        batch_op.create_index('ix_visible_event_entity_id', ['entity_id'], unique=False)
+
+    # Backfill with the same visibility rules as VisibleEvent.project:
+    # global rows under viewer 0, the owning user's rows, and entity rows
+    # for the entity's owner and every user it is shared with.
+    op.execute("""
+        INSERT INTO visible_event (viewer_id, event_id, entity_id, date, title, description, location, source)
+        SELECT viewers.viewer_id, e.id, e.entity_id, e.date, e.title, e.description, e.location, e.source
+        FROM (
+            SELECT 0 AS viewer_id, id AS event_id FROM event_cache
+            WHERE user_id IS NULL AND entity_id IS NULL
+            UNION
+            SELECT user_id, id FROM event_cache WHERE user_id IS NOT NULL
+            UNION
+            SELECT entity.user_id, event_cache.id FROM event_cache
+            JOIN entity ON entity.id = event_cache.entity_id
+            WHERE entity.user_id IS NOT NULL
+            UNION
+            SELECT entity_share.user_id, event_cache.id FROM event_cache
+            JOIN entity_share ON entity_share.entity_id = event_cache.entity_id
+        ) AS viewers
+        JOIN event_cache AS e ON e.id = viewers.event_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('visible_event', schema=None) as batch_op:
+        batch_op.drop_index('ix_visible_event_entity_id')
+        batch_op.drop_index('ix_visible_event_event_id')
+        batch_op.drop_index('ix_visible_event_viewer_date')
+
+    op.drop_table('visible_event')
@@ -0,0 +1,28 @@
+"""Extend visible event viewer/date index with event id
+
+Revision ID: c4a8e1f7b239
+Revises: b6e2f8d41a97
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a8e1f7b239'
+down_revision = 'b6e2f8d41a97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('visible_event', schema=None) as batch_op:
+        batch_op.drop_index('ix_visible_event_viewer_date')
+        batch_op.create_index('ix_visible_event_viewer_date', ['viewer_id', 'date', 'event_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('visible_event', schema=None) as batch_op:
+        batch_op.drop_index('ix_visible_event_viewer_date')
+        batch_op.create_index('ix_visible_event_viewer_date', ['viewer_id', 'date'], unique=False)
@@ -0,0 +1,30 @@
+"""Add calendar generation table
+
+Revision ID: c6b2f0e8d413
+Revises: a3e9d4b7c182
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6b2f0e8d413'
+down_revision = 'a3e9d4b7c182'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Starts empty: a viewer without a row is at the initial generation
+    # until their first change commits.
+    op.create_table('calendar_generation',
+    sa.Column('viewer_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('generation', sa.String(length=32), nullable=False),
+    sa.PrimaryKeyConstraint('viewer_id')
+    )
+
+
+def downgrade():
+    op.drop_table('calendar_generation')
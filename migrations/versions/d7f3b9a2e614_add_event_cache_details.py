@@ -0,0 +1,54 @@
+"""Add event cache details column
+
+Revision ID: d7f3b9a2e614
+Revises: c4a8e1f7b239
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import ast
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f3b9a2e614'
+down_revision = 'c4a8e1f7b239'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('details', sa.JSON(), nullable=True))
+
+    # Global rows used to carry their first structured note stringified
+    # into description ("{'hijri': {...}}"). Move those into details. The
+    # computed-calendar backfill never rewrites a year it already has, so
+    # waiting for a refresh would leave them in place. content_hash goes
+    # NULL, which sync_event_cache treats as changed once.
+    connection = op.get_bind()
+    moved = []
+    for row_id, description in connection.execute(sa.text(
+        "SELECT id, description FROM event_cache "
+        "WHERE user_id IS NULL AND entity_id IS NULL AND description LIKE '{%'"
+    )):
+        try:
+            note = ast.literal_eval(description)
+        except (ValueError, SyntaxError):
+            continue
+        if isinstance(note, dict):
+            moved.append({'id': row_id, 'details': json.dumps([note])})
+    if moved:
+        connection.execute(sa.text(
+            'UPDATE event_cache SET description = NULL, details = :details, content_hash = NULL WHERE id = :id'
+        ), moved)
+        connection.execute(sa.text(
+            'UPDATE visible_event SET description = NULL WHERE event_id = :id'
+        ), [{'id': row['id']} for row in moved])
+
+
+def downgrade():
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.drop_column('details')
@@ -0,0 +1,28 @@
+"""Add content hash to event cache
+
+Revision ID: e2b6d9f4c718
+Revises: 9689d3c383e8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b6d9f4c718'
+down_revision = '9689d3c383e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Left NULL on existing rows: the next refresh of each slice sees them
+    # as changed and rewrites them once, filling the hash in.
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.drop_column('content_hash')
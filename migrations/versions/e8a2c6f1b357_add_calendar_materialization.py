@@ -0,0 +1,34 @@
+"""Add calendar materialization table
+
+Revision ID: e8a2c6f1b357
+Revises: d7f3b9a2e614
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a2c6f1b357'
+down_revision = 'd7f3b9a2e614'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Starts empty: the first update_event_cache run after this regenerates
+    # every source once, as it did on every run before, and records it.
+    op.create_table('calendar_materialization',
+    sa.Column('source', sa.String(length=100), nullable=False),
+    sa.Column('owner_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('first_year', sa.Integer(), nullable=False),
+    sa.Column('last_year', sa.Integer(), nullable=False),
+    sa.Column('materialized_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('source', 'owner_id')
+    )
+
+
+def downgrade():
+    op.drop_table('calendar_materialization')
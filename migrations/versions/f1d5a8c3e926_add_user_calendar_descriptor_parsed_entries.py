@@ -0,0 +1,30 @@
+"""Add parsed entries to user calendar descriptor
+
+Revision ID: f1d5a8c3e926
+Revises: e8a2c6f1b357
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1d5a8c3e926'
+down_revision = 'e8a2c6f1b357'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Left empty: each descriptor is parsed once more, by its next save or
+    # background refresh, and its entries stored then.
+    with op.batch_alter_table('user_calendar_descriptor', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('parsed_entries', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('parsed_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('user_calendar_descriptor', schema=None) as batch_op:
+        batch_op.drop_column('parsed_hash')
+        batch_op.drop_column('parsed_entries')
@@ -0,0 +1,30 @@
+"""Add composite indexes to event cache
+
+Revision ID: f3c7a1e5d920
+Revises: e2b6d9f4c718
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c7a1e5d920'
+down_revision = 'e2b6d9f4c718'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.create_index('ix_event_cache_user_entity_date', ['user_id', 'entity_id', 'date'], unique=False)
+        batch_op.create_index('ix_event_cache_entity_date', ['entity_id', 'date'], unique=False)
+        batch_op.create_index('ix_event_cache_source_year', ['source', 'year'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('event_cache', schema=None) as batch_op:
+        batch_op.drop_index('ix_event_cache_source_year')
+        batch_op.drop_index('ix_event_cache_entity_date')
+        batch_op.drop_index('ix_event_cache_user_entity_date')
@@ -120,36 +120,30 @@ def isolated_singletons(tmp_path, monkeypatch):
     yield
 
 
-# As of this writing, nothing else in the app carries class-level mutable
-# state that would leak between tests (checked: SchedulesManager.last_set_schedule
-# is dead -- never assigned past its `None` declaration -- and TempDir isn't
-# imported anywhere under app/). isolated_singletons above covers the only
-# singletons that actually need it. If code is ever added with a similar
-# setup -- a class-level list/dict/reference that a request handler or
-# service mutates and that should not survive past a single test -- uncomment
-# this, fill in the reset(s) following the same pattern as _reset() below,
-# and register it as an autouse fixture like isolated_singletons.
-#
-# @pytest.fixture(autouse=True)
-# def reset_app_globals():
-#     """Reset class-level mutable state not covered by isolated_singletons.
-#
-#     Runs before each test so state leaked by a previous test doesn't
-#     pollute the next one; teardown after yield is a courtesy reset so a
-#     failing test leaves the process clean for any post-run inspection.
-#     """
-#     def _reset():
-#         # Example -- fill in real attributes as they're added:
-#         # try:
-#         #     from app.services.schedules_manager import SchedulesManager
-#         #     SchedulesManager.last_set_schedule = None
-#         # except Exception:
-#         #     pass
-#         pass
-#
-#     _reset()
-#     yield
-#     _reset()
+# Module-level state besides the singletons above that must not survive
+# past a single test. SchedulesManager.last_set_schedule is dead (never
+# assigned past its `None` declaration) and TempDir isn't imported anywhere
+# under app/, so neither needs resetting. Each test's database work is
+# rolled back, so anything cached from the database -- the global event
+# snapshot and calendar responses -- has to go with it. Add further resets to _reset() below.
+@pytest.fixture(autouse=True)
+def reset_app_globals():
+    """Reset module-level mutable state not covered by isolated_singletons.
+
+    Runs before each test so state leaked by a previous test doesn't
+    pollute the next one; teardown after yield is a courtesy reset so a
+    failing test leaves the process clean for any post-run inspection.
+    """
+    def _reset():
+        from app.services import calendar_response_cache, global_event_snapshot
+        from app.utils import http_client
+        global_event_snapshot._snapshot = None
+        calendar_response_cache.clear()
+        http_client._breakers.clear()
+
+    _reset()
+    yield
+    _reset()
 
 
 @pytest.fixture(scope='session')
@@ -1,9 +1,11 @@
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import patch
 from flask_login import login_user
 
 from app.models import EventCache
+from app.services import calendar_response_cache
 from app.services.integration_service import integration_service
 
 pytestmark = pytest.mark.integration
@@ -94,3 +96,145 @@ def test_fetch_live_calendar_events_still_calls_calendar_aggregator(app):
 
         mock_get_events.assert_called_once()
         assert events == []
+
+
+def test_calendar_events_endpoint_serves_repeat_ranges_from_memory(client, auth, test_user, db_session):
+    db_session.add(EventCache(title='Holiday', date=datetime(2026, 7, 4), year=2026))
+    db_session.commit()
+    auth.login()
+    url = '/api/calendar/events?start_date=2026-07-01T08:00:00.000Z&end_date=2026-08-01T08:00:00.000Z'
+
+    with patch.object(integration_service, 'iter_calendar_events',
+                      wraps=integration_service.iter_calendar_events) as get_events:
+        first = client.get(url).get_json()
+        second = client.get(url).get_json()
+        assert get_events.call_count == 1
+        assert first == second
+        assert [event['title'] for event in first] == ['Holiday']
+
+        # A write that reaches the user's calendar retires the entry.
+        db_session.add(EventCache(title='Birthday', date=datetime(2026, 7, 9), year=2026, user_id=test_user.id))
+        db_session.commit()
+        third = client.get(url).get_json()
+
+    assert get_events.call_count == 2
+    assert [event['title'] for event in third] == ['Holiday', 'Birthday']
+    assert calendar_response_cache.stats()['hits'] == 1
+
+
+def test_calendar_events_endpoint_does_not_cache_a_failed_read(client, auth, test_user, db_session):
+    db_session.add(EventCache(title='Holiday', date=datetime(2026, 7, 4), year=2026))
+    db_session.commit()
+    auth.login()
+    url = '/api/calendar/events?start_date=2026-07-01T08:00:00.000Z&end_date=2026-08-01T08:00:00.000Z'
+
+    with patch('app.services.global_event_snapshot.get_snapshot', side_effect=RuntimeError('snapshot failed')):
+        assert client.get(url).get_json() == []
+
+    assert [event['title'] for event in client.get(url).get_json()] == ['Holiday']
+
+
+def _seed_july(db_session, test_user):
+    # Two events share a date, so pages have to break ties by id.
+    db_session.add_all([
+        EventCache(title='Holiday', date=datetime(2026, 7, 4), year=2026),
+        EventCache(title='Fireworks', date=datetime(2026, 7, 4), year=2026, user_id=test_user.id),
+        EventCache(title='Picnic', date=datetime(2026, 7, 9), year=2026, user_id=test_user.id),
+        EventCache(title='Parade', date=datetime(2026, 7, 14), year=2026),
+    ])
+    db_session.commit()
+
+
+JULY = '/api/calendar/events?start_date=2026-07-01T00:00:00.000Z&end_date=2026-08-01T00:00:00.000Z'
+
+
+def test_calendar_events_endpoint_pages_by_cursor(client, auth, test_user, db_session):
+    _seed_july(db_session, test_user)
+    auth.login()
+    everything = client.get(JULY).get_json()
+
+    pages = []
+    url = f'{JULY}&limit=3'
+    while url:
+        response = client.get(url)
+        pages.append(response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        url = f'{JULY}&limit=3&cursor={cursor}' if cursor else None
+
+    assert [len(page) for page in pages] == [3, 1]
+    assert [event for page in pages for event in page] == everything
+    assert [(event['start_time'], event['id']) for event in everything] == \
+        sorted((event['start_time'], event['id']) for event in everything)
+
+
+def test_calendar_events_endpoint_pages_with_fields_that_leave_out_the_cursor_keys(client, auth, test_user,
+                                                                                  db_session):
+    _seed_july(db_session, test_user)
+    auth.login()
+
+    pages = []
+    url = f'{JULY}&limit=3&fields=title'
+    while url:
+        response = client.get(url)
+        pages.append(response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        url = f'{JULY}&limit=3&fields=title&cursor={cursor}' if cursor else None
+
+    assert pages == [[{'title': 'Holiday'}, {'title': 'Fireworks'}, {'title': 'Picnic'}], [{'title': 'Parade'}]]
+
+
+def test_calendar_events_endpoint_streams_ndjson(client, auth, test_user, db_session):
+    _seed_july(db_session, test_user)
+    auth.login()
+
+    response = client.get(f'{JULY}&format=ndjson&limit=2')
+
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == client.get(JULY).get_json()[:2]
+
+
+def test_calendar_events_endpoint_serves_repeat_ndjson_streams_from_memory(client, auth, test_user, db_session):
+    _seed_july(db_session, test_user)
+    auth.login()
+
+    with patch.object(integration_service, 'iter_calendar_events',
+                      wraps=integration_service.iter_calendar_events) as iter_events:
+        first = client.get(f'{JULY}&format=ndjson').get_data(as_text=True)
+        second = client.get(f'{JULY}&format=ndjson')
+
+        assert iter_events.call_count == 1
+        assert second.mimetype == 'application/x-ndjson'
+        assert second.get_data(as_text=True) == first
+        assert [json.loads(line) for line in first.splitlines()] == client.get(JULY).get_json()
+
+        db_session.add(EventCache(title='Fair', date=datetime(2026, 7, 20), year=2026, user_id=test_user.id))
+        db_session.commit()
+        third = client.get(f'{JULY}&format=ndjson').get_data(as_text=True)
+
+    assert json.loads(third.splitlines()[-1])['title'] == 'Fair'
+
+
+def test_calendar_events_endpoint_rejects_bad_paging_params(client, auth, test_user, db_session):
+    auth.login()
+
+    assert client.get(f'{JULY}&cursor=yesterday').status_code == 400
+    assert client.get(f'{JULY}&limit=0').status_code == 400
+
+
+def test_calendar_events_endpoint_returns_only_requested_fields(client, auth, test_user, db_session):
+    _seed_july(db_session, test_user)
+    db_session.add(EventCache(title='Eclipse', date=datetime(2026, 8, 12), year=2026,
+                              details=[{'magnitude': 1.04}]))
+    db_session.commit()
+    auth.login()
+
+    slim = client.get(f'{JULY}&fields=id,title').get_json()
+    assert [sorted(event) for event in slim] == [['id', 'title']] * 4
+
+    august = client.get('/api/calendar/events?start_date=2026-08-01T00:00:00&fields=title,details').get_json()
+    assert august == [{'title': 'Eclipse', 'details': [{'magnitude': 1.04}]}]
+    assert 'details' not in client.get(JULY).get_json()[0]
+
+    assert client.get(f'{JULY}&fields=title,bogus').status_code == 400
+    assert client.get(f'{JULY}&fields=,').status_code == 400
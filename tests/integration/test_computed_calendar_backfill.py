@@ -1,4 +1,5 @@
 import pytest
+import requests
 from datetime import datetime
 from unittest.mock import patch
 from freezegun import freeze_time
@@ -155,6 +156,28 @@ def test_update_event_cache_does_not_wipe_computed_calendar_rows(app, db_session
         assert EventCache.query.filter_by(source=source, year=2026).count() == 1
 
 
+def test_update_event_cache_keeps_last_good_rows_of_a_failing_source(app, db_session):
+    """An upstream that's down (and has no cached response to fall back on)
+    must not have its rows deleted by the refresh -- the sources that did
+    answer are still synced."""
+    db_session.add(EventCache(title='Independence Day', date=datetime(2026, 7, 4), year=2026,
+                              source='Nager Public Holidays API'))
+    db_session.add(EventCache(title='Old Hijri Holiday', date=datetime(2026, 3, 20), year=2026, source='Hijri API'))
+    db_session.commit()
+    aggregator = integration_service.calendar_aggregator
+
+    with freeze_time("2026-01-01"), \
+            patch.object(aggregator.public_holidays_api, 'get_events',
+                         side_effect=requests.exceptions.ConnectTimeout('timed out')), \
+            patch.object(aggregator.hijri_calendar_api, 'get_events', side_effect=lambda year, max_workers=1: [
+                Event(name='Eid al-Fitr', date=datetime(year, 3, 30), source='Hijri API')]), \
+            patch.object(aggregator.launch_library_api, 'get_events', return_value=[]):
+        update_event_cache(app)
+
+    assert EventCache.query.filter_by(source='Nager Public Holidays API', title='Independence Day').count() == 1
+    assert [row.title for row in EventCache.query.filter_by(source='Hijri API', year=2026)] == ['Eid al-Fitr']
+
+
 def test_backfill_failure_for_one_year_does_not_block_other_years(app, db_session):
     def flaky_get_events(year):
         if year == 2028:
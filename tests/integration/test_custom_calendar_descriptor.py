@@ -5,6 +5,7 @@ from flask_login import login_user
 from freezegun import freeze_time
 
 from app.models import EventCache, UserCalendarDescriptor, User
+from app.services.custom_calendar_service import descriptor_hash
 from app.services.integration_service import integration_service
 from app.tasks.background_tasks import update_event_cache
 
@@ -167,3 +168,13 @@ def test_background_job_one_users_broken_descriptor_does_not_block_others(app, t
 
     good_cached = EventCache.query.filter_by(user_id=other_user_id, source='Custom Calendar').all()
     assert len(good_cached) > 0
+
+
+def test_save_calendar_descriptor_stores_parsed_entries(client, auth, test_user, db_session):
+    auth.login()
+
+    client.post('/settings/update-calendar-descriptor', data={'raw_yaml': VALID_YAML})
+
+    descriptor = UserCalendarDescriptor.query.filter_by(user_id=test_user.id).one()
+    assert [entry['title'] for entry in descriptor.parsed_entries] == ["Mom's Birthday", 'Anniversary Trip']
+    assert descriptor.parsed_hash == descriptor_hash(VALID_YAML)
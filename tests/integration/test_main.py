@@ -84,4 +84,6 @@ def test_health_check(client):
     assert 'ollama_status' in data
     assert 'database' in data
     assert 'model' in data
+    assert set(data['calendar_response_cache']) == {'size', 'hits', 'misses'}
+    assert all(set(breaker) >= {'state', 'consecutive_failures'} for breaker in data['upstreams'].values())
     assert data['status'] == 'healthy' 
\ No newline at end of file
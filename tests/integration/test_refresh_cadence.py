@@ -0,0 +1,141 @@
+import json
+
+import pytest
+import requests
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from freezegun import freeze_time
+from sqlalchemy import event
+
+import app.tasks.background_tasks as background_tasks_module
+from app.models import EventCache, SourceRefresh, db
+from app.services import refresh_cadence
+from app.services.calendar_aggregator import Event
+from app.services.integration_service import integration_service
+from app.tasks.background_tasks import update_event_cache
+from app.utils import http_client
+
+pytestmark = pytest.mark.integration
+
+START = datetime(2026, 3, 1)
+
+
+@pytest.fixture
+def live_sources(db_session):
+    """Stable Nager data, Hijri with nothing, and Launch Library with a
+    different launch on every fetch. Records the years Nager is fetched
+    for, and how often Launch Library is."""
+    SourceRefresh.query.delete()
+    aggregator = integration_service.calendar_aggregator
+    calls = {'nager': [], 'launch_library': 0}
+
+    def nager(country_codes, year, max_workers=1):
+        calls['nager'].append(year)
+        return [Event(name='Labour Day', date=datetime(year, 5, 1), source='Nager Public Holidays API')]
+
+    def launch_library(year):
+        calls['launch_library'] += 1
+        return [Event(name=f"Launch {calls['launch_library']}", date=datetime(2026, 6, 1), source='Launch Library')]
+
+    with patch.object(aggregator.public_holidays_api, 'get_events', side_effect=nager), \
+            patch.object(aggregator.hijri_calendar_api, 'get_events', return_value=[]), \
+            patch.object(aggregator.launch_library_api, 'get_events', side_effect=launch_library):
+        yield calls
+
+
+def _run_at(app, hours):
+    with freeze_time(START + timedelta(hours=hours)):
+        update_event_cache(app)
+
+
+def test_stable_sources_back_off_and_next_year_refreshes_less_often(app, db_session, live_sources):
+    fetched = []
+    for hours in (0, 24, 48, 96):
+        live_sources['nager'].clear()
+        _run_at(app, hours)
+        fetched.append(sorted(live_sources['nager']))
+
+    # The current year's interval doubles from 24h after each unchanged
+    # refresh; next year's starts at 4 x 24h.
+    assert fetched == [[2026, 2027], [2026], [], [2026, 2027]]
+    assert db_session.get(SourceRefresh, ('Nager Public Holidays API', 2026)).interval_hours == 96
+
+
+def test_changing_source_stays_on_every_run(app, db_session, live_sources):
+    for hours in (0, 24, 48, 72):
+        _run_at(app, hours)
+
+    assert live_sources['launch_library'] == 4
+    assert db_session.get(SourceRefresh, ('Launch Library', 2026)).interval_hours == 24
+
+
+def test_nothing_is_written_until_every_year_is_planned(app, db_session, live_sources):
+    statements = []
+    planned_by = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+    def plan(*args, **kwargs):
+        result = real_plan(*args, **kwargs)
+        planned_by.append(len(statements))
+        return result
+
+    real_plan = background_tasks_module.plan_event_cache_sync
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        with patch.object(background_tasks_module, 'plan_event_cache_sync', side_effect=plan):
+            _run_at(app, 0)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    assert len(planned_by) == 2
+    assert not {'INSERT', 'UPDATE', 'DELETE'} & set(statements[:planned_by[-1]])
+    assert 'INSERT' in statements[planned_by[-1]:]
+
+
+def test_interval_is_capped_and_tightens_once_data_changes(app, db_session, monkeypatch):
+    monkeypatch.setattr(refresh_cadence.config, 'EVENT_REFRESH_MAX_INTERVAL_HOURS', 48)
+    rows = [{'title': 'Labour Day', 'date': datetime(2026, 5, 1), 'description': None}]
+
+    assert refresh_cadence.record('Test Source', 2026, rows, START, 2026) is True
+    for _ in range(3):
+        assert refresh_cadence.record('Test Source', 2026, rows, START, 2026) is False
+    assert db_session.get(SourceRefresh, ('Test Source', 2026)).interval_hours == 48
+
+    assert refresh_cadence.record('Test Source', 2026, rows + rows, START, 2026) is True
+    assert db_session.get(SourceRefresh, ('Test Source', 2026)).interval_hours == 24
+
+
+def test_source_served_from_a_stale_cached_copy_is_not_backed_off(app, db_session, monkeypatch):
+    SourceRefresh.query.delete()
+    monkeypatch.setattr(http_client.config, 'HTTP_CACHE_ENABLED', True)
+    monkeypatch.setattr(http_client.config, 'HTTP_BREAKER_FAILURE_THRESHOLD', 0)
+    aggregator = integration_service.calendar_aggregator
+    monkeypatch.setattr(aggregator, 'public_holiday_country_codes', ['US'])
+
+    def nager(method, url, **kwargs):
+        year = int(url.rstrip('/').split('/')[-2])
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps([{'name': 'Labour Day', 'localName': 'Labour Day', 'date': f'{year}-05-01',
+                                         'fixed': True, 'countryCode': 'US'}]).encode()
+        response.url = url
+        response.headers['Content-Type'] = 'application/json'
+        return response
+
+    session = MagicMock()
+    session.request.side_effect = nager
+    with patch.object(http_client, '_session_for', return_value=session), \
+            patch.object(aggregator.hijri_calendar_api, 'get_events', return_value=[]), \
+            patch.object(aggregator.launch_library_api, 'get_events', return_value=[]):
+        _run_at(app, 0)
+        session.request.side_effect = requests.exceptions.ConnectTimeout('timed out')
+        for hours in (24, 48):
+            _run_at(app, hours)
+
+    # Retried every run while down, and the last good rows kept.
+    assert session.request.call_count == 4
+    refresh = db_session.get(SourceRefresh, ('Nager Public Holidays API', 2026))
+    assert (refresh.interval_hours, refresh.refreshed_at) == (24, START)
+    assert EventCache.query.filter_by(source='Nager Public Holidays API', year=2026).count() == 1
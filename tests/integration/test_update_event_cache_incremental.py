@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import patch
+from freezegun import freeze_time
+
+from app.models import CalendarMaterialization, DefaultEventDescriptor, Entity, UserCalendarDescriptor, db
+import app.tasks.background_tasks as background_tasks_module
+from app.services.integration_service import integration_service
+from app.tasks.background_tasks import update_event_cache
+
+pytestmark = pytest.mark.integration
+
+YAML = """
+events:
+  - title: "Mom's Birthday"
+    recurrence: annual
+    month: 4
+    day: 12
+"""
+
+REGENERATORS = (
+    'regenerate_event_cache_for_user',
+    'regenerate_event_cache_for_entity',
+    'regenerate_event_cache_for_user_default_events',
+)
+
+
+def _run_counting_regenerations(app, frozen='2026-07-30'):
+    """Run update_event_cache and return how often each regenerator ran."""
+    mocks = {name: patch.object(background_tasks_module, name,
+                                wraps=getattr(background_tasks_module, name)) for name in REGENERATORS}
+    started = {name: mock.start() for name, mock in mocks.items()}
+    try:
+        with patch.object(integration_service, 'fetch_live_calendar_events', return_value=[]), freeze_time(frozen):
+            update_event_cache(app)
+    finally:
+        for mock in mocks.values():
+            mock.stop()
+    return tuple(started[name].call_count for name in REGENERATORS)
+
+
+def _materializations(user_id, place_id):
+    return CalendarMaterialization.query.filter(db.or_(
+        db.and_(CalendarMaterialization.source.in_(['Custom Calendar', 'Default Event']),
+                CalendarMaterialization.owner_id == user_id),
+        db.and_(CalendarMaterialization.source == 'Entity Calendar', CalendarMaterialization.owner_id == place_id),
+    )).all()
+
+
+@pytest.fixture
+def calendars(test_user, db_session):
+    derby = DefaultEventDescriptor(
+        title='Kentucky Derby', category='Sports Festival', recurrence='nth_weekday',
+        recurrence_params={'month': 5, 'weekday': 5, 'ordinal': 1},
+    )
+    place = Entity(name='Test Place', category='restaurant', user_id=test_user.id, calendar_entries=[{
+        'id': 'x1', 'title': 'Closed for Christmas', 'entry_type': 'closure',
+        'recurrence': 'annual', 'month': 12, 'day': 25, 'date': None, 'description': None,
+    }])
+    db_session.add_all([derby, place, UserCalendarDescriptor(user_id=test_user.id, raw_yaml=YAML)])
+    db_session.commit()
+    test_user.update_preferences({'subscribed_default_events': [derby.id]})
+    db_session.commit()
+    # update_event_cache's own app context detaches these on teardown.
+    return test_user.id, place.id, derby.id
+
+
+def test_unchanged_sources_are_skipped_on_the_next_run(app, calendars, db_session):
+    assert _run_counting_regenerations(app) == (1, 1, 1)
+    assert len(_materializations(*calendars[:2])) == 3
+
+    assert _run_counting_regenerations(app) == (0, 0, 0)
+
+
+def test_changed_inputs_regenerate_only_their_own_source(app, calendars, db_session):
+    user_id, place_id, derby_id = calendars
+    _run_counting_regenerations(app)
+
+    UserCalendarDescriptor.query.filter_by(user_id=user_id).one().raw_yaml = YAML.replace('day: 12', 'day: 13')
+    db_session.commit()
+    assert _run_counting_regenerations(app) == (1, 0, 0)
+
+    db_session.get(Entity, place_id).calendar_entries = []
+    db_session.commit()
+    assert _run_counting_regenerations(app) == (0, 1, 0)
+
+    db_session.get(DefaultEventDescriptor, derby_id).description = 'Run for the Roses'
+    db_session.commit()
+    assert _run_counting_regenerations(app) == (0, 0, 1)
+
+
+def test_year_window_rolling_over_regenerates_everything(app, calendars, db_session):
+    _run_counting_regenerations(app)
+
+    assert _run_counting_regenerations(app, frozen='2027-01-01') == (1, 1, 1)
+    assert {(row.first_year, row.last_year) for row in _materializations(*calendars[:2])} == {(2027, 2028)}
+
+
+def test_skips_are_logged(app, calendars, db_session):
+    _run_counting_regenerations(app)
+
+    with patch.object(background_tasks_module.logger, 'info') as info:
+        _run_counting_regenerations(app)
+
+    messages = [call.args[0] for call in info.call_args_list]
+    assert 'Custom calendars: 0 regenerated, 1 unchanged, 0 failed' in messages
+    assert 'Entity calendars: 0 regenerated, 1 unchanged, 0 failed' in messages
+    assert 'Default Events: 0 regenerated, 1 unchanged, 0 failed' in messages
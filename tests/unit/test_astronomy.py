@@ -0,0 +1,59 @@
+import pytest
+
+from app.utils import astronomy
+
+pytestmark = pytest.mark.unit
+
+
+def _by_phenom(items):
+    return {(item['phenom'], item['month']): (item['day'], item['time']) for item in items}
+
+
+def test_2026_equinoxes_and_solstices_match_published_times():
+    seasons = _by_phenom(astronomy.seasons(2026))
+
+    assert seasons[('Equinox', 3)] == (20, '14:46')
+    assert seasons[('Solstice', 6)][0] == 21
+    assert seasons[('Equinox', 9)][0] == 23
+    assert seasons[('Solstice', 12)][0] == 21
+
+
+def test_seasons_include_perihelion_and_aphelion_in_date_order():
+    seasons = astronomy.seasons(2026)
+
+    assert [item['phenom'] for item in seasons] == [
+        'Perihelion', 'Equinox', 'Solstice', 'Aphelion', 'Equinox', 'Solstice',
+    ]
+    assert (seasons[0]['month'], seasons[0]['day']) == (1, 3)
+    assert (seasons[3]['month'], seasons[3]['day']) == (7, 6)
+
+
+def test_moon_phases_match_published_dates_and_cycle_in_order():
+    phases = astronomy.moon_phases(2026)
+
+    assert phases[0] == {'year': 2026, 'month': 1, 'day': 3, 'phase': 'Full Moon', 'time': '10:03'}
+    names = [item['phase'] for item in phases]
+    order = list(astronomy.PHASE_NAMES)
+    for previous, current in zip(names, names[1:]):
+        assert order.index(current) == (order.index(previous) + 1) % 4
+    assert all(item['year'] == 2026 for item in phases)
+
+
+@pytest.mark.parametrize('year, expected', [
+    (2023, [(4, 20, 'Hybrid Solar Eclipse'), (10, 14, 'Annular Solar Eclipse')]),
+    (2024, [(4, 8, 'Total Solar Eclipse'), (10, 2, 'Annular Solar Eclipse')]),
+    (2026, [(2, 17, 'Annular Solar Eclipse'), (8, 12, 'Total Solar Eclipse')]),
+    (2027, [(2, 6, 'Annular Solar Eclipse'), (8, 2, 'Total Solar Eclipse')]),
+])
+def test_solar_eclipses_match_the_published_canon(year, expected):
+    eclipses = astronomy.solar_eclipses(year)
+
+    assert [(item['month'], item['day'], item['event']) for item in eclipses] == expected
+
+
+def test_events_for_years_batches_a_range_in_one_call():
+    batch = astronomy.events_for_years(range(2026, 2036))
+
+    assert sorted(batch) == list(range(2026, 2036))
+    assert batch[2026]['seasons'] == astronomy.seasons(2026)
+    assert all(len(batch[year]['moon_phases']) >= 48 for year in batch)
@@ -36,7 +36,7 @@ def test_fetch_unread_messages_raises_when_not_configured(monkeypatch):
 def test_fetch_unread_messages_sends_bearer_auth_header_and_timeout(monkeypatch):
     _configure(monkeypatch)
 
-    with patch.object(briefkorb_client.requests, 'get',
+    with patch.object(briefkorb_client.http_client, 'get',
                        return_value=_fake_response({'messages': []})) as mock_get:
         fetch_unread_messages()
 
@@ -51,7 +51,7 @@ def test_fetch_unread_messages_requests_unread_only_and_leaves_high_impact_only_
     docs/task-email-integration.md."""
     _configure(monkeypatch)
 
-    with patch.object(briefkorb_client.requests, 'get',
+    with patch.object(briefkorb_client.http_client, 'get',
                        return_value=_fake_response({'messages': []})) as mock_get:
         fetch_unread_messages()
 
@@ -74,7 +74,7 @@ def test_fetch_unread_messages_parses_sender_bucket_shape(monkeypatch):
         ],
     }
 
-    with patch.object(briefkorb_client.requests, 'get', return_value=_fake_response(payload)):
+    with patch.object(briefkorb_client.http_client, 'get', return_value=_fake_response(payload)):
         buckets = fetch_unread_messages()
 
     assert len(buckets) == 1
@@ -91,7 +91,7 @@ def test_fetch_unread_messages_parses_sender_bucket_shape(monkeypatch):
 def test_fetch_unread_messages_raises_on_503(monkeypatch):
     """503 is BriefKorb's documented config/provider-auth failure shape."""
     _configure(monkeypatch)
-    with patch.object(briefkorb_client.requests, 'get',
+    with patch.object(briefkorb_client.http_client, 'get',
                        return_value=_fake_response({'error': 'not configured'}, status_code=503)):
         with pytest.raises(BriefKorbClientError):
             fetch_unread_messages()
@@ -99,7 +99,7 @@ def test_fetch_unread_messages_raises_on_503(monkeypatch):
 
 def test_fetch_unread_messages_raises_on_401(monkeypatch):
     _configure(monkeypatch)
-    with patch.object(briefkorb_client.requests, 'get',
+    with patch.object(briefkorb_client.http_client, 'get',
                        return_value=_fake_response({'error': 'Unauthorized'}, status_code=401)):
         with pytest.raises(BriefKorbClientError):
             fetch_unread_messages()
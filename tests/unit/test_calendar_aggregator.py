@@ -1,10 +1,15 @@
 import datetime
+import threading
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 
+from app.models import EventCache
 from app.services.calendar_aggregator import (
-    CalendarAggregator, Event, HebcalAPI, HijriCalendarAPI, InadiutoriumAPI, LaunchLibraryAPI,
-    NobelPrizeSchedule, USNOAstronomicalEventsAPI, format_event,
+    CalendarAggregator, Event, HebcalAPI, HijriCalendarAPI, InadiutoriumAPI, LaunchLibraryAPI, LocalHebcalCalendar,
+    LocalHijriCalendar, LocalLiturgicalCalendar,
+    LocalAstronomicalEvents, NagerPublicHolidaysAPI, NobelPrizeSchedule, USNOAstronomicalEventsAPI, event_cache_row,
+    fetch_all, format_event,
 )
 
 pytestmark = pytest.mark.unit
@@ -41,11 +46,11 @@ def test_hijri_get_events_requests_month_then_year_in_url():
     api = HijriCalendarAPI()
     requested_urls = []
 
-    def fake_get(url, timeout=None):
+    def fake_get(url, timeout=None, cache=False):
         requested_urls.append(url)
         return _fake_response({"data": []})
 
-    with patch("app.services.calendar_aggregator.requests.get", side_effect=fake_get):
+    with patch("app.services.calendar_aggregator.http_client.get", side_effect=fake_get):
         api.get_events(year=2026)
 
     assert requested_urls[0].endswith("gToHCalendar/1/2026")
@@ -54,10 +59,10 @@ def test_hijri_get_events_requests_month_then_year_in_url():
 
 def test_hijri_get_events_for_month_passes_a_timeout():
     """A hanging upstream API must not be able to block the caller indefinitely --
-    every requests.get() call in this module needs an explicit timeout."""
+    every http_client.get() call in this module needs an explicit timeout."""
     api = HijriCalendarAPI()
 
-    with patch("app.services.calendar_aggregator.requests.get",
+    with patch("app.services.calendar_aggregator.http_client.get",
                return_value=_fake_response({"data": []})) as mock_get:
         api.get_events_for_month(1, 2026)
 
@@ -82,7 +87,7 @@ def test_hebcal_get_events_parses_items_and_passes_timeout():
     ]}
     api = HebcalAPI()
 
-    with patch("app.services.calendar_aggregator.requests.get",
+    with patch("app.services.calendar_aggregator.http_client.get",
                return_value=_fake_response(payload)) as mock_get:
         events = api.get_events(year=2026)
 
@@ -93,7 +98,7 @@ def test_hebcal_get_events_parses_items_and_passes_timeout():
 def test_hebcal_get_events_handles_missing_items_key():
     api = HebcalAPI()
 
-    with patch("app.services.calendar_aggregator.requests.get", return_value=_fake_response({})):
+    with patch("app.services.calendar_aggregator.http_client.get", return_value=_fake_response({})):
         events = api.get_events(year=2026)
 
     assert events == []
@@ -151,9 +156,49 @@ def test_format_event_produces_expected_shape():
         'description': 'a note',
         'location': 'US',
         'sources': ['Hebcal'],
+        'details': None,
     }
 
 
+def test_event_cache_row_matches_the_formatted_round_trip_without_strings():
+    event = Event(name="Launch", date=datetime.datetime(2026, 7, 30, 14, 5, 59, 123,
+                                                        tzinfo=datetime.timezone.utc),
+                  source="Launch Library", country="US", notes=[{"launchYear": 1990}])
+
+    row = event_cache_row(event)
+
+    assert row == {
+        'title': 'Launch',
+        'date': datetime.datetime(2026, 7, 30, 14, 5),
+        'description': None,
+        'location': 'US',
+        'source': 'Launch Library',
+        'year': 2026,
+        'details': [{'launchYear': 1990}],
+    }
+    round_trip = EventCache.from_event_dict(format_event(event))
+    assert (round_trip.title, round_trip.date, round_trip.description, round_trip.location,
+            round_trip.source, round_trip.year, round_trip.details) == tuple(row.values())
+
+
+def test_structured_notes_go_to_details_and_text_notes_to_description():
+    event = Event(name="Ramadan", date=datetime.datetime(2026, 2, 18), source="Hijri",
+                  notes=[{"hijri": {"day": "01"}}, "first sighting", {"public": True}])
+
+    row = event_cache_row(event)
+
+    assert row['description'] == 'first sighting'
+    assert row['details'] == [{"hijri": {"day": "01"}}, {"public": True}]
+
+
+def test_events_are_slotted():
+    event = Event(name="Test Event", date=datetime.datetime(2026, 1, 1))
+
+    assert not hasattr(event, '__dict__')
+    with pytest.raises(AttributeError):
+        event.unexpected = True
+
+
 def test_nobel_prize_schedule_uses_curated_dates_for_a_listed_year():
     schedule = NobelPrizeSchedule()
 
@@ -244,7 +289,7 @@ def test_from_usno_moon_phase_api_parses_phase_and_date():
 def test_usno_get_events_aggregates_all_three_endpoints_and_passes_timeout():
     api = USNOAstronomicalEventsAPI()
 
-    def fake_get(url, params=None, timeout=None):
+    def fake_get(url, params=None, timeout=None, cache=False):
         assert timeout is not None
         if url.endswith('/seasons'):
             return _fake_response({"data": [
@@ -260,7 +305,7 @@ def test_usno_get_events_aggregates_all_three_endpoints_and_passes_timeout():
             ]})
         raise AssertionError(f"Unexpected URL: {url}")
 
-    with patch("app.services.calendar_aggregator.requests.get", side_effect=fake_get):
+    with patch("app.services.calendar_aggregator.http_client.get", side_effect=fake_get):
         events = api.get_events(year=2026)
 
     assert {e.name for e in events} == {"Equinox", "Annular Solar Eclipse", "Full Moon"}
@@ -311,7 +356,7 @@ def test_launch_library_get_events_requests_upcoming_with_a_large_limit_and_time
     under budget."""
     api = LaunchLibraryAPI()
 
-    with patch("app.services.calendar_aggregator.requests.get",
+    with patch("app.services.calendar_aggregator.http_client.get",
                return_value=_fake_response({"results": []})) as mock_get:
         api.get_events(year=2026)
 
@@ -336,3 +381,267 @@ def test_calendar_aggregator_merges_launch_library_into_get_events():
         aggregator.get_events(2026)
 
     mock_get_events.assert_called_once()
+
+
+def test_fetch_all_returns_results_in_call_order_regardless_of_finish_order():
+    def slow():
+        time.sleep(0.05)
+        return "slow"
+
+    assert fetch_all([slow, lambda: "fast"], max_workers=2) == ["slow", "fast"]
+
+
+def test_fetch_all_reraises_the_first_failing_call():
+    def boom():
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        fetch_all([lambda: 1, boom], max_workers=2)
+
+
+def test_nager_get_events_fetches_countries_concurrently_when_given_workers():
+    """With max_workers > 1 every per-country request must be in flight at
+    the same time -- the barrier below only releases once all three fake
+    requests are waiting on it, so a serial loop would time out instead."""
+    api = NagerPublicHolidaysAPI()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_get(url, timeout=None, cache=False):
+        barrier.wait()
+        country = url.rsplit("/", 1)[-1]
+        return _fake_response([{
+            "name": f"Holiday {country}", "date": "2026-05-01", "fixed": True,
+            "countryCode": country, "localName": f"Holiday {country}",
+        }])
+
+    with patch("app.services.calendar_aggregator.http_client.get", side_effect=fake_get):
+        events = api.get_events(["US", "DE", "GB"], 2026, max_workers=3)
+
+    assert [e.name for e in events] == ["Holiday US", "Holiday DE", "Holiday GB"]
+
+
+def test_nager_request_slots_cap_in_flight_requests_across_calls():
+    api = NagerPublicHolidaysAPI()
+    api._request_slots = threading.BoundedSemaphore(2)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def fake_get(url, timeout=None, cache=False):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+        return _fake_response([])
+
+    with patch("app.services.calendar_aggregator.http_client.get", side_effect=fake_get):
+        api.get_events(["US", "DE", "GB", "CA", "RU"], 2026, max_workers=5)
+
+    assert in_flight["max"] <= 2
+
+
+def test_calendar_aggregator_get_events_for_years_fetches_launch_library_once_and_sorts_across_years():
+    aggregator = CalendarAggregator(max_workers=4)
+
+    def fake_public_holidays(country_codes, year, max_workers=1):
+        return [Event(name="New Year's Day", date=datetime.datetime(year, 1, 1),
+                      source="Nager Public Holidays API", country="US")]
+
+    with patch.object(aggregator.public_holidays_api, 'get_events', side_effect=fake_public_holidays), \
+         patch.object(aggregator.hijri_calendar_api, 'get_events', return_value=[]) as mock_hijri, \
+         patch.object(aggregator.launch_library_api, 'get_events', return_value=[]) as mock_launches:
+        events = aggregator.get_events_for_years([2027, 2026])
+
+    mock_launches.assert_called_once()
+    assert mock_hijri.call_count == 2
+    assert [e.date.year for e in events] == [2026, 2027]
+
+
+def test_local_hebcal_calendar_computes_events_without_network():
+    api = LocalHebcalCalendar()
+
+    with patch("app.services.calendar_aggregator.http_client.get") as mock_get:
+        events = [event for year in range(2026, 2036) for event in api.get_events(year)]
+
+    mock_get.assert_not_called()
+    assert all(event.sources == ["Hebcal"] for event in events)
+    rosh_hashana = next(e for e in events if e.name == "Rosh Hashana 5787")
+    assert rosh_hashana.date == datetime.datetime(2026, 9, 12)
+    assert "ראש השנה" in rosh_hashana.other_names
+
+
+def test_calendar_aggregator_uses_local_hebrew_engine_unless_configured_remote(monkeypatch):
+    import app.services.calendar_aggregator as calendar_aggregator_module
+
+    assert isinstance(CalendarAggregator().hebcal_api, LocalHebcalCalendar)
+
+    monkeypatch.setattr(calendar_aggregator_module.config, 'HEBREW_CALENDAR_ENGINE', 'remote')
+    assert type(CalendarAggregator().hebcal_api) is HebcalAPI
+
+
+def test_local_hebcal_cross_check_reports_only_disagreeing_dates():
+    api = LocalHebcalCalendar()
+    remote_events = [
+        Event(name="Yom Kippur", date=datetime.datetime(2026, 9, 21), source="Hebcal"),
+        Event(name="Purim", date=datetime.datetime(2026, 3, 4), source="Hebcal"),
+        Event(name="Shabbat Shekalim", date=datetime.datetime(2026, 2, 14), source="Hebcal"),
+    ]
+
+    with patch.object(api, 'get_remote_events', return_value=remote_events):
+        mismatches = api.cross_check(2026)
+
+    assert mismatches == [("Purim", datetime.datetime(2026, 3, 3), datetime.datetime(2026, 3, 4))]
+
+
+def test_local_astronomical_events_compute_usno_shaped_events_without_network():
+    api = LocalAstronomicalEvents()
+
+    with patch("app.services.calendar_aggregator.http_client.get") as mock_get:
+        events = api.get_events(2026)
+
+    mock_get.assert_not_called()
+    assert all(event.sources == ["USNO"] for event in events)
+    names = {event.name for event in events}
+    assert {"Equinox", "Solstice", "Perihelion", "Aphelion", "Total Solar Eclipse", "Full Moon"} <= names
+
+
+def test_local_astronomical_events_batch_matches_per_year_results():
+    api = LocalAstronomicalEvents()
+
+    batch = api.get_events_for_years(range(2026, 2029))
+
+    assert [str(e) for e in batch[2027]] == [str(e) for e in api.get_events(2027)]
+
+
+def test_calendar_aggregator_uses_local_astronomy_engine_unless_configured_remote(monkeypatch):
+    import app.services.calendar_aggregator as calendar_aggregator_module
+
+    assert isinstance(CalendarAggregator().usno_astronomical_events_api, LocalAstronomicalEvents)
+
+    monkeypatch.setattr(calendar_aggregator_module.config, 'ASTRONOMY_ENGINE', 'remote')
+    assert type(CalendarAggregator().usno_astronomical_events_api) is USNOAstronomicalEventsAPI
+
+
+def test_local_astronomical_cross_check_reports_events_only_one_side_has():
+    api = LocalAstronomicalEvents()
+    local_events = [
+        Event(name="Equinox", date=datetime.datetime(2026, 3, 20), source="USNO"),
+        Event(name="New Moon", date=datetime.datetime(2026, 1, 18), source="USNO"),
+    ]
+    remote_events = [
+        Event(name="Equinox", date=datetime.datetime(2026, 3, 20), source="USNO"),
+        Event(name="New Moon", date=datetime.datetime(2026, 1, 19), source="USNO"),
+    ]
+
+    with patch.object(api, 'get_remote_events', return_value=remote_events):
+        mismatches = api.cross_check(2026, local_events)
+
+    assert mismatches == [("New Moon", datetime.date(2026, 1, 18)), ("New Moon", datetime.date(2026, 1, 19))]
+
+
+def test_local_liturgical_calendar_fills_a_year_without_network():
+    api = LocalLiturgicalCalendar()
+
+    with patch("app.services.calendar_aggregator.http_client.get") as mock_get:
+        events = api.get_events(2026)
+
+    mock_get.assert_not_called()
+    assert len(events) == 365
+    assert all(event.sources == ["Inadiutorium API"] for event in events)
+    easter = next(e for e in events if e.date == datetime.datetime(2026, 4, 5))
+    assert easter.name == "Easter Sunday of the Resurrection of the Lord"
+    assert {"season": "easter"} in easter.notes
+
+
+def test_calendar_aggregator_uses_local_liturgical_engine_unless_configured_remote(monkeypatch):
+    import app.services.calendar_aggregator as calendar_aggregator_module
+
+    assert isinstance(CalendarAggregator().inadiutorium_api, LocalLiturgicalCalendar)
+
+    monkeypatch.setattr(calendar_aggregator_module.config, 'LITURGICAL_CALENDAR_ENGINE', 'remote')
+    assert type(CalendarAggregator().inadiutorium_api) is InadiutoriumAPI
+
+
+def test_local_hijri_calendar_computes_a_year_without_network():
+    api = LocalHijriCalendar()
+
+    with patch("app.services.calendar_aggregator.http_client.get") as mock_get:
+        events = api.get_events(2026)
+
+    mock_get.assert_not_called()
+    assert all(event.sources == ["Hijri API"] for event in events)
+    eid = next(e for e in events if e.name == "Eid-ul-Adha")
+    assert eid.date == datetime.datetime(2026, 5, 27)
+    assert [e.name for e in api.get_events_for_month(3, 2026)] == ["Lailat-ul-Qadr", "Eid-ul-Fitr"]
+
+
+def test_calendar_aggregator_uses_local_hijri_engine_unless_configured_remote(monkeypatch):
+    import app.services.calendar_aggregator as calendar_aggregator_module
+
+    assert isinstance(CalendarAggregator().hijri_calendar_api, LocalHijriCalendar)
+
+    monkeypatch.setattr(calendar_aggregator_module.config, 'HIJRI_CALENDAR_ENGINE', 'remote')
+    assert type(CalendarAggregator().hijri_calendar_api) is HijriCalendarAPI
+
+
+def test_local_hijri_refresh_overrides_records_only_months_that_differ_from_tabular():
+    api = LocalHijriCalendar()
+
+    def fake_days(month, year):
+        if (month, year) == (2, 2026):
+            # Remote says Ramadan started a day after the tabular date,
+            # Sha'ban on the tabular date.
+            return [
+                {"hijri": {"day": "01", "month": {"number": 9}, "year": "1447"}, "gregorian": {"date": "19-02-2026"}},
+                {"hijri": {"day": "02", "month": {"number": 9}, "year": "1447"}, "gregorian": {"date": "20-02-2026"}},
+            ]
+        if (month, year) == (1, 2026):
+            return [{"hijri": {"day": "01", "month": {"number": 8}, "year": "1447"}, "gregorian": {"date": "2026-01-20"}}]
+        return []
+
+    with patch.object(api, 'get_days_for_month', side_effect=fake_days) as mock_days:
+        changes = api.refresh_overrides([2026])
+
+    assert mock_days.call_count == 12
+    assert changes == [(1447, 9, None, datetime.date(2026, 2, 19))]
+    ramadan = next(e for e in api.get_events(2026) if e.name == "1st Day of Ramadan")
+    assert ramadan.date == datetime.datetime(2026, 2, 19)
+
+    with patch.object(api, 'get_days_for_month', return_value=[
+        {"hijri": {"day": "01", "month": {"number": 9}, "year": "1447"}, "gregorian": {"date": "2026-02-18"}},
+    ]):
+        changes = api.refresh_overrides([2026])
+
+    assert changes == [(1447, 9, datetime.date(2026, 2, 19), None)]
+
+
+def test_merge_events_folds_same_holiday_across_countries_once():
+    new_year = datetime.datetime(2026, 1, 1)
+    events = []
+    index = {}
+    for country in ["US", "DE", "US"]:
+        Event.merge_events(events, [
+            Event(name="New Year's Day", date=new_year, source="Nager Public Holidays API", fixed=None,
+                  country=country, other_name=f"Neujahr {country}", notes=[{"launchYear": None}]),
+            Event(name=f"{country} Day", date=datetime.datetime(2026, 7, 4), country=country),
+        ], index)
+
+    assert [e.name for e in events] == ["New Year's Day", "US Day", "DE Day"]
+    assert events[0].countries == ["US", "DE"]
+    assert events[0].other_names == ["Neujahr US", "Neujahr DE"]
+    assert events[0].notes == [{"launchYear": None}]
+    assert events[1].countries == ["US"]
+
+
+def test_merge_events_matches_names_ignoring_case_and_whitespace_but_not_date():
+    events = [Event(name="Labour Day", date=datetime.datetime(2026, 5, 1), country="DE")]
+
+    Event.merge_events(events, [
+        Event(name="labour  day", date=datetime.datetime(2026, 5, 1), country="FR"),
+        Event(name="Labour Day", date=datetime.datetime(2026, 9, 7), country="CA"),
+    ])
+
+    assert len(events) == 2
+    assert events[0].countries == ["DE", "FR"]
+    assert events[1].countries == ["CA"]
@@ -0,0 +1,68 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.models import CalendarGeneration
+from app.services import calendar_generations, calendar_response_cache
+from app.utils.config import config
+
+pytestmark = pytest.mark.unit
+
+RANGE = (datetime(2026, 7, 1), datetime(2026, 8, 1))
+
+
+def _put(user_id, date_range=RANGE, body='[]'):
+    calendar_response_cache.put(user_id, date_range, calendar_response_cache.generations(user_id), body)
+
+
+def test_normalize_range_rounds_to_the_minutes_events_fall_on():
+    start, end = calendar_response_cache.normalize_range(
+        datetime(2026, 7, 1, 9, 30, 15, 250000, tzinfo=timezone.utc),
+        datetime(2026, 7, 8, 9, 30, 59, 999000, tzinfo=timezone.utc),
+    )
+
+    assert (start, end) == (datetime(2026, 7, 1, 9, 31), datetime(2026, 7, 8, 9, 30))
+    assert calendar_response_cache.normalize_range(datetime(2026, 7, 1, 9, 30), None) == \
+        (datetime(2026, 7, 1, 9, 30), None)
+
+
+def test_entries_answer_until_the_users_or_global_generation_moves(db_session):
+    _put(1, body='mine')
+    _put(2, body='theirs')
+    assert calendar_response_cache.get(1, RANGE) == 'mine'
+
+    calendar_generations.bump([1])
+    assert calendar_response_cache.get(1, RANGE) is None
+    assert calendar_response_cache.get(2, RANGE) == 'theirs'
+
+    calendar_generations.bump([calendar_generations.GLOBAL_VIEWER_ID])
+    assert calendar_response_cache.get(2, RANGE) is None
+    assert calendar_response_cache.stats() == {'size': 0, 'hits': 2, 'misses': 2}
+
+
+def test_generations_are_read_from_the_database_and_never_reused(db_session):
+    _put(1, body='mine')
+
+    # Another process's commit reaches us only through the table.
+    db_session.merge(CalendarGeneration(viewer_id=1, generation='elsewhere'))
+    db_session.flush()
+    assert calendar_response_cache.get(1, RANGE) is None
+
+    _put(1, body='mine')
+    nested = db_session.begin_nested()
+    calendar_generations.bump([1])
+    nested.rollback()
+    assert calendar_response_cache.get(1, RANGE) == 'mine'
+    calendar_generations.bump([1])
+    assert calendar_response_cache.get(1, RANGE) is None
+
+
+def test_least_recently_used_entries_are_evicted(db_session, monkeypatch):
+    monkeypatch.setattr(config, 'CALENDAR_RESPONSE_CACHE_SIZE', 2)
+    _put(1)
+    _put(2)
+    calendar_response_cache.get(1, RANGE)
+    _put(3)
+
+    assert calendar_response_cache.get(2, RANGE) is None
+    assert calendar_response_cache.get(1, RANGE) == '[]'
+    assert calendar_response_cache.get(3, RANGE) == '[]'
@@ -0,0 +1,126 @@
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from app.utils import http_client
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+from app.utils.rate_limit import RateLimitExceeded
+
+pytestmark = pytest.mark.unit
+
+URL = 'https://date.nager.at/api/v3/publicholidays/2026/US'
+
+
+def _response(status_code=200, body=b'[{"name": "New Year"}]'):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = URL
+    return response
+
+
+def _down():
+    raise requests.exceptions.ConnectTimeout('timed out')
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            breaker.call(_down)
+
+
+def test_opens_after_threshold_consecutive_failures_and_fails_fast():
+    breaker = CircuitBreaker('date.nager.at', failure_threshold=3, reset_seconds=300)
+    send = MagicMock(return_value=_response())
+
+    _fail(breaker, 2)
+    assert breaker.snapshot()['state'] == CLOSED
+    _fail(breaker, 1)
+
+    with pytest.raises(CircuitOpen):
+        breaker.call(send)
+    send.assert_not_called()
+    assert breaker.snapshot() == {'state': OPEN, 'consecutive_failures': 3, 'retry_in_seconds': 300}
+
+
+def test_success_resets_the_failure_run_and_server_errors_count_as_failures():
+    breaker = CircuitBreaker('date.nager.at', failure_threshold=2, reset_seconds=300)
+
+    _fail(breaker, 1)
+    breaker.call(lambda: _response())
+    _fail(breaker, 1)
+    assert breaker.snapshot()['state'] == CLOSED
+
+    assert breaker.call(lambda: _response(status_code=503)).status_code == 503
+    assert breaker.snapshot()['state'] == OPEN
+
+
+def test_half_open_trial_closes_on_success_and_reopens_on_failure(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('app.utils.circuit_breaker.time.monotonic', lambda: now[0])
+    breaker = CircuitBreaker('api.aladhan.com', failure_threshold=1, reset_seconds=60)
+
+    _fail(breaker, 1)
+    now[0] += 61
+    _fail(breaker, 1)  # the trial request
+    assert breaker.snapshot()['state'] == OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.call(_response)
+
+    now[0] += 61
+
+    def trial():
+        # Only one request goes out while half-open.
+        assert breaker.snapshot()['state'] == HALF_OPEN
+        with pytest.raises(CircuitOpen):
+            breaker.call(_response)
+        return _response()
+
+    breaker.call(trial)
+    assert breaker.snapshot() == {'state': CLOSED, 'consecutive_failures': 0}
+
+
+def test_rate_limited_requests_count_neither_way():
+    breaker = CircuitBreaker('ll.thespacedevs.com', failure_threshold=1, reset_seconds=60)
+
+    def over_budget():
+        raise RateLimitExceeded('over budget')
+
+    with pytest.raises(RateLimitExceeded):
+        breaker.call(over_budget)
+    assert breaker.snapshot() == {'state': CLOSED, 'consecutive_failures': 0}
+
+
+def test_open_host_serves_cached_copy_without_sending_and_shows_in_health_states(monkeypatch):
+    monkeypatch.setattr(http_client.config, 'HTTP_CACHE_ENABLED', True)
+    monkeypatch.setattr(http_client.config, 'HTTP_BREAKER_FAILURE_THRESHOLD', 2)
+    session = MagicMock()
+    session.request.return_value = _response()
+
+    with patch.object(http_client, '_session_for', return_value=session):
+        http_client.get(URL, cache=True)
+        session.request.side_effect = requests.exceptions.ConnectTimeout('timed out')
+        for _ in range(2):
+            assert http_client.get(URL, cache=True).json() == [{'name': 'New Year'}]
+        assert session.request.call_count == 3
+
+        assert http_client.get(URL, cache=True).json() == [{'name': 'New Year'}]
+        with pytest.raises(CircuitOpen):
+            http_client.get('https://date.nager.at/api/v3/publicholidays/2026/DE', cache=True)
+        assert session.request.call_count == 3
+
+    assert http_client.breaker_states()['date.nager.at']['state'] == OPEN
+
+
+def test_threshold_zero_disables_breakers(monkeypatch):
+    monkeypatch.setattr(http_client.config, 'HTTP_BREAKER_FAILURE_THRESHOLD', 0)
+    session = MagicMock()
+    session.request.side_effect = requests.exceptions.ConnectTimeout('timed out')
+
+    with patch.object(http_client, '_session_for', return_value=session):
+        for _ in range(5):
+            with pytest.raises(requests.exceptions.ConnectTimeout):
+                http_client.get(URL)
+
+    assert session.request.call_count == 5
+    assert http_client.breaker_states() == {}
@@ -1,8 +1,10 @@
 import pytest
 from datetime import datetime
 
+from app.models import UserCalendarDescriptor
+import app.services.custom_calendar_service as custom_calendar_service
 from app.services.custom_calendar_service import (
-    parse_descriptor, expand_entries_for_year, DescriptorValidationError,
+    parse_descriptor, expand_entries_for_year, descriptor_entries, DescriptorValidationError,
     MAX_ENTRIES, MAX_RAW_YAML_BYTES,
 )
 
@@ -381,3 +383,25 @@ def test_expand_entries_for_year_seasonal_defaults_missing_day_key_to_one():
                 'description': None, 'location': None, 'year': None}]  # no 'day' key
 
     assert expand_entries_for_year(entries, 2026)[0]['date'] == datetime(2026, 10, 1)
+
+
+def test_descriptor_entries_are_parsed_once_per_yaml_and_version(app, monkeypatch):
+    raw_yaml = 'events:\n  - {title: Picnic, recurrence: annual, month: 6, day: 5}\n'
+    calls = []
+    real_parse = custom_calendar_service.parse_descriptor
+    monkeypatch.setattr(custom_calendar_service, 'parse_descriptor',
+                        lambda raw: calls.append(raw) or real_parse(raw))
+    descriptor = UserCalendarDescriptor(user_id=1, raw_yaml=raw_yaml)
+
+    with app.app_context():
+        first = descriptor_entries(descriptor)
+        assert descriptor_entries(descriptor) == first
+        assert len(calls) == 1
+
+        descriptor.raw_yaml = raw_yaml.replace('day: 5', 'day: 6')
+        assert descriptor_entries(descriptor)[0]['day'] == 6
+        assert len(calls) == 2
+
+        monkeypatch.setattr(custom_calendar_service, 'PARSED_ENTRIES_VERSION', 2)
+        descriptor_entries(descriptor)
+        assert len(calls) == 3
@@ -0,0 +1,26 @@
+import pytest
+from datetime import date, datetime
+
+from app.utils.ancient_egyptian_calendar import EPOCH, format_ancient_egyptian_date, to_ancient_egyptian_date
+from app.utils.date_annotations import annotations_for
+
+pytestmark = pytest.mark.unit
+
+
+def test_annotations_match_the_calendar_conversions():
+    day = date(2026, 3, 14)
+
+    assert dict(annotations_for(day)) == {
+        'ancient_egyptian_date': format_ancient_egyptian_date(to_ancient_egyptian_date(day)),
+    }
+    assert annotations_for(EPOCH)['ancient_egyptian_date'] == '1 Thoth (Akhet)'
+
+
+def test_annotations_are_computed_once_per_day():
+    morning = annotations_for(datetime(2026, 3, 14, 8, 30))
+
+    assert annotations_for(datetime(2026, 3, 14, 21, 0)) is morning
+    assert annotations_for(date(2026, 3, 14)) is morning
+    assert annotations_for(date(2026, 3, 15)) is not morning
+    with pytest.raises(TypeError):
+        morning['ancient_egyptian_date'] = 'changed'
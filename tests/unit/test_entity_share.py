@@ -0,0 +1,94 @@
+import pytest
+
+from app.models import Entity, EntityShare, User, db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def other_user(db_session):
+    user = User(username='other_user', email='other@example.com')
+    user.set_password('password')
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _share_rows(entity):
+    return {share.user_id for share in EntityShare.query.filter_by(entity_id=entity.id)}
+
+
+def _visible_ids(user_id):
+    return {entity.id for entity in Entity.query.filter(Entity.shared_with_user(user_id))}
+
+
+def test_share_with_and_unshare_with_keep_entity_share_in_step(test_user, other_user, db_session):
+    place = Entity(name='Bakery', user_id=test_user.id, is_public=False)
+    db_session.add(place)
+    db_session.commit()
+
+    assert place.share_with(other_user.id) is True
+    assert place.share_with(other_user.id) is False
+    db_session.commit()
+    db_session.expire_all()
+
+    assert place.shared_with == [other_user.id]
+    assert _share_rows(place) == {other_user.id}
+    assert _visible_ids(other_user.id) == {place.id}
+
+    assert place.unshare_with(other_user.id) is True
+    db_session.commit()
+    db_session.expire_all()
+
+    assert place.shared_with == []
+    assert _share_rows(place) == set()
+    assert _visible_ids(other_user.id) == set()
+
+
+def test_shared_with_passed_to_the_constructor_is_mirrored(test_user, other_user, db_session):
+    place = Entity(name='Library', user_id=other_user.id, is_public=False, shared_with=[test_user.id])
+    db_session.add(place)
+    db_session.commit()
+
+    assert _share_rows(place) == {test_user.id}
+    assert _visible_ids(test_user.id) == {place.id}
+    assert _visible_ids(other_user.id) == set()
+
+
+def test_deleting_an_entity_removes_its_share_rows(test_user, other_user, db_session):
+    place = Entity(name='Library', user_id=other_user.id, shared_with=[test_user.id])
+    db_session.add(place)
+    db_session.commit()
+
+    db_session.delete(place)
+    db_session.commit()
+
+    assert EntityShare.query.count() == 0
+
+
+def test_visibility_lookup_uses_the_entity_share_index(test_user, db_session):
+    query = Entity.query.filter(db.or_(Entity.user_id == test_user.id, Entity.shared_with_user(test_user.id)))
+    statement = query.statement.compile(db.engine)
+
+    plan = [row[3] for row in db.session.connection().exec_driver_sql(
+        'EXPLAIN QUERY PLAN ' + str(statement), tuple(statement.params[name] for name in statement.positiontup)
+    )]
+
+    assert not any(step.startswith('SCAN entity') for step in plan), plan
+    assert any('ix_entity_share_user_entity' in step for step in plan), plan
+
+
+def test_entity_shared_with_several_users_is_visible_to_each(test_user, other_user, db_session):
+    """The JSON contains() lookup this replaced compiled to a LIKE on the
+    literal text "[<id>]" under SQLite, so it missed any entity shared with
+    more than one user."""
+    third_user = User(username='third_user', email='third@example.com')
+    db_session.add(third_user)
+    db_session.commit()
+    place = Entity(name='Gym', user_id=third_user.id, is_public=False,
+                   shared_with=[test_user.id, other_user.id])
+    db_session.add(place)
+    db_session.commit()
+
+    assert _visible_ids(test_user.id) == {place.id}
+    assert _visible_ids(other_user.id) == {place.id}
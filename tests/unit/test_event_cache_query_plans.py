@@ -0,0 +1,144 @@
+"""Query-plan regression suite for the hot EventCache queries.
+
+Each test runs a real code path that reads or writes EventCache, captures
+every statement it sends that touches the event_cache or visible_event
+tables, and runs EXPLAIN QUERY PLAN on it with the same parameters. A plan
+step that scans either without an index ("SCAN event_cache") fails the
+test -- the cache holds years of multi-source rows, so any of these
+regressing to a full table scan is what made the dashboard calendar
+endpoint slow.
+"""
+import re
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import event
+
+from app.models import Entity, EventCache, User, db
+from app.services.custom_calendar_service import regenerate_event_cache_for_user
+from app.services.default_event_service import regenerate_event_cache_for_user_default_events
+from app.services.entity_calendar_service import regenerate_event_cache_for_entity
+from app.services.integration_service import integration_service
+from app.tasks.background_tasks import backfill_computed_calendar_events, update_event_cache
+
+pytestmark = pytest.mark.unit
+
+FULL_SCAN = re.compile(r'^SCAN (event_cache|visible_event)\b')
+TABLES = re.compile(r'\b(event_cache|visible_event)\b')
+
+
+@contextmanager
+def _captured_event_cache_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # Plain INSERT ... VALUES has no plan worth checking; INSERT ...
+        # SELECT (the VisibleEvent projection) does.
+        is_insert = statement.lstrip().upper().startswith('INSERT')
+        if not executemany and TABLES.search(statement) and not (is_insert and 'SELECT' not in statement.upper()):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def _query_plans(statements):
+    connection = db.session.connection()
+    return [
+        (statement, [row[3] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)])
+        for statement, parameters in statements
+    ]
+
+
+def _assert_no_full_scans(statements):
+    assert statements, 'captured no EventCache statements -- the code path under test changed'
+    for statement, plan in _query_plans(statements):
+        full_scans = [step for step in plan if FULL_SCAN.match(step)]
+        assert not full_scans, f'{statement}\n-> {plan}'
+
+
+@pytest.fixture
+def entity(db_session, test_user):
+    entity = Entity(name='Library', user_id=test_user.id)
+    db_session.add(entity)
+    db_session.commit()
+    return entity
+
+
+def test_get_calendar_events_uses_indexes(app, test_user, entity, db_session):
+    with _captured_event_cache_statements() as statements:
+        integration_service.get_calendar_events(
+            start_date=datetime(2026, 1, 1), end_date=datetime(2026, 2, 1), user=test_user
+        )
+
+    _assert_no_full_scans(statements)
+
+
+def test_calendar_event_pages_use_indexes(app, test_user, db_session):
+    with _captured_event_cache_statements() as statements:
+        list(integration_service.iter_calendar_events(
+            start_date=datetime(2026, 1, 1), end_date=datetime(2026, 2, 1), user=test_user,
+            after=(datetime(2026, 1, 10), 42), limit=50,
+        ))
+
+    _assert_no_full_scans(statements)
+
+
+def test_custom_calendar_sync_uses_indexes(app, test_user, db_session):
+    entries = [{'title': 'Picnic', 'recurrence': 'annual', 'month': 5, 'day': 1, 'description': None}]
+    regenerate_event_cache_for_user(test_user.id, entries, years=[2026])
+
+    with _captured_event_cache_statements() as statements:
+        regenerate_event_cache_for_user(test_user.id, [], years=[2026])
+
+    _assert_no_full_scans(statements)
+
+
+def test_default_event_sync_uses_indexes(app, test_user, db_session):
+    with _captured_event_cache_statements() as statements:
+        regenerate_event_cache_for_user_default_events(test_user.id, [], years=[2026])
+
+    _assert_no_full_scans(statements)
+
+
+def test_entity_calendar_sync_uses_indexes(app, entity, db_session):
+    with _captured_event_cache_statements() as statements:
+        regenerate_event_cache_for_entity(entity, years=[2026])
+
+    _assert_no_full_scans(statements)
+
+
+def test_update_event_cache_global_sync_uses_indexes(app, db_session):
+    with patch.object(integration_service, 'fetch_live_calendar_events', return_value=[]), \
+         _captured_event_cache_statements() as statements:
+        update_event_cache(app)
+
+    _assert_no_full_scans(statements)
+
+
+def test_backfill_year_lookup_and_sync_use_indexes(app, db_session):
+    source = MagicMock()
+    source.get_events.return_value = []
+    with patch('app.tasks.background_tasks._computed_calendar_sources', return_value={'Hebcal': source}), \
+         _captured_event_cache_statements() as statements:
+        backfill_computed_calendar_events(app)
+
+    _assert_no_full_scans(statements)
+
+
+def test_sharing_an_entity_reprojects_with_indexes(app, test_user, entity, db_session):
+    db_session.add(EventCache(title='Closed', date=datetime(2026, 5, 1), year=2026, entity_id=entity.id))
+    other = User(username='neighbour', email='neighbour@example.com')
+    db_session.add(other)
+    db_session.commit()
+
+    with _captured_event_cache_statements() as statements:
+        entity.share_with(other.id)
+        db_session.commit()
+
+    _assert_no_full_scans(statements)
@@ -0,0 +1,131 @@
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.models import EventCache, db
+from app.services.event_cache_sync import apply_event_cache_sync, plan_event_cache_sync, sync_event_cache
+
+pytestmark = pytest.mark.unit
+
+SOURCE = 'Custom Calendar'
+
+
+def _row(title, day, description=None, user_id=None):
+    return {
+        'title': title, 'date': datetime(2026, 5, day), 'description': description, 'location': None,
+        'source': SOURCE, 'year': 2026, 'user_id': user_id,
+    }
+
+
+def _scope(user_id):
+    return EventCache.query.filter_by(user_id=user_id, source=SOURCE, year=2026)
+
+
+@contextmanager
+def _count_writes():
+    writes = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(' ', 1)[0].upper() in ('INSERT', 'UPDATE', 'DELETE'):
+            writes.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield writes
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def test_first_sync_inserts_every_row_with_its_hash(test_user, db_session):
+    result = sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, user_id=test_user.id),
+                                                     _row('Concert', 2, user_id=test_user.id)])
+    db.session.commit()
+
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (2, 0, 0, 0)
+    assert all(row.content_hash for row in _scope(test_user.id))
+
+
+def test_steady_state_sync_issues_no_writes(test_user, db_session):
+    rows = [_row('Picnic', 1, user_id=test_user.id), _row('Concert', 2, user_id=test_user.id)]
+    sync_event_cache(_scope(test_user.id), rows)
+    db.session.commit()
+
+    with _count_writes() as writes:
+        result = sync_event_cache(_scope(test_user.id), rows)
+        db.session.commit()
+
+    assert writes == []
+    assert result.unchanged == 2
+    assert not result.changed
+
+
+def test_changed_content_updates_in_place_and_keeps_the_row_id(test_user, db_session):
+    sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, user_id=test_user.id),
+                                            _row('Concert', 2, user_id=test_user.id)])
+    db.session.commit()
+    ids = {row.title: row.id for row in _scope(test_user.id)}
+
+    result = sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, 'Bring blankets', user_id=test_user.id),
+                                                     _row('Dinner', 3, user_id=test_user.id)])
+    db.session.commit()
+
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (1, 1, 1, 0)
+    rows = {row.title: row for row in _scope(test_user.id)}
+    assert set(rows) == {'Picnic', 'Dinner'}
+    assert rows['Picnic'].id == ids['Picnic']
+    assert rows['Picnic'].description == 'Bring blankets'
+
+
+def test_rows_outside_the_scope_are_left_alone(test_user, db_session):
+    db.session.add(EventCache(title='Holiday', date=datetime(2026, 5, 1), source='Nager Public Holidays API', year=2026))
+    db.session.commit()
+
+    sync_event_cache(_scope(test_user.id), [])
+    db.session.commit()
+
+    assert EventCache.query.filter_by(title='Holiday').count() == 1
+
+
+def test_duplicate_occurrences_are_kept_as_separate_rows(test_user, db_session):
+    rows = [_row('Picnic', 1, user_id=test_user.id), _row('Picnic', 1, user_id=test_user.id)]
+    sync_event_cache(_scope(test_user.id), rows)
+    db.session.commit()
+
+    result = sync_event_cache(_scope(test_user.id), rows)
+
+    assert result.unchanged == 2
+    assert _scope(test_user.id).count() == 2
+
+
+def test_rows_without_a_stored_hash_are_rewritten_once(test_user, db_session):
+    db.session.add(EventCache(title='Picnic', date=datetime(2026, 5, 1), source=SOURCE, year=2026, user_id=test_user.id))
+    db.session.commit()
+    legacy_id = _scope(test_user.id).one().id
+
+    first = sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, user_id=test_user.id)])
+    db.session.commit()
+    second = sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, user_id=test_user.id)])
+
+    assert first.updated == 1
+    assert second.unchanged == 1
+    assert _scope(test_user.id).one().id == legacy_id
+
+
+def test_planning_only_reads_and_applying_writes_the_plan(test_user, db_session):
+    sync_event_cache(_scope(test_user.id), [_row('Picnic', 1, user_id=test_user.id)])
+    db.session.commit()
+
+    with _count_writes() as writes:
+        plan = plan_event_cache_sync(_scope(test_user.id), [_row('Picnic', 1, 'Bring bread', user_id=test_user.id),
+                                                            _row('Concert', 2, user_id=test_user.id)])
+    assert writes == []
+    assert (plan.result.inserted, plan.result.updated) == (1, 1)
+
+    with _count_writes() as writes:
+        assert apply_event_cache_sync(plan) is plan.result
+        db.session.commit()
+    assert writes
+    assert sorted((row.title, row.description) for row in _scope(test_user.id)) == \
+        [('Concert', None), ('Picnic', 'Bring bread')]
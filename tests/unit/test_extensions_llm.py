@@ -1,4 +1,3 @@
-import json
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -7,9 +6,11 @@ from extensions.llm import LLM, LLMResult
 pytestmark = pytest.mark.unit
 
 
-def _fake_urlopen_response(payload):
+def _fake_http_response(payload):
     mock_response = MagicMock()
-    mock_response.read.return_value = json.dumps(payload).encode('utf-8')
+    mock_response.status_code = 200
+    mock_response.json.return_value = payload
+    mock_response.raise_for_status.return_value = None
     return mock_response
 
 
@@ -41,12 +42,11 @@ def test_generate_response_posts_to_configured_ollama_base_url(monkeypatch):
     llm = LLM(model_name='test-model')
     payload = {'response': 'ok', 'done': True}
 
-    with patch.object(llm_module.request, 'urlopen',
-                       return_value=_fake_urlopen_response(payload)) as mock_urlopen:
+    with patch.object(llm_module.http_client, 'post',
+                       return_value=_fake_http_response(payload)) as mock_post:
         llm.generate_response('hello')
 
-    request_obj = mock_urlopen.call_args.args[0]
-    assert request_obj.full_url == 'http://ollama.example.com:11434/api/generate'
+    assert mock_post.call_args.args[0] == 'http://ollama.example.com:11434/api/generate'
 
 
 def test_generate_response_sends_configured_num_ctx(monkeypatch):
@@ -60,12 +60,11 @@ def test_generate_response_sends_configured_num_ctx(monkeypatch):
     llm = LLM(model_name='test-model')
     payload = {'response': 'ok', 'done': True}
 
-    with patch.object(llm_module.request, 'urlopen',
-                       return_value=_fake_urlopen_response(payload)) as mock_urlopen:
+    with patch.object(llm_module.http_client, 'post',
+                       return_value=_fake_http_response(payload)) as mock_post:
         llm.generate_response('hello')
 
-    request_obj = mock_urlopen.call_args.args[0]
-    sent_body = json.loads(request_obj.data.decode('utf-8'))
+    sent_body = mock_post.call_args.kwargs['json']
     assert sent_body['options']['num_ctx'] == 16384
 
 
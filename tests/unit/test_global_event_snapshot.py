@@ -0,0 +1,108 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.models import EventCache, db
+from app.services import calendar_generations, global_event_snapshot
+from app.services.event_cache_sync import sync_event_cache
+from app.services.integration_service import integration_service
+
+pytestmark = pytest.mark.unit
+
+
+def _global_row(title, date):
+    return {'title': title, 'date': date, 'source': 'Nager', 'year': date.year}
+
+
+def _sync_global(rows, year=2026):
+    sync_event_cache(EventCache.query.filter_by(year=year, user_id=None, entity_id=None), rows)
+
+
+def _titles(user, start=datetime(2026, 1, 1), end=None):
+    return [event['title'] for event in integration_service.get_calendar_events(
+        start_date=start, end_date=end, user=user
+    )]
+
+
+def test_between_is_inclusive_and_resumes_after_a_key():
+    keys = ((datetime(2026, 1, 1), 7), (datetime(2026, 2, 1), 3), (datetime(2026, 2, 1), 5), (datetime(2026, 3, 1), 1))
+    snapshot = global_event_snapshot.GlobalEventSnapshot(0, keys, ('a', 'b', 'c', 'd'))
+
+    def events(*args):
+        return [event for _, event in snapshot.between(*args)]
+
+    assert events(datetime(2026, 2, 1), datetime(2026, 3, 1)) == ['b', 'c', 'd']
+    assert events(datetime(2026, 1, 2)) == ['b', 'c', 'd']
+    assert events(datetime(2026, 3, 2)) == []
+    assert events(datetime(2026, 1, 1), None, (datetime(2026, 2, 1), 3)) == ['c', 'd']
+    assert events(datetime(2026, 1, 1), datetime(2026, 2, 1), (datetime(2026, 2, 1), 5)) == []
+
+
+def test_global_and_own_events_are_merged_by_date(test_user, db_session):
+    _sync_global([_global_row('New Year', datetime(2026, 1, 1)), _global_row('May Day', datetime(2026, 5, 1))])
+    db_session.add(EventCache(title='Birthday', date=datetime(2026, 3, 1), year=2026, user_id=test_user.id))
+    db_session.commit()
+
+    assert _titles(test_user) == ['New Year', 'Birthday', 'May Day']
+    assert _titles(test_user, start=datetime(2026, 2, 1), end=datetime(2026, 4, 1)) == ['Birthday']
+
+
+def test_snapshot_is_reused_until_a_global_write_commits(test_user, db_session):
+    _sync_global([_global_row('New Year', datetime(2026, 1, 1))])
+    db_session.commit()
+    snapshot = global_event_snapshot.get_snapshot()
+
+    # Per-user writes leave the global snapshot alone.
+    db_session.add(EventCache(title='Birthday', date=datetime(2026, 3, 1), year=2026, user_id=test_user.id))
+    db_session.commit()
+    assert global_event_snapshot.get_snapshot() is snapshot
+
+    # A global write bumps the generation only once it commits.
+    _sync_global([_global_row('New Year', datetime(2026, 1, 1)), _global_row('May Day', datetime(2026, 5, 1))])
+    assert global_event_snapshot.get_snapshot() is snapshot
+    db_session.commit()
+    assert global_event_snapshot.get_snapshot() is not snapshot
+    assert _titles(test_user) == ['New Year', 'Birthday', 'May Day']
+
+
+def test_orm_writes_of_global_rows_bump_the_generation(test_user, db_session):
+    assert _titles(test_user) == []
+    generation = calendar_generations.current_global()
+
+    holiday = EventCache(title='Holiday', date=datetime(2026, 7, 4), year=2026)
+    db_session.add(holiday)
+    db_session.commit()
+    assert calendar_generations.current_global() != generation
+    assert _titles(test_user) == ['Holiday']
+
+    db_session.delete(holiday)
+    db_session.commit()
+    assert _titles(test_user) == []
+
+
+def test_returned_events_are_copies_of_the_snapshot(test_user, db_session):
+    _sync_global([_global_row('New Year', datetime(2026, 1, 1))])
+    db_session.commit()
+
+    integration_service.get_calendar_events(start_date=datetime(2026, 1, 1), user=test_user)[0]['title'] = 'Changed'
+
+    assert _titles(test_user) == ['New Year']
+
+
+def test_timezone_aware_ranges_are_compared_as_naive(test_user, db_session):
+    _sync_global([_global_row('New Year', datetime(2026, 1, 1))])
+    db_session.commit()
+
+    assert _titles(test_user, start=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                   end=datetime(2026, 2, 1, tzinfo=timezone.utc)) == ['New Year']
+
+
+def test_details_are_deferred_and_only_loaded_when_selected(test_user, db_session):
+    db_session.add(EventCache(title='Eclipse', date=datetime(2026, 8, 12), year=2026,
+                              details=[{'magnitude': 1.04}]))
+    db_session.commit()
+
+    assert 'details' not in db.inspect(EventCache.query.one()).dict
+    events = integration_service.get_calendar_events(
+        start_date=datetime(2026, 1, 1), user=test_user, fields=('title', 'details')
+    )
+    assert events == [{'title': 'Eclipse', 'details': [{'magnitude': 1.04}]}]
@@ -0,0 +1,89 @@
+import pytest
+from datetime import date
+
+from app.utils.hebrew_calendar import (
+    days_in_year, holidays_for_gregorian_year, is_leap_year, new_year, to_gregorian,
+    ADAR, ADAR_II, NISAN, TISHREI,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _dates_by_title(gregorian_year):
+    return {item['title']: item['date'] for item in holidays_for_gregorian_year(gregorian_year)}
+
+
+@pytest.mark.parametrize('hebrew_year, expected', [
+    (5785, date(2024, 10, 3)),
+    (5786, date(2025, 9, 23)),
+    (5787, date(2026, 9, 12)),
+    (5760, date(1999, 9, 11)),
+])
+def test_rosh_hashana_matches_known_dates(hebrew_year, expected):
+    assert date.fromordinal(new_year(hebrew_year)) == expected
+
+
+def test_leap_years_follow_the_metonic_cycle():
+    leap_positions = {year % 19 for year in range(5700, 5719) if is_leap_year(year)}
+
+    assert leap_positions == {0, 3, 6, 8, 11, 14, 17}
+
+
+def test_year_lengths_are_always_legal():
+    for hebrew_year in range(5600, 6000):
+        assert days_in_year(hebrew_year) in (353, 354, 355, 383, 384, 385)
+
+
+def test_rosh_hashana_never_falls_on_sunday_wednesday_or_friday():
+    for hebrew_year in range(5600, 6000):
+        assert date.fromordinal(new_year(hebrew_year)).weekday() not in (6, 2, 4)
+
+
+def test_purim_is_in_adar_ii_during_a_leap_year():
+    assert to_gregorian(5784, ADAR_II, 14) == date(2024, 3, 24)
+    assert _dates_by_title(2024)['Purim'] == '2024-03-24'
+    assert _dates_by_title(2024)['Purim Katan'] == to_gregorian(5784, ADAR, 14).isoformat()
+
+
+def test_known_2026_holidays():
+    by_title = _dates_by_title(2026)
+
+    assert by_title['Purim'] == '2026-03-03'
+    assert by_title['Pesach I'] == '2026-04-02'
+    assert by_title['Shavuot I'] == '2026-05-22'
+    assert by_title["Tish'a B'Av"] == '2026-07-23'
+    assert by_title['Rosh Hashana 5787'] == '2026-09-12'
+    assert by_title['Yom Kippur'] == '2026-09-21'
+    assert by_title['Chanukah: 1 Candle'] == '2026-12-04'
+    assert by_title["Yom HaAtzma'ut"] == '2026-04-22'
+
+
+def test_fast_falling_on_shabbat_is_postponed_to_sunday():
+    """9 Av 5782 fell on Saturday, August 6, 2022."""
+    assert to_gregorian(5782, 5, 9) == date(2022, 8, 6)
+    assert _dates_by_title(2022)["Tish'a B'Av"] == '2022-08-07'
+
+
+def test_yom_hazikaron_moves_off_sunday():
+    """4 Iyyar 5784 was a Sunday, so Yom HaZikaron moved to Monday and
+    Yom HaAtzma'ut to Tuesday."""
+    by_title = _dates_by_title(2024)
+
+    assert by_title['Yom HaZikaron'] == '2024-05-13'
+    assert by_title["Yom HaAtzma'ut"] == '2024-05-14'
+
+
+def test_gregorian_year_includes_both_hebrew_years_and_nothing_outside_it():
+    items = holidays_for_gregorian_year(2026)
+
+    assert all(item['date'].startswith('2026-') for item in items)
+    assert [item['date'] for item in items] == sorted(item['date'] for item in items)
+    titles = {item['title'] for item in items}
+    assert 'Pesach I' in titles  # 5786
+    assert 'Rosh Hashana 5787' in titles  # 5787
+
+
+def test_pesach_starts_on_fifteenth_of_nisan():
+    assert _dates_by_title(2026)['Pesach I'] == to_gregorian(5786, NISAN, 15).isoformat()
+    assert _dates_by_title(2026)['Erev Rosh Hashana'] == date.fromordinal(new_year(5787) - 1).isoformat()
+    assert to_gregorian(5787, TISHREI, 1) == date(2026, 9, 12)
@@ -0,0 +1,76 @@
+import pytest
+from datetime import date
+
+from app.utils import hijri_calendar
+from app.utils.hijri_calendar import (
+    DHU_AL_HIJJAH, MUHARRAM, RAMADAN, SHAWWAL,
+    gregorian_to_hijri, holidays_for_gregorian_year, is_leap_year, load_overrides, save_overrides,
+    tabular_from_fixed, tabular_to_fixed,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _dates_by_holiday(gregorian_year, overrides=None):
+    items = holidays_for_gregorian_year(gregorian_year, overrides={} if overrides is None else overrides)
+    return {item['hijri']['holidays'][0]: item['gregorian']['date'] for item in items}
+
+
+@pytest.mark.parametrize('hijri_date, expected', [
+    ((1, MUHARRAM, 1), date(622, 7, 19)),
+    ((1447, RAMADAN, 1), date(2026, 2, 18)),
+    ((1447, SHAWWAL, 1), date(2026, 3, 20)),
+    ((1447, DHU_AL_HIJJAH, 10), date(2026, 5, 27)),
+    ((1448, MUHARRAM, 1), date(2026, 6, 17)),
+])
+def test_tabular_dates_match_known_conversions(hijri_date, expected):
+    assert date.fromordinal(tabular_to_fixed(*hijri_date)) == expected
+
+
+def test_tabular_conversion_round_trips():
+    start = date(2020, 1, 1).toordinal()
+    for fixed in range(start, start + 3 * 365):
+        assert tabular_to_fixed(*tabular_from_fixed(fixed)) == fixed
+
+
+def test_leap_years_follow_the_thirty_year_cycle():
+    leap_positions = {year % 30 for year in range(1440, 1470) if is_leap_year(year)}
+
+    assert leap_positions == {2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29}
+
+
+def test_holidays_for_a_year_come_out_in_aladhan_day_shape():
+    items = holidays_for_gregorian_year(2026, overrides={})
+
+    eid = next(item for item in items if item['hijri']['holidays'] == ['Eid-ul-Fitr'])
+    assert eid['gregorian']['date'] == '2026-03-20'
+    assert eid['hijri']['date'] == '01-10-1447'
+    assert eid['hijri']['month']['number'] == SHAWWAL
+    assert [item['gregorian']['date'] for item in items] == sorted(item['gregorian']['date'] for item in items)
+    assert [item['hijri']['holidays'][0] for item in items].count('Days of Tashriq') == 3
+
+
+def test_override_moves_the_whole_month_and_its_holidays():
+    overrides = {(1447, SHAWWAL): date(2026, 3, 19).toordinal()}
+
+    dates = _dates_by_holiday(2026, overrides)
+
+    assert dates['Eid-ul-Fitr'] == '2026-03-19'
+    # Ramadan just ends a day early (29 days), its own dates are unaffected.
+    assert dates['Lailat-ul-Qadr'] == '2026-03-16'
+    assert gregorian_to_hijri(date(2026, 3, 18), overrides) == (1447, RAMADAN, 29)
+    assert gregorian_to_hijri(date(2026, 3, 19), overrides) == (1447, SHAWWAL, 1)
+
+
+def test_overrides_round_trip_through_the_data_dir_and_apply_by_default():
+    save_overrides({(1447, RAMADAN): date(2026, 2, 19).toordinal()})
+
+    assert hijri_calendar.get_overrides_path().exists()
+    assert load_overrides() == {(1447, RAMADAN): date(2026, 2, 19).toordinal()}
+    first_of_ramadan = next(item for item in holidays_for_gregorian_year(2026)
+                            if item['hijri']['holidays'] == ['1st Day of Ramadan'])
+    assert first_of_ramadan['gregorian']['date'] == '2026-02-19'
+
+
+def test_missing_override_file_means_no_overrides():
+    assert load_overrides() == {}
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from app.services.calendar_aggregator import fetch_all
+from app.utils import http_cache
+
+pytestmark = pytest.mark.unit
+
+URL = 'https://date.nager.at/api/v3/publicholidays/2026/US'
+
+
+def _response(status_code=200, body=b'[{"name": "New Year"}]', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = URL
+    response.headers.update({'Content-Type': 'application/json', **(headers or {})})
+    return response
+
+
+def test_first_fetch_stores_body_and_validators():
+    send = MagicMock(return_value=_response(headers={'ETag': '"v1"'}))
+
+    http_cache.cached_get(send, URL)
+
+    entry = http_cache.load(http_cache.cache_key(URL))
+    assert entry.body == b'[{"name": "New Year"}]'
+    assert entry.headers['ETag'] == '"v1"'
+
+
+def test_revalidates_with_stored_etag_and_last_modified_and_serves_304_from_disk():
+    http_cache.cached_get(MagicMock(return_value=_response(
+        headers={'ETag': '"v1"', 'Last-Modified': 'Thu, 01 Jan 2026 00:00:00 GMT'})), URL)
+    send = MagicMock(return_value=_response(status_code=304, body=b''))
+
+    response = http_cache.cached_get(send, URL)
+
+    sent_headers = send.call_args.kwargs['headers']
+    assert sent_headers['If-None-Match'] == '"v1"'
+    assert sent_headers['If-Modified-Since'] == 'Thu, 01 Jan 2026 00:00:00 GMT'
+    assert response.status_code == 200
+    assert response.json() == [{'name': 'New Year'}]
+
+
+def test_serves_stale_copy_when_upstream_is_down():
+    http_cache.cached_get(MagicMock(return_value=_response()), URL)
+
+    down = MagicMock(side_effect=requests.exceptions.ConnectionError('unreachable'))
+    assert http_cache.cached_get(down, URL).json() == [{'name': 'New Year'}]
+
+    erroring = MagicMock(return_value=_response(status_code=503, body=b'Service Unavailable'))
+    assert http_cache.cached_get(erroring, URL).json() == [{'name': 'New Year'}]
+
+
+def test_stale_copies_are_marked_and_noted_but_revalidated_ones_are_not():
+    http_cache.cached_get(MagicMock(return_value=_response()), URL)
+    down = MagicMock(side_effect=requests.exceptions.ConnectionError('unreachable'))
+    not_modified = MagicMock(return_value=_response(status_code=304, body=b''))
+
+    with http_cache.noting_stale() as stale_urls:
+        assert not http_cache.is_stale(http_cache.cached_get(not_modified, URL))
+        assert stale_urls == []
+        with http_cache.request_scope():
+            fetch_all([lambda: http_cache.cached_get(down, URL)] * 2, max_workers=2)
+
+    # Both callers of the memoized response are told it's stale.
+    assert stale_urls == [URL, URL]
+
+
+def test_upstream_failure_without_a_cached_copy_still_raises():
+    down = MagicMock(side_effect=requests.exceptions.ConnectionError('unreachable'))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_cache.cached_get(down, URL)
+
+
+def test_params_and_equivalent_query_string_share_one_key():
+    url = 'https://aa.usno.navy.mil/api/seasons'
+    assert http_cache.cache_key(url, params={'year': 2026}) == http_cache.cache_key(f'{url}?year=2026')
+    assert http_cache.cache_key(url, params={'year': 2026}) != http_cache.cache_key(url, params={'year': 2027})
+
+
+def test_request_scope_sends_identical_requests_once():
+    send = MagicMock(return_value=_response())
+
+    with http_cache.request_scope():
+        http_cache.cached_get(send, URL)
+        http_cache.cached_get(send, URL)
+
+    assert send.call_count == 1
+
+
+def test_request_scope_memo_does_not_outlive_the_scope():
+    send = MagicMock(return_value=_response())
+
+    with http_cache.request_scope():
+        http_cache.cached_get(send, URL)
+    http_cache.cached_get(send, URL)
+
+    assert send.call_count == 2
+
+
+def test_request_scope_covers_fetch_all_workers_but_not_other_threads():
+    send = MagicMock(return_value=_response())
+
+    with http_cache.request_scope():
+        fetch_all([lambda: http_cache.cached_get(send, URL)] * 4, max_workers=4)
+        assert send.call_count == 1
+
+        outside = threading.Thread(target=http_cache.cached_get, args=(send, URL))
+        outside.start()
+        outside.join()
+        assert send.call_count == 2
+
+
+def test_prune_deletes_only_entries_unused_past_max_age():
+    old_url = 'https://date.nager.at/api/v3/publicholidays/2020/US'
+    http_cache.cached_get(MagicMock(return_value=_response()), URL)
+    http_cache.cached_get(MagicMock(return_value=_response()), old_url)
+    cache_dir = http_cache.get_cache_dir()
+    month_ago = time.time() - 31 * 24 * 3600
+    os.utime(cache_dir / f'{http_cache.cache_key(old_url)}.json', (month_ago, month_ago))
+
+    assert http_cache.prune(cache_dir, 30 * 24 * 3600) == 1
+
+    assert http_cache.load(http_cache.cache_key(old_url)) is None
+    assert not (cache_dir / f'{http_cache.cache_key(old_url)}.body').exists()
+    assert http_cache.load(http_cache.cache_key(URL)) is not None
+
+
+def test_loading_an_entry_keeps_it_from_being_pruned():
+    http_cache.cached_get(MagicMock(return_value=_response()), URL)
+    cache_dir = http_cache.get_cache_dir()
+    month_ago = time.time() - 31 * 24 * 3600
+    os.utime(cache_dir / f'{http_cache.cache_key(URL)}.json', (month_ago, month_ago))
+
+    http_cache.cached_get(MagicMock(return_value=_response(status_code=304, body=b'')), URL)
+
+    assert http_cache.prune(cache_dir, 30 * 24 * 3600) == 0
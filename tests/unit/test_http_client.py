@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.utils import http_client
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    http_client.close_all()
+    http_client._host_overrides.clear()
+    yield
+    http_client.close_all()
+    http_client._host_overrides.clear()
+
+
+def test_same_host_reuses_one_pooled_session():
+    first = http_client._session_for('api.aladhan.com')
+    second = http_client._session_for('api.aladhan.com')
+
+    assert first is second
+
+
+def test_different_hosts_get_separate_sessions():
+    assert http_client._session_for('api.aladhan.com') is not http_client._session_for('www.hebcal.com')
+
+
+def test_host_settings_override_pool_size_and_keep_config_defaults(monkeypatch):
+    monkeypatch.setattr(http_client.config, 'HTTP_DEFAULT_TIMEOUT_SECONDS', 7)
+
+    settings = http_client._resolve_settings('api.aladhan.com')
+
+    assert settings.pool_maxsize == 12
+    assert settings.timeout == 7
+
+
+def test_request_defaults_timeout_from_host_settings():
+    session = MagicMock()
+    with patch.object(http_client, '_session_for', return_value=session):
+        http_client.get('https://calapi.inadiutorium.cz/api/v0/en/calendars/default/2026/1')
+
+    assert session.request.call_args.kwargs['timeout'] == 30
+
+
+def test_explicit_timeout_wins_over_host_default():
+    session = MagicMock()
+    with patch.object(http_client, '_session_for', return_value=session):
+        http_client.get('https://calapi.inadiutorium.cz/api/v0/en/calendars/default/2026/1', timeout=3)
+
+    assert session.request.call_args.kwargs['timeout'] == 3
+
+
+def test_configure_host_replaces_existing_session():
+    before = http_client._session_for('mustermeister.example.com')
+
+    http_client.configure_host('mustermeister.example.com', timeout=2, pool_maxsize=1)
+
+    after = http_client._session_for('mustermeister.example.com')
+    assert after is not before
+    assert http_client._resolve_settings('mustermeister.example.com').timeout == 2
+
+
+def test_retries_cover_idempotent_methods_only():
+    """Ollama's /api/generate is a POST -- re-sending it on a 503 would
+    silently run a second (expensive) generation."""
+    adapter = http_client._session_for('localhost:11434').get_adapter('http://localhost:11434/')
+
+    assert adapter.max_retries.is_retry('GET', 503)
+    assert not adapter.max_retries.is_retry('POST', 503)
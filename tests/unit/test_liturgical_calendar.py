@@ -0,0 +1,102 @@
+import pytest
+from datetime import date
+
+from app.utils.liturgical_calendar import days_for_year, easter_sunday, first_sunday_of_advent
+
+pytestmark = pytest.mark.unit
+
+
+def _days_by_date(year):
+    return {day['date']: day for day in days_for_year(year)}
+
+
+def _title(days, iso_date):
+    return days[iso_date]['celebrations'][0]['title']
+
+
+@pytest.mark.parametrize('year, expected', [
+    (2008, date(2008, 3, 23)),
+    (2019, date(2019, 4, 21)),
+    (2024, date(2024, 3, 31)),
+    (2025, date(2025, 4, 20)),
+    (2026, date(2026, 4, 5)),
+    (2038, date(2038, 4, 25)),
+])
+def test_easter_computus_matches_known_dates(year, expected):
+    assert easter_sunday(year) == expected
+
+
+def test_first_sunday_of_advent():
+    assert first_sunday_of_advent(2026) == date(2026, 11, 29)
+    assert first_sunday_of_advent(2023) == date(2023, 12, 3)  # Christmas on a Monday
+
+
+def test_every_day_of_the_year_has_one_entry_in_inadiutorium_shape():
+    days = days_for_year(2024)
+
+    assert len(days) == 366
+    for day in days:
+        assert set(day) >= {'date', 'season', 'season_week', 'celebrations'}
+        assert day['celebrations']
+        assert set(day['celebrations'][0]) == {'title', 'colour', 'rank', 'rank_num'}
+
+
+def test_2026_movable_feasts_and_seasons():
+    days = _days_by_date(2026)
+
+    assert _title(days, '2026-02-18') == 'Ash Wednesday'
+    assert days['2026-02-18']['season'] == 'lent'
+    assert days['2026-04-03']['season'] == 'triduum'
+    assert _title(days, '2026-04-05') == 'Easter Sunday of the Resurrection of the Lord'
+    assert _title(days, '2026-05-14') == 'Ascension of the Lord'
+    assert _title(days, '2026-05-24') == 'Pentecost Sunday'
+    assert _title(days, '2026-11-22') == 'Our Lord Jesus Christ, King of the Universe'
+    assert days['2026-11-22']['season_week'] == 34
+    assert days['2026-11-29']['season'] == 'advent'
+
+
+def test_ordinary_time_weeks_count_on_both_sides_of_easter():
+    days = _days_by_date(2026)
+
+    assert _title(days, '2026-01-12') == 'Monday, 1st week in Ordinary Time'
+    assert _title(days, '2026-01-18') == '2nd Sunday in Ordinary Time'
+    assert days['2026-05-26']['season'] == 'ordinary'
+    assert days['2026-05-26']['season_week'] == 8
+
+
+def test_obligatory_memorial_replaces_ordinary_weekday():
+    days = _days_by_date(2026)
+
+    celebration = days['2026-01-28']['celebrations'][0]
+    assert celebration['title'] == 'Saint Thomas Aquinas, priest and doctor'
+    assert celebration['rank'] == 'memorial'
+
+
+def test_sunday_outranks_feast_but_not_feast_of_the_lord():
+    days = _days_by_date(2026)
+
+    # Feb 22, 2026 is the 1st Sunday of Lent -- the Chair of Peter is omitted.
+    assert _title(days, '2026-02-22') == '1st Sunday of Lent'
+    # Sep 14, 2025 was a Sunday in Ordinary Time -- the Exaltation replaces it.
+    assert _title(_days_by_date(2025), '2025-09-14') == 'Exaltation of the Holy Cross'
+
+
+def test_impeded_solemnities_are_transferred():
+    days_2024 = _days_by_date(2024)
+    # Annunciation fell on Monday of Holy Week -> Monday after the Easter octave.
+    assert _title(days_2024, '2024-03-25') == 'Monday of Holy Week'
+    assert _title(days_2024, '2024-04-08') == 'Annunciation of the Lord'
+    # Immaculate Conception fell on the 2nd Sunday of Advent -> Monday.
+    assert _title(days_2024, '2024-12-09') == 'Immaculate Conception of the Blessed Virgin Mary'
+
+    # St Joseph in Holy Week is anticipated to the Saturday before Palm Sunday.
+    assert _title(_days_by_date(2008), '2008-03-15') == 'Saint Joseph, Spouse of the Blessed Virgin Mary'
+
+
+def test_memorial_in_lent_survives_as_secondary_celebration():
+    days = _days_by_date(2026)
+
+    celebrations = days['2026-03-07']['celebrations']  # Saturday, 2nd week of Lent
+    assert celebrations[0]['title'] == 'Saturday, 2nd week of Lent'
+    assert celebrations[1]['title'] == 'Saints Perpetua and Felicity, martyrs'
+    assert celebrations[1]['rank'] == 'optional memorial'
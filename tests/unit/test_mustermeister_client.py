@@ -37,7 +37,7 @@ def test_fetch_open_tasks_sends_bearer_auth_header_and_timeout(monkeypatch):
     _configure(monkeypatch)
     empty_payload = {'priorities': {}, 'returned_count': 0, 'total_matching_count': 0, 'limit': 500}
 
-    with patch.object(mustermeister_client.requests, 'get',
+    with patch.object(mustermeister_client.http_client, 'get',
                        return_value=_fake_response(empty_payload)) as mock_get:
         fetch_open_tasks()
 
@@ -52,7 +52,7 @@ def test_fetch_open_tasks_requests_all_four_priorities_and_limit(monkeypatch):
     _configure(monkeypatch)
     empty_payload = {'priorities': {}, 'returned_count': 0, 'total_matching_count': 0, 'limit': 500}
 
-    with patch.object(mustermeister_client.requests, 'get',
+    with patch.object(mustermeister_client.http_client, 'get',
                        return_value=_fake_response(empty_payload)) as mock_get:
         fetch_open_tasks()
 
@@ -109,7 +109,7 @@ def test_fetch_open_tasks_flattens_nested_priorities_statuses_projects_shape(mon
         'returned_count': 2, 'total_matching_count': 2, 'limit': 500,
     }
 
-    with patch.object(mustermeister_client.requests, 'get', return_value=_fake_response(payload)):
+    with patch.object(mustermeister_client.http_client, 'get', return_value=_fake_response(payload)):
         tasks = fetch_open_tasks()
 
     by_external_id = {t['external_id']: t for t in tasks}
@@ -127,7 +127,7 @@ def test_fetch_open_tasks_flattens_nested_priorities_statuses_projects_shape(mon
 
 def test_fetch_open_tasks_raises_on_401(monkeypatch):
     _configure(monkeypatch)
-    with patch.object(mustermeister_client.requests, 'get',
+    with patch.object(mustermeister_client.http_client, 'get',
                        return_value=_fake_response({'error': 'Unauthorized'}, status_code=401)):
         with pytest.raises(MustermeisterClientError):
             fetch_open_tasks()
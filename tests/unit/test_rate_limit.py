@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from app.utils import http_client
+from app.utils.rate_limit import HostRateLimiter, RateLimit, RateLimitExceeded
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    http_client.close_all()
+    http_client._host_overrides.clear()
+    yield
+    http_client.close_all()
+    http_client._host_overrides.clear()
+
+
+def test_bucket_allows_its_budget_then_refuses_past_max_wait():
+    limiter = HostRateLimiter('example.com', RateLimit(max_requests=2, window_seconds=3600))
+
+    for _ in range(2):
+        with limiter.acquire(max_wait=0):
+            pass
+    with pytest.raises(RateLimitExceeded):
+        with limiter.acquire(max_wait=60):
+            pass
+
+
+def test_queued_requests_wait_for_their_turn():
+    limiter = HostRateLimiter('example.com', RateLimit(max_requests=2, window_seconds=0.2))
+    started = time.monotonic()
+
+    for _ in range(3):
+        with limiter.acquire(max_wait=1):
+            pass
+
+    # The third request waited for a token to refill (0.1s).
+    assert time.monotonic() - started >= 0.09
+
+
+def test_min_interval_spaces_request_starts():
+    limiter = HostRateLimiter('example.com', RateLimit(min_interval=0.05))
+    starts = []
+
+    for _ in range(3):
+        with limiter.acquire(max_wait=1):
+            starts.append(time.monotonic())
+
+    assert all(later - earlier >= 0.045 for earlier, later in zip(starts, starts[1:]))
+
+
+def test_max_concurrency_caps_requests_in_flight():
+    limiter = HostRateLimiter('example.com', RateLimit(max_concurrency=1))
+    release = threading.Event()
+    holding = threading.Event()
+
+    def hold():
+        with limiter.acquire(max_wait=1):
+            holding.set()
+            release.wait(1)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait(1)
+    try:
+        with pytest.raises(RateLimitExceeded):
+            with limiter.acquire(max_wait=0.01):
+                pass
+    finally:
+        release.set()
+        thread.join()
+    with limiter.acquire(max_wait=0):
+        pass
+
+
+def test_request_refused_for_concurrency_leaves_the_budget_untouched():
+    limiter = HostRateLimiter('example.com', RateLimit(max_requests=2, window_seconds=3600, max_concurrency=1))
+    release = threading.Event()
+    holding = threading.Event()
+
+    def hold():
+        with limiter.acquire(max_wait=1):
+            holding.set()
+            release.wait(1)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait(1)
+    try:
+        with pytest.raises(RateLimitExceeded):
+            with limiter.acquire(max_wait=0.01):
+                pass
+    finally:
+        release.set()
+        thread.join()
+    # The refused request never went out, so its token is still there.
+    with limiter.acquire(max_wait=0):
+        pass
+
+
+def test_over_budget_cached_get_serves_the_stored_copy(monkeypatch):
+    monkeypatch.setattr(http_client.config, 'HTTP_RATE_LIMIT_MAX_WAIT_SECONDS', 0)
+    monkeypatch.setattr(http_client.config, 'HTTP_CACHE_ENABLED', True)
+    http_client.configure_host('limited.example.com', rate_limit=RateLimit(max_requests=1, window_seconds=3600))
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"results": []}'
+    response.url = 'https://limited.example.com/launches'
+    session = MagicMock()
+    session.request.return_value = response
+
+    with patch.object(http_client, '_session_for', return_value=session):
+        assert http_client.get('https://limited.example.com/launches', cache=True).json() == {'results': []}
+        assert http_client.get('https://limited.example.com/launches', cache=True).json() == {'results': []}
+        with pytest.raises(RateLimitExceeded):
+            http_client.get('https://limited.example.com/launches')
+
+    assert session.request.call_count == 1
+
+
+def test_per_call_rate_limit_applies_to_hosts_without_one_configured(monkeypatch):
+    monkeypatch.setattr(http_client.config, 'HTTP_RATE_LIMIT_MAX_WAIT_SECONDS', 0)
+    budget = RateLimit(max_requests=1, window_seconds=3600)
+    session = MagicMock()
+
+    with patch.object(http_client, '_session_for', return_value=session):
+        http_client.get('https://mustermeister.example.com/api/tools/x', rate_limit=budget)
+        with pytest.raises(RateLimitExceeded):
+            http_client.get('https://mustermeister.example.com/api/tools/x', rate_limit=budget)
+        http_client.get('https://other.example.com/', rate_limit=budget)
+
+    assert session.request.call_count == 2
+    assert 'rate_limit' not in session.request.call_args.kwargs
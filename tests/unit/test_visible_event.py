@@ -0,0 +1,155 @@
+import pytest
+from datetime import datetime
+
+from app.models import Entity, EventCache, User, VisibleEvent, db
+from app.models.visible_event import GLOBAL_VIEWER_ID
+from app.services import calendar_generations
+from app.services.custom_calendar_service import delete_event_cache_for_user, regenerate_event_cache_for_user
+from app.services.entity_calendar_service import delete_event_cache_for_entity, regenerate_event_cache_for_entity
+from app.services.event_cache_sync import sync_event_cache
+from app.services.integration_service import integration_service
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def other_user(db_session):
+    user = User(username='other_user', email='other@example.com')
+    user.set_password('password')
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _expected_event_ids(user):
+    """EventCache ids `user` may see, derived straight from EventCache and
+    entity sharing -- what get_calendar_events queried before the
+    projection existed."""
+    visible_entity_ids = db.select(Entity.id).where(db.or_(
+        Entity.user_id == user.id, Entity.shared_with_user(user.id)
+    ))
+    return {row.id for row in EventCache.query.filter(db.or_(
+        db.and_(EventCache.user_id.is_(None), EventCache.entity_id.is_(None)),
+        EventCache.user_id == user.id,
+        EventCache.entity_id.in_(visible_entity_ids),
+    ))}
+
+
+def _projected_event_ids(user):
+    events = integration_service.get_calendar_events(start_date=datetime(2000, 1, 1), user=user)
+    ids = [event['id'] for event in events]
+    assert len(ids) == len(set(ids))
+    return set(ids)
+
+
+def _assert_projection_matches(*users):
+    for user in users:
+        assert _projected_event_ids(user) == _expected_event_ids(user)
+
+
+def _entity_entries():
+    return [{'title': 'Closed for inventory', 'recurrence': 'annual', 'month': 3, 'day': 2, 'description': None}]
+
+
+def test_orm_writes_keep_projection_in_step(test_user, other_user, db_session):
+    holiday = EventCache(title='Holiday', date=datetime(2026, 1, 1), year=2026)
+    birthday = EventCache(title='Birthday', date=datetime(2026, 2, 1), year=2026, user_id=test_user.id)
+    db_session.add_all([holiday, birthday])
+    db_session.commit()
+    _assert_projection_matches(test_user, other_user)
+    assert VisibleEvent.query.filter_by(event_id=holiday.id).one().viewer_id == GLOBAL_VIEWER_ID
+
+    birthday.title = 'Birthday party'
+    db_session.commit()
+    assert [event['title'] for event in integration_service.get_calendar_events(
+        start_date=datetime(2026, 1, 15), user=test_user
+    )] == ['Birthday party']
+
+    db_session.delete(birthday)
+    db_session.commit()
+    _assert_projection_matches(test_user, other_user)
+    assert VisibleEvent.query.filter_by(event_id=birthday.id).count() == 0
+
+
+def test_sharing_changes_keep_projection_in_step(test_user, other_user, db_session):
+    place = Entity(name='Library', user_id=other_user.id, calendar_entries=_entity_entries())
+    db_session.add(place)
+    db_session.commit()
+    regenerate_event_cache_for_entity(place, years=[2026])
+    _assert_projection_matches(test_user, other_user)
+    assert _projected_event_ids(test_user) == set()
+
+    place.share_with(test_user.id)
+    db_session.commit()
+    _assert_projection_matches(test_user, other_user)
+    assert _projected_event_ids(test_user)
+
+    place.unshare_with(test_user.id)
+    db_session.commit()
+    _assert_projection_matches(test_user, other_user)
+    assert _projected_event_ids(test_user) == set()
+
+
+def test_owner_changes_keep_projection_in_step(test_user, other_user, db_session):
+    place = Entity(name='Workshop', user_id=other_user.id, calendar_entries=_entity_entries())
+    db_session.add(place)
+    db_session.commit()
+    regenerate_event_cache_for_entity(place, years=[2026])
+    assert _projected_event_ids(other_user)
+    new_owner_generation = calendar_generations.current(test_user.id)
+    old_owner_generation = calendar_generations.current(other_user.id)
+
+    place.user_id = test_user.id
+    db_session.commit()
+
+    _assert_projection_matches(test_user, other_user)
+    assert _projected_event_ids(other_user) == set()
+    assert _projected_event_ids(test_user)
+    assert calendar_generations.current(test_user.id) != new_owner_generation
+    assert calendar_generations.current(other_user.id) != old_owner_generation
+
+
+def test_bulk_sync_and_delete_keep_projection_in_step(test_user, other_user, db_session):
+    place = Entity(name='Bakery', user_id=test_user.id, shared_with=[other_user.id],
+                   calendar_entries=_entity_entries())
+    db_session.add(place)
+    db_session.commit()
+
+    regenerate_event_cache_for_entity(place, years=[2026, 2027])
+    regenerate_event_cache_for_user(test_user.id, [
+        {'title': 'Anniversary', 'recurrence': 'annual', 'month': 6, 'day': 5, 'description': 'Dinner'},
+    ], years=[2026])
+    sync_event_cache(EventCache.query.filter_by(year=2026, user_id=None, entity_id=None), [
+        {'title': 'Holiday', 'date': datetime(2026, 7, 4), 'source': 'Nager', 'year': 2026},
+    ])
+    db_session.commit()
+    _assert_projection_matches(test_user, other_user)
+
+    # An in-place update carries the new content into the projection.
+    regenerate_event_cache_for_user(test_user.id, [
+        {'title': 'Anniversary', 'recurrence': 'annual', 'month': 6, 'day': 5, 'description': 'Picnic'},
+    ], years=[2026])
+    assert VisibleEvent.query.filter_by(viewer_id=test_user.id, title='Anniversary').one().description == 'Picnic'
+
+    delete_event_cache_for_user(test_user.id)
+    _assert_projection_matches(test_user, other_user)
+    delete_event_cache_for_entity(place.id)
+    _assert_projection_matches(test_user, other_user)
+    assert VisibleEvent.query.filter(VisibleEvent.viewer_id != GLOBAL_VIEWER_ID).count() == 0
+
+
+def test_rebuild_reproduces_incremental_projection(test_user, other_user, db_session):
+    place = Entity(name='Pool', user_id=test_user.id, shared_with=[other_user.id], calendar_entries=_entity_entries())
+    db_session.add(place)
+    db_session.add(EventCache(title='Holiday', date=datetime(2026, 1, 1), year=2026))
+    db_session.commit()
+    regenerate_event_cache_for_entity(place, years=[2026])
+
+    def snapshot():
+        return sorted((row.viewer_id, row.event_id, row.title) for row in VisibleEvent.query)
+
+    incremental = snapshot()
+    VisibleEvent.rebuild(db.session.connection())
+    db_session.commit()
+
+    assert snapshot() == incremental